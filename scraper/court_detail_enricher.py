@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+from period_index import add_period_fields
+
+class CourtDetailEnricher:
+    """테니스장 상세 페이지를 시설 단위로 캐시하며 누락된 정보를 채웁니다."""
+
+    # 상세 페이지의 항목명 → 코트 데이터 필드
+    FIELD_LABELS = {
+        'address': ['주소', '장소', '위치'],
+        'phone': ['문의전화', '전화번호', '연락처'],
+        'reservation_period': ['접수기간'],
+        'use_period': ['이용기간'],
+        'target': ['이용대상'],
+    }
+
+    # 수동 데이터에서 임시로 넣어둔 값은 비어 있는 것으로 취급
+    PLACEHOLDER_VALUES = {'', '02-120', '제한없음'}
+
+    def __init__(self, session, cache_file='seoul_tennis_detail_cache.json', max_workers=4):
+        self.session = session
+        self.cache_file = cache_file
+        self.max_workers = max_workers
+        self.cache = self.load_cache()
+
+    def load_cache(self):
+        """시설별 상세 페이지 캐시를 읽어옵니다."""
+        if not os.path.exists(self.cache_file):
+            return {}
+        with open(self.cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_cache(self):
+        """시설별 상세 페이지 캐시를 저장합니다."""
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f, ensure_ascii=False, indent=2)
+        print(f"상세 페이지 캐시 저장 완료: {self.cache_file}")
+
+    def facility_key(self, court):
+        """코트 번호·시간대를 제외한 시설 키를 만듭니다."""
+        name = court.get('facility_name') or court.get('name', '')
+        name = re.sub(r'\([^)]*\)', '', name)
+        name = re.sub(r'\d+번\s*(코트)?', '', name)
+        name = re.sub(r'주간|야간|주말|공휴일|평일', '', name)
+        name = re.sub(r'[\s\-_/,·]+', '', name)
+        return f"{name}_{court.get('region', '')}"
+
+    def listing_fingerprint(self, courts):
+        """시설에 속한 목록 항목들의 해시를 계산합니다."""
+        entries = sorted(
+            json.dumps({
+                'name': court.get('name') or court.get('facility_name', ''),
+                'detail_url': court.get('detail_url', ''),
+                'detail_text': court.get('detail_text', ''),
+            }, ensure_ascii=False, sort_keys=True)
+            for court in courts
+        )
+        return hashlib.sha1("\n".join(entries).encode('utf-8')).hexdigest()
+
+    def group_by_facility(self, courts):
+        """코트 목록을 시설별로 묶습니다."""
+        facilities = {}
+        for court in courts:
+            facilities.setdefault(self.facility_key(court), []).append(court)
+        return facilities
+
+    def fetch_detail(self, url):
+        """상세 페이지를 가져와 항목을 추출합니다."""
+        response = self.session.get(url, timeout=30)
+        response.raise_for_status()
+        return self.parse_detail_page(response.content)
+
+    def parse_detail_page(self, content):
+        """상세 페이지 HTML에서 항목명/값 쌍을 추출합니다."""
+        soup = BeautifulSoup(content, 'html.parser')
+
+        pairs = []
+        for label in soup.find_all(['th', 'dt']):
+            value = label.find_next_sibling(['td', 'dd'])
+            if value:
+                pairs.append((label.get_text(strip=True), value.get_text(" ", strip=True)))
+
+        fields = {}
+        for field, labels in self.FIELD_LABELS.items():
+            for label_text, value_text in pairs:
+                if value_text and any(label in label_text for label in labels):
+                    fields[field] = value_text
+                    break
+        return fields
+
+    def enrich(self, courts):
+        """변경된 시설의 상세 페이지만 동시에 가져와 코트 정보를 보완합니다."""
+        print("\n=== 상세 페이지 정보 보완 ===")
+        facilities = self.group_by_facility(courts)
+
+        # 목록이 바뀌었거나 캐시에 없는 시설만 다시 가져오기
+        stale = {}
+        for key, facility_courts in facilities.items():
+            detail_url = next((c['detail_url'] for c in facility_courts if c.get('detail_url')), "")
+            if not detail_url:
+                continue
+            fingerprint = self.listing_fingerprint(facility_courts)
+            cached = self.cache.get(key)
+            if cached and cached.get('listing_hash') == fingerprint:
+                continue
+            stale[key] = (detail_url, fingerprint)
+
+        print(f"시설 수: {len(facilities)}, 상세 페이지 요청 수: {len(stale)}")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                key: executor.submit(self.fetch_detail, detail_url)
+                for key, (detail_url, _) in stale.items()
+            }
+            for key, future in futures.items():
+                detail_url, fingerprint = stale[key]
+                try:
+                    fields = future.result()
+                except Exception as e:
+                    print(f"상세 페이지 오류 ({detail_url}): {e}")
+                    continue
+                self.cache[key] = {
+                    'detail_url': detail_url,
+                    'listing_hash': fingerprint,
+                    'fields': fields,
+                    'fetched_at': datetime.now().isoformat(),
+                }
+
+        enriched = 0
+        for key, facility_courts in facilities.items():
+            fields = self.cache.get(key, {}).get('fields', {})
+            for court in facility_courts:
+                for field, value in fields.items():
+                    if court.get(field, '') in self.PLACEHOLDER_VALUES:
+                        court[field] = value
+                        enriched += 1
+                        if field in ('reservation_period', 'use_period'):
+                            add_period_fields(court)
+
+        print(f"보완된 필드 수: {enriched}")
+        self.save_cache()
+        return courts
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""코트 레코드를 한 번만 순회하며 여러 출력 형식으로 동시에 내보냅니다.
+
+각 싱크는 레코드를 받을 때마다 임시 파일에 바로 쓰고, 전체가 끝나면 이름을 바꿔
+완성본으로 교체합니다. 중간에 실패하면 기존 파일은 그대로 남습니다.
+출력 형식을 늘려도 데이터를 형식마다 다시 모으거나 DataFrame 으로 만들지 않습니다.
+
+    python scraper/court_exporter.py --input scraper/seoul_tennis_courts_manual.json --prefix seoul_tennis_courts_manual
+"""
+
+import argparse
+import csv
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+CSV_ENCODING = 'utf-8-sig'
+
+# 구글 시트 컬럼 → 코트 필드 (앞쪽 필드가 없으면 뒤쪽 필드 사용)
+SHEETS_COLUMNS = [
+    ('시설명', ('facility_name', 'name')),
+    ('지역', ('region',)),
+    ('주소', ('address',)),
+    ('전화번호', ('phone',)),
+    ('코트번호', ('court_number',)),
+    ('시간대', ('time_period',)),
+    ('이용대상', ('target',)),
+    ('예약방법', ('reservation_method',)),
+    ('요금정보', ('fee_info',)),
+    ('설명', ('description', 'detail_text')),
+]
+
+# 시설 단위로 묶이는 시트 컬럼 (시설의 첫 레코드 값을 사용)
+SHEETS_FACILITY_COLUMNS = {'지역', '주소', '전화번호'}
+
+# GitHub API 연결용 JSON 필드 → 코트 필드
+GITHUB_API_FIELDS = [
+    ('시설명', ('facility_name', 'name')),
+    ('지역', ('region',)),
+    ('주소', ('address', 'region')),
+    ('코트번호', ('court_number',)),
+    ('시간대', ('time_period',)),
+    ('이용대상', ('target',)),
+    ('예약방법', ('reservation_method',)),
+    ('요금정보', ('fee_info',)),
+    ('예약상태', ('status',)),
+    ('설명', ('description', 'detail_text')),
+]
+
+GITHUB_API_STATISTICS = {'by_region': '지역', 'by_fee': '요금정보', 'by_status': '예약상태'}
+
+def pick(court, fields):
+    for field in fields:
+        value = court.get(field)
+        if value not in (None, ''):
+            return value
+    return ''
+
+def indent_json(value, level):
+    """json.dump(indent=2) 로 중첩되어 쓰였을 때와 같은 들여쓰기로 직렬화합니다."""
+    return json.dumps(value, ensure_ascii=False, indent=2).replace('\n', '\n' + '  ' * level)
+
+class AtomicFileSink:
+    """임시 파일에 쓰고 close 에서 원자적으로 교체하는 싱크의 기반 클래스입니다."""
+
+    encoding = 'utf-8'
+    newline = None
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.file = None
+        self.temp_path = None
+
+    def open(self):
+        self.temp_path = f"{self.filename}.tmp"
+        self.file = open(self.temp_path, 'w', encoding=self.encoding, newline=self.newline)
+        self.begin()
+
+    def begin(self):
+        pass
+
+    def write(self, court):
+        raise NotImplementedError
+
+    def finish(self):
+        pass
+
+    def close(self):
+        self.finish()
+        self.file.close()
+        os.replace(self.temp_path, self.filename)
+        print(f"{self.label} 저장 완료: {self.filename}")
+
+    def abort(self):
+        if self.file:
+            self.file.close()
+        if self.temp_path and os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+class JsonArraySink(AtomicFileSink):
+    """json.dump(courts, indent=2, ensure_ascii=False) 와 같은 내용을 레코드 단위로 씁니다."""
+
+    label = 'JSON 파일'
+
+    def begin(self):
+        self.count = 0
+
+    def write(self, court):
+        self.file.write(',\n  ' if self.count else '[\n  ')
+        self.file.write(indent_json(court, 1))
+        self.count += 1
+
+    def finish(self):
+        self.file.write('\n]' if self.count else '[]')
+
+class CsvSink(AtomicFileSink):
+    """레코드를 CSV 로 씁니다. 컬럼은 pandas DataFrame 처럼 처음 나온 순서의 필드 합집합입니다.
+
+    뒤늦게 새 필드가 나오면 close 에서 임시 파일을 한 줄씩 다시 읽어 빈 칸을 채웁니다.
+    """
+
+    label = 'CSV 파일'
+    encoding = CSV_ENCODING
+    newline = ''
+
+    def __init__(self, filename, columns=None):
+        super().__init__(filename)
+        self.fixed_columns = list(columns) if columns else None
+
+    def begin(self):
+        self.columns = list(self.fixed_columns or [])
+        self.known = set(self.columns)
+        self.written_columns = 0
+        self.writer = csv.writer(self.file, lineterminator='\n')
+        self.header_written = False
+
+    def write(self, court):
+        if not self.fixed_columns:
+            for key in court:
+                if key not in self.known:
+                    self.known.add(key)
+                    self.columns.append(key)
+        if not self.header_written:
+            self.writer.writerow(self.columns)
+            self.header_written = True
+            self.written_columns = len(self.columns)
+        self.writer.writerow(['' if court.get(column) is None else court.get(column) for column in self.columns])
+
+    def finish(self):
+        if not self.header_written:
+            self.writer.writerow(self.columns)
+            return
+        if len(self.columns) == self.written_columns:
+            return
+
+        # 헤더를 새 컬럼 목록으로 바꾸고 이전 행의 부족한 칸을 채워 다시 씀
+        self.file.close()
+        rewritten_path = f"{self.temp_path}.rewrite"
+        with open(self.temp_path, 'r', encoding=CSV_ENCODING, newline='') as source, \
+                open(rewritten_path, 'w', encoding=CSV_ENCODING, newline='') as target:
+            reader = csv.reader(source)
+            writer = csv.writer(target, lineterminator='\n')
+            next(reader)
+            writer.writerow(self.columns)
+            width = len(self.columns)
+            for row in reader:
+                writer.writerow(row + [''] * (width - len(row)))
+        os.replace(rewritten_path, self.temp_path)
+
+class GoogleSheetsCsvSink(AtomicFileSink):
+    """구글 시트 업로드용 한글 헤더 CSV 를 씁니다.
+
+    행은 시설명별로 묶어 시설이 처음 나온 순서대로 쓰며, 지역/주소/전화번호는 시설의 첫 레코드 값을 씁니다.
+    입력이 시설별로 모여 있지 않아도 되도록 행은 close 까지 시설별로 모아 둡니다.
+    """
+
+    label = '구글 시트용 CSV 파일'
+    encoding = CSV_ENCODING
+    newline = ''
+
+    def begin(self):
+        self.facilities = {}
+
+    def write(self, court):
+        row = {column: pick(court, fields) for column, fields in SHEETS_COLUMNS}
+        facility = self.facilities.setdefault(
+            row['시설명'], {'shared': {column: row[column] for column in SHEETS_FACILITY_COLUMNS}, 'rows': []}
+        )
+        row.update(facility['shared'])
+        facility['rows'].append([row[column] for column, _ in SHEETS_COLUMNS])
+
+    def finish(self):
+        writer = csv.writer(self.file, lineterminator='\n')
+        writer.writerow([column for column, _ in SHEETS_COLUMNS])
+        for facility in self.facilities.values():
+            writer.writerows(facility['rows'])
+
+class GithubApiJsonSink(AtomicFileSink):
+    """API 커넥터용 메타데이터/통계 래퍼 JSON 을 씁니다.
+
+    metadata 의 total_courts 가 코트 목록보다 앞에 오므로 목록은 별도 임시 파일에 쓰고
+    close 에서 메타데이터 뒤에 이어 붙입니다.
+    """
+
+    label = 'GitHub API용 JSON 파일'
+
+    def __init__(self, filename, title='서울특별시 공공서비스예약 테니스장 현황',
+                 description='서울특별시 공공서비스예약 시스템에서 추출한 테니스장 정보',
+                 source='https://yeyak.seoul.go.kr/web/search/selectPageListDetailSearch.do?code=T100&dCode=T108'):
+        super().__init__(filename)
+        self.metadata = {'title': title, 'description': description, 'source': source}
+
+    def begin(self):
+        self.count = 0
+        self.extracted_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.statistics = {name: {} for name in GITHUB_API_STATISTICS}
+        self.body = tempfile.TemporaryFile('w+', encoding='utf-8')
+
+    def write(self, court):
+        self.count += 1
+        entry = {'번호': self.count}
+        entry.update((column, pick(court, fields)) for column, fields in GITHUB_API_FIELDS)
+        entry['추출일시'] = court.get('extracted_at') or self.extracted_at
+
+        for name, column in GITHUB_API_STATISTICS.items():
+            counts = self.statistics[name]
+            counts[entry[column]] = counts.get(entry[column], 0) + 1
+
+        self.body.write(',\n    ' if self.count > 1 else '\n    ')
+        self.body.write(indent_json(entry, 2))
+
+    def finish(self):
+        metadata = {
+            'title': self.metadata['title'],
+            'description': self.metadata['description'],
+            'last_updated': datetime.now().isoformat(),
+            'total_courts': self.count,
+            'source': self.metadata['source'],
+        }
+        self.file.write('{\n  "metadata": ' + indent_json(metadata, 1) + ',\n  "tennis_courts": [')
+        self.body.seek(0)
+        shutil.copyfileobj(self.body, self.file)
+        self.body.close()
+        self.file.write('\n  ]' if self.count else ']')
+        self.file.write(',\n  "statistics": ' + indent_json(self.statistics, 1) + '\n}')
+
+    def abort(self):
+        if getattr(self, 'body', None):
+            self.body.close()
+        super().abort()
+
+class CourtExporter:
+    """등록된 싱크들에 레코드를 한 번씩 흘려보냅니다."""
+
+    def __init__(self, sinks):
+        self.sinks = list(sinks)
+
+    def export(self, courts):
+        """코트 목록(또는 이터러블)을 모든 싱크에 쓰고 기록한 레코드 수를 반환합니다."""
+        opened = []
+        try:
+            for sink in self.sinks:
+                sink.open()
+                opened.append(sink)
+            count = 0
+            for court in courts:
+                for sink in self.sinks:
+                    sink.write(court)
+                count += 1
+            for sink in self.sinks:
+                sink.close()
+            return count
+        except BaseException:
+            for sink in opened:
+                sink.abort()
+            raise
+
+def export_courts(courts, prefix, sheets=False, github_api=False):
+    """<prefix>.json / <prefix>.csv 와 선택한 부가 형식을 한 번에 내보냅니다."""
+    base = os.path.dirname(prefix)
+    sinks = [JsonArraySink(f"{prefix}.json"), CsvSink(f"{prefix}.csv")]
+    if sheets:
+        sinks.append(GoogleSheetsCsvSink(os.path.join(base, 'seoul_tennis_courts_google_sheets.csv')))
+    if github_api:
+        sinks.append(GithubApiJsonSink(os.path.join(base, 'seoul_tennis_github_api.json')))
+    return CourtExporter(sinks).export(courts)
+
+def main():
+    parser = argparse.ArgumentParser(description='코트 데이터 다중 형식 내보내기')
+    parser.add_argument('--input', required=True, help='코트 JSON 파일')
+    parser.add_argument('--prefix', required=True, help='출력 파일 경로 접두사 (.json/.csv)')
+    parser.add_argument('--sheets', action='store_true', help='구글 시트용 CSV 도 생성')
+    parser.add_argument('--github-api', action='store_true', help='GitHub API용 JSON 도 생성')
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        courts = json.load(f)
+    count = export_courts(courts, args.prefix, sheets=args.sheets, github_api=args.github_api)
+    print(f"내보낸 레코드: {count}개")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""테니스장 주소를 좌표로 변환하고 가까운 시설 검색용 공간 인덱스(KD-tree)를 만듭니다.
+
+지오코더는 geocode(address) -> (위도, 경도) 또는 None 을 제공하는 객체면 됩니다.
+오프라인 조회표(OfflineGeocoder)와 카카오 로컬 API(KakaoGeocoder)를 제공하며,
+결과는 GeocodeCache 파일에 저장해 다음 실행에서 재사용합니다.
+
+    python scraper/court_geocoder.py --input scraper/seoul_tennis_courts_manual.json
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+
+SCRAPER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 동 단위 대표 좌표 (위도, 경도)
+DONG_COORDINATES = {
+    '용산구 한남동': (37.5347, 127.0062),
+    '용산구 이촌동': (37.5226, 126.9716),
+    '강동구 천호동': (37.5423, 127.1238),
+    '마포구 망원동': (37.5558, 126.9015),
+    '마포구 상암동': (37.5779, 126.8899),
+    '서초구 반포동': (37.5047, 127.0030),
+    '서초구 서초동': (37.4919, 127.0178),
+    '성동구 성수동': (37.5446, 127.0557),
+    '송파구 문정동': (37.4857, 127.1225),
+    '송파구 잠실동': (37.5087, 127.0823),
+    '영등포구 여의도동': (37.5219, 126.9245),
+    '강남구 역삼동': (37.5006, 127.0364),
+}
+
+# 구청 기준 대표 좌표 (동 좌표가 없을 때 사용)
+REGION_COORDINATES = {
+    '강남구': (37.5172, 127.0473), '강동구': (37.5301, 127.1238), '강북구': (37.6396, 127.0257),
+    '강서구': (37.5509, 126.8495), '관악구': (37.4784, 126.9516), '광진구': (37.5385, 127.0823),
+    '구로구': (37.4954, 126.8874), '금천구': (37.4569, 126.8955), '노원구': (37.6542, 127.0568),
+    '도봉구': (37.6688, 127.0471), '동대문구': (37.5744, 127.0400), '동작구': (37.5124, 126.9393),
+    '마포구': (37.5663, 126.9019), '서대문구': (37.5791, 126.9368), '서초구': (37.4837, 127.0324),
+    '성동구': (37.5633, 127.0371), '성북구': (37.5894, 127.0167), '송파구': (37.5145, 127.1059),
+    '양천구': (37.5170, 126.8665), '영등포구': (37.5264, 126.8962), '용산구': (37.5324, 126.9900),
+    '은평구': (37.6027, 126.9291), '종로구': (37.5735, 126.9790), '중구': (37.5641, 126.9979),
+    '중랑구': (37.6063, 127.0925),
+}
+
+class OfflineGeocoder:
+    """조회표로 동 → 구 순서로 좌표를 찾는 오프라인 지오코더입니다."""
+
+    name = 'offline'
+
+    def __init__(self, dong_coordinates=None, region_coordinates=None):
+        self.dong_coordinates = dong_coordinates or DONG_COORDINATES
+        self.region_coordinates = region_coordinates or REGION_COORDINATES
+
+    def geocode(self, address):
+        for key, coordinates in self.dong_coordinates.items():
+            if key in address:
+                return coordinates
+        for region, coordinates in self.region_coordinates.items():
+            if f" {region}" in f" {address}":
+                return coordinates
+        return None
+
+class KakaoGeocoder:
+    """카카오 로컬 주소 검색 API 지오코더입니다. KAKAO_REST_API_KEY 환경 변수가 필요합니다."""
+
+    name = 'kakao'
+    API_URL = 'https://dapi.kakao.com/v2/local/search/address.json'
+
+    def __init__(self, session, api_key=None):
+        self.session = session
+        self.api_key = api_key or os.environ.get('KAKAO_REST_API_KEY', '')
+
+    def geocode(self, address):
+        if not self.api_key:
+            return None
+        response = self.session.get(
+            self.API_URL,
+            params={'query': address},
+            headers={'Authorization': f"KakaoAK {self.api_key}"},
+        )
+        response.raise_for_status()
+        documents = response.json().get('documents', [])
+        if not documents:
+            return None
+        return float(documents[0]['y']), float(documents[0]['x'])
+
+class GeocodeCache:
+    """주소 → 좌표 결과를 파일에 저장하고, 없는 주소만 지오코더들에 차례로 묻습니다."""
+
+    def __init__(self, geocoders, cache_file=os.path.join(SCRAPER_DIR, 'seoul_tennis_geocode_cache.json')):
+        self.geocoders = geocoders
+        self.cache_file = cache_file
+        self.entries = {}
+        if os.path.exists(cache_file):
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def geocode(self, address):
+        if address in self.entries:
+            return tuple(self.entries[address]['coordinates'])
+        for geocoder in self.geocoders:
+            try:
+                coordinates = geocoder.geocode(address)
+            except Exception as e:
+                print(f"지오코딩 오류 ({geocoder.name}, {address}): {e}")
+                continue
+            if coordinates:
+                self.entries[address] = {'coordinates': list(coordinates), 'source': geocoder.name}
+                return coordinates
+        return None
+
+    def save(self):
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        print(f"지오코딩 캐시 저장 완료: {self.cache_file} ({len(self.entries)}건)")
+
+def geocode_courts(courts, geocoder):
+    """코트 레코드에 latitude/longitude 를 채웁니다."""
+    missing = 0
+    for court in courts:
+        address = court.get('address') or f"서울특별시 {court.get('region', '')}"
+        coordinates = geocoder.geocode(address)
+        if coordinates:
+            court['latitude'], court['longitude'] = coordinates
+        else:
+            missing += 1
+    print(f"지오코딩 완료: {len(courts) - missing}/{len(courts)}건")
+    return courts
+
+class CourtSpatialIndex:
+    """시설 좌표에 대한 2차원 KD-tree 입니다.
+
+    트리는 암묵적 배열 형태로 저장됩니다: 구간 [lo, hi) 의 중간 원소가 노드이고,
+    깊이에 따라 x(동서)·y(남북) 축을 번갈아 나눕니다. 좌표는 기준점에서의 km 단위 평면 좌표입니다.
+    """
+
+    EARTH_RADIUS_KM = 6371.0
+
+    def __init__(self, origin=(37.5665, 126.9780)):
+        self.origin = origin
+        self.points = []  # [x, y, facility index]
+        self.facilities = []
+
+    def project(self, latitude, longitude):
+        """위경도를 기준점 기준 km 평면 좌표로 변환합니다 (등장방형 근사)."""
+        x = math.radians(longitude - self.origin[1]) * math.cos(math.radians(self.origin[0])) * self.EARTH_RADIUS_KM
+        y = math.radians(latitude - self.origin[0]) * self.EARTH_RADIUS_KM
+        return x, y
+
+    def build(self, facilities):
+        """latitude/longitude 가 있는 시설 목록으로 트리를 만듭니다."""
+        self.facilities = [facility for facility in facilities if facility.get('latitude') is not None]
+        self.points = [
+            [*self.project(facility['latitude'], facility['longitude']), index]
+            for index, facility in enumerate(self.facilities)
+        ]
+        self._build(0, len(self.points), 0)
+        return self
+
+    def _build(self, lo, hi, depth):
+        if hi - lo <= 1:
+            return
+        axis = depth % 2
+        self.points[lo:hi] = sorted(self.points[lo:hi], key=lambda point: point[axis])
+        mid = (lo + hi) // 2
+        self._build(lo, mid, depth + 1)
+        self._build(mid + 1, hi, depth + 1)
+
+    def _search(self, lo, hi, depth, target, visit, bound):
+        """트리를 순회하며 visit(point, dist²) 를 호출합니다. bound() 는 현재 가지치기 반경²입니다."""
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        point = self.points[mid]
+        dx = point[0] - target[0]
+        dy = point[1] - target[1]
+        visit(point, dx * dx + dy * dy)
+
+        axis = depth % 2
+        diff = target[axis] - point[axis]
+        near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+        self._search(near[0], near[1], depth + 1, target, visit, bound)
+        if diff * diff <= bound():
+            self._search(far[0], far[1], depth + 1, target, visit, bound)
+
+    def nearest(self, latitude, longitude, k=5):
+        """가장 가까운 시설 k 개를 (거리 km, 시설) 목록으로 반환합니다."""
+        target = self.project(latitude, longitude)
+        heap = []  # (-dist², facility index)
+
+        def visit(point, dist2):
+            if len(heap) < k:
+                heapq.heappush(heap, (-dist2, point[2]))
+            elif dist2 < -heap[0][0]:
+                heapq.heapreplace(heap, (-dist2, point[2]))
+
+        def bound():
+            return -heap[0][0] if len(heap) == k else math.inf
+
+        self._search(0, len(self.points), 0, target, visit, bound)
+        return [(math.sqrt(-dist2), self.facilities[index]) for dist2, index in sorted(heap, reverse=True)]
+
+    def within_radius(self, latitude, longitude, radius_km):
+        """반경 radius_km 안의 시설을 거리순 (거리 km, 시설) 목록으로 반환합니다."""
+        target = self.project(latitude, longitude)
+        radius2 = radius_km * radius_km
+        found = []
+
+        def visit(point, dist2):
+            if dist2 <= radius2:
+                found.append((math.sqrt(dist2), self.facilities[point[2]]))
+
+        self._search(0, len(self.points), 0, target, visit, lambda: radius2)
+        return sorted(found, key=lambda item: item[0])
+
+    def to_dict(self):
+        return {
+            'origin': list(self.origin),
+            'points': [[round(x, 4), round(y, 4), index] for x, y, index in self.points],
+            'facilities': self.facilities,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        index = cls(tuple(data['origin']))
+        index.points = [list(point) for point in data['points']]
+        index.facilities = data['facilities']
+        return index
+
+def build_facility_index(courts):
+    """코트 목록을 시설 단위로 묶어 공간 인덱스를 만듭니다."""
+    facilities = {}
+    for court in courts:
+        name = court.get('facility_name') or court.get('name', '')
+        key = f"{name}_{court.get('region', '')}"
+        if key not in facilities and court.get('latitude') is not None:
+            facilities[key] = {
+                'facility_name': name,
+                'region': court.get('region', ''),
+                'address': court.get('address', ''),
+                'latitude': court['latitude'],
+                'longitude': court['longitude'],
+            }
+    return CourtSpatialIndex().build(list(facilities.values()))
+
+def main():
+    parser = argparse.ArgumentParser(description='테니스장 지오코딩 및 공간 인덱스 생성')
+    parser.add_argument('--input', default=os.path.join(SCRAPER_DIR, 'seoul_tennis_courts_manual.json'))
+    parser.add_argument('--output', default=os.path.join(SCRAPER_DIR, '..', 'public', 'data', 'courts', 'spatial_index.json'))
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        courts = json.load(f)
+
+    geocoders = [OfflineGeocoder()]
+    if os.environ.get('KAKAO_REST_API_KEY'):
+        from http_client import get_shared_session
+        geocoders.insert(0, KakaoGeocoder(get_shared_session()))
+
+    cache = GeocodeCache(geocoders)
+    geocode_courts(courts, cache)
+    cache.save()
+
+    index = build_facility_index(courts)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(index.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+    print(f"공간 인덱스 저장 완료: {args.output} (시설 {len(index.facilities)}개)")
+
+    # 예시: 서울시청 기준 가까운 시설
+    print("\n서울시청에서 가까운 테니스장:")
+    for distance, facility in index.nearest(37.5665, 126.9780, k=3):
+        print(f"  {distance:.1f}km {facility['facility_name']} ({facility['region']})")
+
+if __name__ == "__main__":
+    main()
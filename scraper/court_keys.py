@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""코트 레코드의 식별 키를 만듭니다.
+
+스냅샷 로그, Firestore 문서 ID, 알림 변경 비교, 작업 큐가 모두 이 키를 쓰므로
+키 형식을 바꾸면 저장된 데이터와 어긋나지 않도록 한 곳에서만 바꿉니다.
+"""
+
+def court_key(court):
+    """코트 식별자 '{이름}_{지역}' 을 만듭니다. 이름이 없으면 시설명·코트 번호·시간대로 만듭니다."""
+    name = court.get('name') or " ".join(
+        filter(None, [court.get('facility_name', ''), court.get('court_number', ''), court.get('time_period', '')])
+    )
+    return f"{name}_{court.get('region', '')}"
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""코트 번호와 범주형 필드를 일괄 정규화합니다.
+
+'3번코트', '8번 코트', '3' 같은 코트 번호를 정수로, 시간대·요금·예약방법을 고정된 범주 코드로 바꿉니다.
+값 종류는 행 수보다 훨씬 적으므로 pd.factorize 로 고유값만 한 번씩 파싱한 뒤
+코드 배열로 전체 행에 펼칩니다(조회표 방식). 원래 표시 문자열 컬럼은 category dtype 으로 유지합니다.
+
+    python scraper/court_normalizer.py --input scraper/seoul_tennis_courts_manual.json
+    python scraper/court_normalizer.py --benchmark 2000000
+"""
+
+import argparse
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+TIME_PERIOD_CATEGORIES = ['주간', '야간', '주말/공휴일', '평일']
+FEE_CATEGORIES = ['유료', '무료']
+RESERVATION_METHOD_CATEGORIES = ['온라인', '전화', '현장']
+
+CATEGORICAL_FIELDS = {
+    'time_period': TIME_PERIOD_CATEGORIES,
+    'fee_info': FEE_CATEGORIES,
+    'reservation_method': RESERVATION_METHOD_CATEGORIES,
+}
+
+COURT_NUMBER_PATTERN = re.compile(r'(\d+)')
+COURT_NUMBER_MAX = np.iinfo(np.int32).max
+
+def parse_court_number(value):
+    """코트 번호를 정수로 파싱합니다. 숫자가 없거나 int32 범위를 넘으면 -1."""
+    match = COURT_NUMBER_PATTERN.search(str(value))
+    if not match:
+        return -1
+    number = int(match.group(1))
+    return number if number <= COURT_NUMBER_MAX else -1
+
+def categorize(value, categories):
+    """자유 문자열을 범주 번호로 바꿉니다. 해당 없으면 -1."""
+    text = str(value)
+    # '주말,공휴일', '주말/공휴일 이용' 등을 같은 범주로
+    if '주말' in text or '공휴일' in text:
+        text = '주말/공휴일'
+    for code, category in enumerate(categories):
+        if category in text:
+            return code
+    return -1
+
+def map_uniques(series, parse, dtype):
+    """고유값에만 parse 를 적용하고 결과를 전체 행에 펼칩니다."""
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    table = np.array([parse(value) for value in uniques] + [-1], dtype=dtype)
+    # 결측(-1 코드)은 마지막 칸(-1)을 가리키도록
+    return table[codes]
+
+def normalize_court_frame(df):
+    """코트 DataFrame 에 정수 코트 번호와 범주 코드 컬럼을 추가합니다.
+
+    추가 컬럼: court_number_int (Int32, 없거나 범위를 넘으면 NA), <필드>_code (int8, 없으면 -1)
+    원래 컬럼은 category dtype 으로 바꿔 표시 문자열을 그대로 유지합니다.
+    """
+    if 'court_number' in df:
+        numbers = map_uniques(df['court_number'], parse_court_number, np.int32)
+        df['court_number_int'] = pd.arrays.IntegerArray(np.maximum(numbers, 0), mask=numbers < 0)
+        df['court_number'] = df['court_number'].astype('category')
+
+    for field, categories in CATEGORICAL_FIELDS.items():
+        if field not in df:
+            continue
+        df[f'{field}_code'] = map_uniques(df[field], lambda value: categorize(value, categories), np.int8)
+        df[field] = df[field].astype('category')
+
+    return df
+
+def normalize_courts(courts):
+    """코트 레코드 목록을 정규화된 DataFrame 으로 변환합니다."""
+    return normalize_court_frame(pd.DataFrame(courts))
+
+def category_labels(field):
+    """<필드>_code 값을 표시 문자열로 되돌리는 조회표를 반환합니다."""
+    return dict(enumerate(CATEGORICAL_FIELDS[field]))
+
+def synthetic_frame(rows, seed=0):
+    """벤치마크용 과거 데이터 형태의 DataFrame 을 만듭니다."""
+    rng = np.random.default_rng(seed)
+    court_numbers = np.array(['3번코트', '8번 코트', '3', '1번 코트', '12번코트', '코트 5', ''])
+    time_periods = np.array(['주간', '야간', '주말/공휴일', '주말,공휴일', '평일', ''])
+    fees = np.array(['유료', '무료', '유료(할인)'])
+    methods = np.array(['온라인', '전화', '현장', '온라인 예약'])
+    return pd.DataFrame({
+        'court_number': court_numbers[rng.integers(0, len(court_numbers), rows)],
+        'time_period': time_periods[rng.integers(0, len(time_periods), rows)],
+        'fee_info': fees[rng.integers(0, len(fees), rows)],
+        'reservation_method': methods[rng.integers(0, len(methods), rows)],
+    })
+
+def main():
+    parser = argparse.ArgumentParser(description='코트 번호/범주형 필드 정규화')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help='JSON 또는 CSV 파일')
+    source.add_argument('--benchmark', type=int, help='합성 데이터 행 수')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        df = synthetic_frame(args.benchmark)
+        started = time.perf_counter()
+        normalize_court_frame(df)
+        elapsed = time.perf_counter() - started
+        print(f"{args.benchmark:,}행 정규화: {elapsed:.2f}초")
+        return
+
+    if args.input.endswith('.csv'):
+        df = pd.read_csv(args.input, dtype=str, keep_default_na=False)
+    else:
+        df = pd.read_json(args.input, dtype=False)
+    normalize_court_frame(df)
+
+    print(df[['court_number', 'court_number_int', 'time_period', 'time_period_code']].head(10))
+    print("\n시간대별 코트 수:")
+    print(df.groupby('time_period_code').size().rename(index=category_labels('time_period')))
+
+if __name__ == "__main__":
+    main()
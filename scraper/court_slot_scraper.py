@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+from bs4 import BeautifulSoup
+
+from court_keys import court_key
+from seoul_tennis_scraper import SeoulTennisScraper
+from yeyak_api_client import DETAIL_PATH
+
+class SlotAvailabilityStore:
+    """코트 × 날짜별 예약 가능 시간을 비트맵 배열로 보관합니다.
+
+    각 칸은 uint32 비트맵이며 비트 i 는 (SLOT_START_HOUR + i)시 1시간 슬롯입니다.
+    """
+
+    SLOT_START_HOUR = 6
+    SLOT_COUNT = 18  # 06:00 ~ 24:00
+
+    def __init__(self, start_date, days=14, capacity=256):
+        self.start_date = start_date
+        self.days = days
+        self.court_keys = []
+        self.court_index = {}
+        self.regions = []
+        self.region_codes = np.zeros(capacity, dtype=np.int16)
+        self.bitmaps = np.zeros((capacity, days), dtype=np.uint32)
+
+    def add_court(self, court_key, region):
+        """코트를 등록하고 행 번호를 반환합니다."""
+        if court_key in self.court_index:
+            return self.court_index[court_key]
+
+        row = len(self.court_keys)
+        if row >= len(self.bitmaps):
+            # 용량이 부족하면 두 배로 늘림
+            self.bitmaps = np.vstack([self.bitmaps, np.zeros_like(self.bitmaps)])
+            self.region_codes = np.concatenate([self.region_codes, np.zeros_like(self.region_codes)])
+
+        if region not in self.regions:
+            self.regions.append(region)
+        self.region_codes[row] = self.regions.index(region)
+        self.court_keys.append(court_key)
+        self.court_index[court_key] = row
+        return row
+
+    def day_index(self, day):
+        """날짜를 열 번호로 변환합니다."""
+        return (day - self.start_date).days
+
+    def hours_mask(self, hours):
+        """시(hour) 목록을 비트마스크로 변환합니다."""
+        mask = 0
+        for hour in hours:
+            offset = hour - self.SLOT_START_HOUR
+            if 0 <= offset < self.SLOT_COUNT:
+                mask |= 1 << offset
+        return np.uint32(mask)
+
+    def set_free_hours(self, court_key, region, day, hours):
+        """코트의 특정 날짜 예약 가능 시간을 기록합니다."""
+        column = self.day_index(day)
+        if not 0 <= column < self.days:
+            return
+        row = self.add_court(court_key, region)
+        self.bitmaps[row, column] = self.hours_mask(hours)
+
+    def query_free(self, region=None, weekdays=None, hours=None):
+        """조건에 맞는 빈 슬롯이 있는 (코트, 날짜) 목록을 반환합니다.
+
+        예: query_free(region='용산구', weekdays=[5], hours=range(18, 22))
+        """
+        count = len(self.court_keys)
+        bitmaps = self.bitmaps[:count]
+
+        row_mask = np.ones(count, dtype=bool)
+        if region is not None:
+            if region not in self.regions:
+                return []
+            row_mask = self.region_codes[:count] == self.regions.index(region)
+
+        day_mask = np.ones(self.days, dtype=bool)
+        if weekdays is not None:
+            day_weekdays = (np.arange(self.days) + self.start_date.weekday()) % 7
+            day_mask = np.isin(day_weekdays, list(weekdays))
+
+        slot_mask = self.hours_mask(hours) if hours is not None else np.uint32((1 << self.SLOT_COUNT) - 1)
+        free = (bitmaps & slot_mask) != 0
+        free &= row_mask[:, None]
+        free &= day_mask[None, :]
+
+        rows, columns = np.nonzero(free)
+        return [
+            (self.court_keys[row], self.start_date + timedelta(days=int(column)))
+            for row, column in zip(rows, columns)
+        ]
+
+    def save(self, filename='seoul_tennis_slots.npz'):
+        """슬롯 비트맵을 압축 파일로 저장합니다."""
+        count = len(self.court_keys)
+        np.savez_compressed(
+            filename,
+            start_date=np.array(self.start_date.isoformat()),
+            court_keys=np.array(self.court_keys),
+            regions=np.array(self.regions),
+            region_codes=self.region_codes[:count],
+            bitmaps=self.bitmaps[:count],
+        )
+        print(f"슬롯 데이터 저장 완료: {filename}")
+
+    @classmethod
+    def load(cls, filename='seoul_tennis_slots.npz'):
+        """저장된 슬롯 비트맵을 읽어옵니다."""
+        data = np.load(filename)
+        bitmaps = data['bitmaps']
+        store = cls(date.fromisoformat(str(data['start_date'])), days=bitmaps.shape[1],
+                    capacity=max(len(bitmaps), 1))
+        store.regions = [str(region) for region in data['regions']]
+        for row, court_key in enumerate(data['court_keys']):
+            store.court_keys.append(str(court_key))
+            store.court_index[str(court_key)] = row
+        store.region_codes[:len(bitmaps)] = data['region_codes']
+        store.bitmaps[:len(bitmaps)] = bitmaps
+        return store
+
+class SeoulTennisSlotScraper(SeoulTennisScraper):
+    """코트별·날짜별 예약 가능 시간을 수집합니다.
+
+    코트별로 날짜 요청을 묶어 여러 코트를 동시에 가져오며(요청 속도는 세션의 토큰 버킷이 조절),
+    이용기간을 알고 있는 코트는 그 기간 밖의 날짜를 요청하지 않습니다.
+    """
+
+    UNAVAILABLE_CLASSES = {'disable', 'disabled', 'end', 'closed', 'reserved', 'soldout'}
+    UNAVAILABLE_TEXTS = ['마감', '예약완료', '예약불가']
+
+    def __init__(self, base_url="https://yeyak.seoul.go.kr", session=None, mode='auto', days=14, max_workers=8):
+        super().__init__(base_url=base_url, session=session, mode=mode)
+        self.days = days
+        self.max_workers = max_workers
+
+    def service_id(self, court):
+        """상세 페이지 URL에서 서비스 ID를 추출합니다."""
+        query = parse_qs(urlparse(court.get('detail_url', '')).query)
+        return query.get('rsv_svc_id', [""])[0]
+
+    def parse_free_hours(self, content):
+        """시간표 HTML에서 예약 가능한 시작 시각 목록을 추출합니다."""
+        soup = BeautifulSoup(content, 'html.parser')
+        hours = set()
+        for cell in soup.select('[class*="time"]'):
+            # 여러 슬롯을 감싼 컨테이너(time-table 등)는 건너뛰고 가장 안쪽 슬롯 칸만 사용
+            if cell.select_one('[class*="time"]'):
+                continue
+            classes = set(cell.get('class', []))
+            text = cell.get_text(strip=True)
+            if classes & self.UNAVAILABLE_CLASSES or any(word in text for word in self.UNAVAILABLE_TEXTS):
+                continue
+            hour_match = re.search(r'(\d{1,2}):\d{2}', text)
+            if hour_match:
+                hours.add(int(hour_match.group(1)))
+        return sorted(hours)
+
+    def court_days(self, court, start_date):
+        """수집할 날짜 목록을 반환합니다. 이용기간(use_start/use_end)을 알면 그 안의 날짜만."""
+        days = [start_date + timedelta(days=offset) for offset in range(self.days)]
+        if court.get('use_start'):
+            first = datetime.fromisoformat(court['use_start']).date()
+            days = [day for day in days if day >= first]
+        if court.get('use_end'):
+            last = datetime.fromisoformat(court['use_end']).date()
+            days = [day for day in days if day <= last]
+        return days
+
+    def fetch_court_slots(self, svc_id, days):
+        """코트 하나의 날짜별 예약 가능 시간을 가져와 [(날짜, 시간 목록 또는 오류)] 로 반환합니다."""
+        results = []
+        for day in days:
+            try:
+                response = self.session.get(f"{self.base_url}{DETAIL_PATH}", params={
+                    'rsv_svc_id': svc_id,
+                    'use_de': day.strftime('%Y%m%d'),
+                })
+                response.raise_for_status()
+                results.append((day, self.parse_free_hours(response.content)))
+            except Exception as e:
+                results.append((day, e))
+        return results
+
+    def scrape_slots(self, courts, store=None):
+        """각 코트의 날짜별 예약 가능 시간을 코트 단위로 동시에 수집해 저장소에 기록합니다."""
+        print("\n=== 예약 가능 시간 수집 ===")
+        store = store or SlotAvailabilityStore(date.today(), days=self.days)
+
+        jobs = []
+        for court in courts:
+            svc_id = self.service_id(court)
+            days = self.court_days(court, store.start_date) if svc_id else []
+            if days:
+                jobs.append((court, svc_id, days))
+        print(f"코트 {len(jobs)}개, 요청 수: {sum(len(days) for _, _, days in jobs)}")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                (court, executor.submit(self.fetch_court_slots, svc_id, days))
+                for court, svc_id, days in jobs
+            ]
+            # 저장소는 스레드 안전하지 않으므로 결과는 이 스레드에서 입력 순서대로 기록
+            for court, future in futures:
+                key = court_key(court)
+                for day, hours in future.result():
+                    if isinstance(hours, Exception):
+                        print(f"슬롯 수집 오류 ({key}, {day}): {hours}")
+                        continue
+                    store.set_free_hours(key, court['region'], day, hours)
+
+        print(f"슬롯 수집 완료: 코트 {len(store.court_keys)}개 × {store.days}일")
+        return store
+
+    def poll(self, interval=600, rounds=None, filename='seoul_tennis_slots.npz'):
+        """코트 목록을 한 번 수집한 뒤 예약 가능 시간을 주기적으로 갱신합니다."""
+        self.scrape_tennis_courts()
+        self.clean_and_organize_data()
+
+        completed = 0
+        while rounds is None or completed < rounds:
+            store = self.scrape_slots(self.tennis_courts)
+            store.save(filename)
+            completed += 1
+            if rounds is None or completed < rounds:
+                time.sleep(interval)
+
+def main():
+    scraper = SeoulTennisSlotScraper()
+    scraper.poll(rounds=1)
+
+    store = SlotAvailabilityStore.load()
+    matches = store.query_free(region='용산구', weekdays=[5], hours=range(18, 22))
+    print(f"\n용산구 토요일 저녁 예약 가능: {len(matches)}건")
+    for court_key, day in matches[:10]:
+        print(f"  {day} {court_key}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""여러 노드가 나눠 수집할 수 있는 공유 작업 큐 (코디네이터/워커 모드)입니다.
+
+작업(카테고리 × 페이지, 상세 페이지 URL)은 SQLite 파일에 저장되며, 워커는 작업을 임대(lease)해 처리합니다.
+임대는 가시성 제한 시간이 지나면 만료되므로 죽은 워커의 작업은 다른 워커가 다시 가져가며,
+마지막 시도에서 만료된 작업은 실패 처리됩니다. 처리 중인 워커는 주기적으로 임대를 연장합니다.
+결과는 코트 키로 upsert 되므로 같은 작업이 두 번 처리되어도 결과는 한 번만 반영됩니다.
+
+SQLite 는 기본 롤백 저널을 사용합니다(WAL 은 네트워크 파일시스템에서 동작하지 않음). 여러 머신에서
+워커를 실행하려면 db 파일이 fcntl 잠금을 제대로 지원하는 공유 파일시스템에 있어야 하며,
+그렇지 않으면 모든 워커를 한 호스트에서 실행합니다. 같은 인터페이스로 다른 저장소로 바꿀 수 있습니다.
+
+    python scraper/crawl_queue.py coordinator --db crawl_queue.db
+    python scraper/crawl_queue.py worker --db crawl_queue.db      # 여러 머신에서 실행
+    python scraper/crawl_queue.py status --db crawl_queue.db
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+from bs4 import BeautifulSoup
+
+from court_detail_enricher import CourtDetailEnricher
+from court_keys import court_key
+from seoul_tennis_scraper import SeoulTennisScraper
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    lease_owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, lease_expires);
+CREATE TABLE IF NOT EXISTS courts (
+    court_key TEXT PRIMARY KEY,
+    record TEXT NOT NULL,
+    task_id TEXT,
+    updated_at REAL
+);
+CREATE TABLE IF NOT EXISTS details (
+    detail_url TEXT PRIMARY KEY,
+    fields TEXT NOT NULL,
+    updated_at REAL
+);
+"""
+
+# 수집할 카테고리 (code, dCode)
+DEFAULT_CATEGORIES = [('T100', 'T108')]
+
+class CrawlQueue:
+    """임대와 가시성 제한 시간을 지원하는 SQLite 작업 큐입니다."""
+
+    def __init__(self, db_path, visibility_timeout=300, max_attempts=5):
+        self.db_path = db_path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.executescript(SCHEMA)
+
+    def task_id(self, kind, payload):
+        """같은 작업은 같은 ID 를 갖도록 내용 해시로 만듭니다."""
+        body = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        return f"{kind}:{hashlib.sha1(body.encode('utf-8')).hexdigest()[:16]}"
+
+    def enqueue(self, kind, payload):
+        """작업을 추가합니다. 이미 있으면 무시합니다."""
+        self._insert_task(kind, payload)
+
+    def _insert_task(self, kind, payload):
+        self.conn.execute(
+            'INSERT OR IGNORE INTO tasks (task_id, kind, payload, updated_at) VALUES (?, ?, ?, ?)',
+            (self.task_id(kind, payload), kind, json.dumps(payload, ensure_ascii=False), time.time()),
+        )
+
+    def expire_leases(self, now):
+        """마지막 시도에서 임대가 만료된 작업(워커가 죽은 경우)을 실패 처리합니다."""
+        self.conn.execute(
+            """UPDATE tasks SET status = 'failed', lease_owner = NULL, last_error = '임대 만료', updated_at = ?
+               WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?""",
+            (now, now, self.max_attempts),
+        )
+
+    def lease(self, owner):
+        """대기 중이거나 임대가 만료된 작업 하나를 임대합니다. 없으면 None."""
+        now = time.time()
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            self.expire_leases(now)
+            row = self.conn.execute(
+                """SELECT task_id, kind, payload FROM tasks
+                   WHERE (status = 'pending' OR (status = 'leased' AND lease_expires < ?))
+                     AND attempts < ?
+                   ORDER BY rowid LIMIT 1""",
+                (now, self.max_attempts),
+            ).fetchone()
+            if row is None:
+                self.conn.execute('COMMIT')
+                return None
+            self.conn.execute(
+                """UPDATE tasks SET status = 'leased', lease_owner = ?, lease_expires = ?,
+                   attempts = attempts + 1, updated_at = ? WHERE task_id = ?""",
+                (owner, now + self.visibility_timeout, now, row[0]),
+            )
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        return {'task_id': row[0], 'kind': row[1], 'payload': json.loads(row[2])}
+
+    def heartbeat(self, task_id, owner):
+        """처리 시간이 길어질 때 임대를 연장합니다."""
+        self.conn.execute(
+            "UPDATE tasks SET lease_expires = ? WHERE task_id = ? AND lease_owner = ? AND status = 'leased'",
+            (time.time() + self.visibility_timeout, task_id, owner),
+        )
+
+    def complete(self, task_id, owner, courts=(), details=None, new_tasks=()):
+        """결과를 병합하고 후속 작업을 추가한 뒤 작업을 완료 처리합니다."""
+        now = time.time()
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            for court in courts:
+                self.conn.execute(
+                    """INSERT INTO courts (court_key, record, task_id, updated_at) VALUES (?, ?, ?, ?)
+                       ON CONFLICT(court_key) DO UPDATE SET record = excluded.record,
+                       task_id = excluded.task_id, updated_at = excluded.updated_at""",
+                    (court_key(court), json.dumps(court, ensure_ascii=False), task_id, now),
+                )
+            if details is not None:
+                detail_url, fields = details
+                self.conn.execute(
+                    """INSERT INTO details (detail_url, fields, updated_at) VALUES (?, ?, ?)
+                       ON CONFLICT(detail_url) DO UPDATE SET fields = excluded.fields, updated_at = excluded.updated_at""",
+                    (detail_url, json.dumps(fields, ensure_ascii=False), now),
+                )
+            for kind, payload in new_tasks:
+                self._insert_task(kind, payload)
+            # 임대가 만료되어 다른 워커가 가져간 경우에도 결과는 멱등하게 병합되므로 완료 처리만 건너뜀
+            self.conn.execute(
+                """UPDATE tasks SET status = 'done', lease_owner = NULL, updated_at = ?
+                   WHERE task_id = ? AND (lease_owner = ? OR status = 'pending')""",
+                (now, task_id, owner),
+            )
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+
+    def fail(self, task_id, owner, error):
+        """작업을 다시 대기 상태로 돌리거나, 시도 횟수를 넘으면 실패 처리합니다."""
+        self.conn.execute(
+            """UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+               lease_owner = NULL, last_error = ?, updated_at = ?
+               WHERE task_id = ? AND lease_owner = ?""",
+            (self.max_attempts, str(error), time.time(), task_id, owner),
+        )
+
+    def counts(self):
+        rows = self.conn.execute('SELECT status, COUNT(*) FROM tasks GROUP BY status').fetchall()
+        return dict(rows)
+
+    def is_drained(self):
+        """남은 작업(대기/임대 중)이 없는지 확인합니다."""
+        self.expire_leases(time.time())
+        row = self.conn.execute("SELECT COUNT(*) FROM tasks WHERE status IN ('pending', 'leased')").fetchone()
+        return row[0] == 0
+
+    def collect_courts(self):
+        """병합된 코트 결과에 상세 페이지 정보를 채워 반환합니다."""
+        details = {
+            url: json.loads(fields)
+            for url, fields in self.conn.execute('SELECT detail_url, fields FROM details')
+        }
+        courts = []
+        for (record,) in self.conn.execute('SELECT record FROM courts ORDER BY court_key'):
+            court = json.loads(record)
+            for field, value in details.get(court.get('detail_url', ''), {}).items():
+                if court.get(field, '') in CourtDetailEnricher.PLACEHOLDER_VALUES:
+                    court[field] = value
+            courts.append(court)
+        return courts
+
+class CrawlWorker:
+    """큐에서 작업을 임대해 처리하는 워커입니다."""
+
+    def __init__(self, queue, worker_id=None, base_url="https://yeyak.seoul.go.kr"):
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.scraper = SeoulTennisScraper(base_url=base_url, mode='html')
+        self.enricher = CourtDetailEnricher(self.scraper.session, cache_file=f"{queue.db_path}.details.json")
+        self.current_task = None
+
+    def heartbeat_loop(self, stopped):
+        """처리 중인 작업의 임대를 가시성 제한 시간의 1/3 마다 연장합니다.
+
+        SQLite 연결은 스레드 간에 공유할 수 없으므로 별도 연결을 씁니다.
+        """
+        queue = CrawlQueue(self.queue.db_path, self.queue.visibility_timeout, self.queue.max_attempts)
+        try:
+            while not stopped.wait(max(1, self.queue.visibility_timeout / 3)):
+                task_id = self.current_task
+                if task_id is not None:
+                    queue.heartbeat(task_id, self.worker_id)
+        finally:
+            queue.conn.close()
+
+    def process_list_page(self, payload):
+        """목록 페이지 하나를 수집하고, 다른 페이지와 상세 페이지 작업을 만듭니다."""
+        response = self.scraper.session.get(
+            f"{self.scraper.base_url}/web/search/selectPageListDetailSearchImg.do",
+            params={
+                'code': payload['code'],
+                'dCode': payload['dCode'],
+                'pageIndex': payload['page'],
+                'pageSize': 1000,
+            },
+        )
+        response.raise_for_status()
+        soup = BeautifulSoup(response.content, 'html.parser')
+
+        self.scraper.tennis_courts = []
+        self.scraper.extract_tennis_courts(soup)
+        courts = self.scraper.tennis_courts
+
+        new_tasks = []
+        pagination = soup.find('div', class_='pagination') or soup.find('nav', class_='pagination')
+        if pagination:
+            for link in pagination.find_all('a'):
+                text = link.get_text(strip=True)
+                if text.isdigit() and int(text) != payload['page']:
+                    new_tasks.append(('list_page', {**payload, 'page': int(text)}))
+        for court in courts:
+            if court.get('detail_url'):
+                new_tasks.append(('detail', {'detail_url': court['detail_url']}))
+        return courts, None, new_tasks
+
+    def process_detail(self, payload):
+        fields = self.enricher.fetch_detail(payload['detail_url'])
+        return [], (payload['detail_url'], fields), []
+
+    def run(self, idle_timeout=60, poll_interval=2):
+        """작업이 없는 상태가 idle_timeout 초 동안 이어지면 종료합니다."""
+        print(f"워커 시작: {self.worker_id}")
+        idle_since = time.time()
+        processed = 0
+        stopped = threading.Event()
+        heartbeat = threading.Thread(target=self.heartbeat_loop, args=(stopped,), daemon=True)
+        heartbeat.start()
+
+        try:
+            while True:
+                task = self.queue.lease(self.worker_id)
+                if task is None:
+                    if time.time() - idle_since > idle_timeout:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                idle_since = time.time()
+                handler = self.process_list_page if task['kind'] == 'list_page' else self.process_detail
+                self.current_task = task['task_id']
+                try:
+                    courts, details, new_tasks = handler(task['payload'])
+                    self.queue.complete(task['task_id'], self.worker_id, courts, details, new_tasks)
+                    processed += 1
+                except Exception as e:
+                    print(f"작업 실패 ({task['task_id']}): {e}")
+                    self.queue.fail(task['task_id'], self.worker_id, e)
+                finally:
+                    self.current_task = None
+        finally:
+            stopped.set()
+            heartbeat.join()
+            self.scraper.fingerprint_cache.save()
+
+        print(f"워커 종료: {self.worker_id}, 처리 {processed}건")
+
+def run_coordinator(queue, categories=DEFAULT_CATEGORIES, prefix='seoul_tennis_courts', poll_interval=5):
+    """첫 페이지 작업을 넣고 큐가 빌 때까지 기다린 뒤 결과를 저장합니다.
+
+    단일 프로세스 수집과 같은 정리(중복 병합, 시설 ID 부여)를 거쳐 {prefix}.json/.csv 로 저장합니다.
+    """
+    for code, d_code in categories:
+        queue.enqueue('list_page', {'code': code, 'dCode': d_code, 'page': 1})
+
+    while not queue.is_drained():
+        print(f"작업 현황: {queue.counts()}")
+        time.sleep(poll_interval)
+
+    scraper = SeoulTennisScraper()
+    scraper.tennis_courts = queue.collect_courts()
+    scraper.clean_and_organize_data()
+    print(f"수집 완료: {len(scraper.tennis_courts)}개, 작업 현황 {queue.counts()}")
+    scraper.generate_summary()
+    scraper.export(prefix)
+
+def main():
+    parser = argparse.ArgumentParser(description='분산 수집 코디네이터/워커')
+    parser.add_argument('mode', choices=['coordinator', 'worker', 'status'])
+    parser.add_argument('--db', default='crawl_queue.db')
+    parser.add_argument('--worker-id')
+    parser.add_argument('--base-url', default="https://yeyak.seoul.go.kr")
+    parser.add_argument('--visibility-timeout', type=int, default=300)
+    parser.add_argument('--prefix', default='seoul_tennis_courts', help='결과 파일 접두사 (.json/.csv)')
+    args = parser.parse_args()
+
+    queue = CrawlQueue(args.db, visibility_timeout=args.visibility_timeout)
+    if args.mode == 'coordinator':
+        run_coordinator(queue, prefix=args.prefix)
+    elif args.mode == 'worker':
+        CrawlWorker(queue, args.worker_id, args.base_url).run()
+    else:
+        print(json.dumps(queue.counts(), ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""시설명 표기가 다른 레코드를 하나의 시설 ID 로 묶습니다.
+
+'광나루 한강공원 테니스장', '광나루한강공원테니스장', 텍스트 추출 조각 등을 정규화한 뒤
+블로킹 키(지역 + 정규화 이름 앞부분)가 같은 후보끼리만 비교하므로 전체 쌍 비교(O(n²))를 피합니다.
+지역이 비어 있는 조각은 같은 이름 앞부분을 가진 모든 지역 블록에 들어가되, 서로 다른 지역의
+레코드를 하나로 잇지는 않습니다. 숫자(제2, 테니스장1 등)나 실내/야외 같은 구분어가 다른 이름은
+비슷해도 별개 시설로 봅니다.
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+
+# 같은 이름 안에서 별개 시설을 가르는 구분어
+QUALIFIER_PATTERN = re.compile(r'실내|야외|돔|신관|구관|제\d+')
+
+def normalize_facility_name(name):
+    """시설명에서 지역·코트 번호·시간대·공백/기호를 제거합니다."""
+    name = unicodedata.normalize('NFC', name or '')
+    name = re.sub(r'\([^)]*\)', '', name)
+    name = re.sub(r'\d+\s*번\s*(코트)?|코트\s*\d+', '', name)
+    name = re.sub(r'주간|야간|주말|공휴일|평일|이용', '', name)
+    return re.sub(r'[^가-힣A-Za-z0-9]', '', name).lower()
+
+def display_facility_name(name):
+    """표시용 시설명 (지역·코트 번호·시간대 제거, 공백 유지)."""
+    name = re.sub(r'\([^)]*\)', '', name or '')
+    name = re.sub(r'\d+\s*번\s*(코트)?|주간|야간|주말|공휴일|평일|[-,]', ' ', name)
+    return re.sub(r'\s+', ' ', name).strip()
+
+class FacilityResolver:
+    """블로킹 기반 시설 엔터티 해석기입니다."""
+
+    def __init__(self, prefix_length=2, similarity=0.88):
+        self.prefix_length = prefix_length
+        self.similarity = similarity
+
+    def record_name(self, record):
+        return record.get('facility_name') or record.get('name', '')
+
+    def blocking_keys(self, normalized, region, known_regions=()):
+        """비교 후보를 모을 블로킹 키(지역 + 이름 앞부분)를 만듭니다.
+
+        지역이 비어 있는 조각(텍스트 추출 등)은 known_regions 의 모든 지역 블록에 넣습니다.
+        """
+        prefix = normalized[:self.prefix_length]
+        if region:
+            return [f"{region}|{prefix}"]
+        return [f"{known}|{prefix}" for known in known_regions] or [f"|{prefix}"]
+
+    def distinguishing_tokens(self, name):
+        """이름에서 숫자와 구분어를 뽑습니다. 이 값이 다르면 별개 시설입니다."""
+        return re.findall(r'\d+', name), sorted(QUALIFIER_PATTERN.findall(name))
+
+    def is_match(self, a, b):
+        """정규화 이름/지역 쌍이 같은 시설인지 판단합니다."""
+        name_a, region_a = a
+        name_b, region_b = b
+        if region_a and region_b and region_a != region_b:
+            return False
+        if name_a == name_b:
+            return True
+        if self.distinguishing_tokens(name_a) != self.distinguishing_tokens(name_b):
+            return False
+        shorter, longer = sorted((name_a, name_b), key=len)
+        if shorter in longer and len(shorter) / len(longer) >= 0.75:
+            return True
+        return SequenceMatcher(None, name_a, name_b).ratio() >= self.similarity
+
+    def resolve(self, records):
+        """레코드마다 facility_id 를 채우고 시설 ID → 대표 정보 사전을 반환합니다."""
+        # 1. 정규화 (이름, 지역) 단위로 먼저 묶어 비교 대상 수를 줄임
+        members = defaultdict(list)
+        for index, record in enumerate(records):
+            key = (normalize_facility_name(self.record_name(record)), record.get('region', ''))
+            members[key].append(index)
+
+        distinct = list(members)
+        parent = list(range(len(distinct)))
+        # 클러스터 루트별 지역 (지역 없는 조각만 있으면 '')
+        cluster_region = [region for _, region in distinct]
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(i, j):
+            root_i, root_j = find(i), find(j)
+            if root_i == root_j:
+                return
+            region_i, region_j = cluster_region[root_i], cluster_region[root_j]
+            # 지역 없는 조각을 거쳐 서로 다른 지역의 시설이 합쳐지지 않도록 거부
+            if region_i and region_j and region_i != region_j:
+                return
+            root, child = min(root_i, root_j), max(root_i, root_j)
+            parent[child] = root
+            cluster_region[root] = region_i or region_j
+
+        # 2. 블록 안에서만 쌍 비교
+        regions_by_prefix = defaultdict(set)
+        for normalized, region in distinct:
+            if normalized and region:
+                regions_by_prefix[normalized[:self.prefix_length]].add(region)
+
+        blocks = defaultdict(list)
+        for position, (normalized, region) in enumerate(distinct):
+            if not normalized:
+                continue
+            known_regions = sorted(regions_by_prefix[normalized[:self.prefix_length]])
+            for block_key in self.blocking_keys(normalized, region, known_regions):
+                blocks[block_key].append(position)
+
+        comparisons = 0
+        for positions in blocks.values():
+            for i in range(len(positions)):
+                for j in range(i + 1, len(positions)):
+                    comparisons += 1
+                    if self.is_match(distinct[positions[i]], distinct[positions[j]]):
+                        union(positions[i], positions[j])
+
+        # 3. 클러스터별 대표 이름/지역과 ID 결정
+        clusters = defaultdict(list)
+        for position in range(len(distinct)):
+            clusters[find(position)].append(position)
+
+        facilities = {}
+        for positions in clusters.values():
+            indexes = [index for position in positions for index in members[distinct[position]]]
+            regions = Counter(records[index].get('region', '') for index in indexes if records[index].get('region'))
+            region = regions.most_common(1)[0][0] if regions else ''
+            canonical = max((distinct[position][0] for position in positions), key=lambda name: (len(name), name))
+            facility_id = 'fac_' + hashlib.sha1(f"{region}|{canonical}".encode('utf-8')).hexdigest()[:10]
+            names = Counter(display_facility_name(self.record_name(records[index])) for index in indexes)
+
+            facilities[facility_id] = {
+                'facility_id': facility_id,
+                'facility_name': names.most_common(1)[0][0],
+                'region': region,
+                'mentions': len(indexes),
+            }
+            for index in indexes:
+                records[index]['facility_id'] = facility_id
+
+        print(f"시설 해석: 레코드 {len(records)}개 → 시설 {len(facilities)}개 (비교 {comparisons}회)")
+        return facilities
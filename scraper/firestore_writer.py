@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""수집한 코트 데이터를 Firestore 에 일괄 기록합니다.
+
+문서 ID 는 코트 키의 SHA-1 이라 같은 데이터를 여러 번 기록해도 문서가 늘지 않습니다.
+쓰기는 500건 단위 배치로 묶고 배치 커밋은 여러 스레드에서 동시에 보냅니다.
+FIRESTORE_EMULATOR_HOST 가 설정되어 있으면 로컬 에뮬레이터에 기록합니다.
+
+    python scraper/firestore_writer.py --input scraper/seoul_tennis_courts.json --prune
+    FIRESTORE_EMULATOR_HOST=localhost:8080 python scraper/firestore_writer.py --verify
+    FIRESTORE_EMULATOR_HOST=localhost:8080 python -m pytest scraper/tests/test_firestore_writer.py
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+try:
+    from google.cloud import firestore
+except ImportError:
+    firestore = None
+
+from court_keys import court_key
+
+SCRAPER_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ID = 'happy-tennis-61d73'
+COLLECTION = 'tennisCourts'
+MAX_BATCH_SIZE = 500  # Firestore 배치당 최대 쓰기 수
+
+def document_id(court):
+    """코트 키로부터 고정된 문서 ID 를 만듭니다."""
+    return hashlib.sha1(court_key(court).encode('utf-8')).hexdigest()
+
+def chunked(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+class FirestoreCourtWriter:
+    """코트 레코드를 배치 커밋으로 Firestore 컬렉션에 기록합니다."""
+
+    def __init__(self, client=None, collection=COLLECTION, batch_size=MAX_BATCH_SIZE, max_workers=8, max_attempts=3):
+        if client is None:
+            if firestore is None:
+                raise RuntimeError("google-cloud-firestore 가 설치되어 있지 않습니다: pip install google-cloud-firestore")
+            client = firestore.Client(project=os.environ.get('GOOGLE_CLOUD_PROJECT', PROJECT_ID))
+        self.client = client
+        self.collection = client.collection(collection)
+        self.batch_size = min(batch_size, MAX_BATCH_SIZE)
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+
+    def commit_with_retry(self, operations):
+        """(문서 ID, 데이터 또는 None=삭제) 목록을 한 배치로 커밋합니다."""
+        for attempt in range(1, self.max_attempts + 1):
+            batch = self.client.batch()
+            for doc_id, data in operations:
+                reference = self.collection.document(doc_id)
+                if data is None:
+                    batch.delete(reference)
+                else:
+                    batch.set(reference, data)
+            try:
+                batch.commit()
+                return len(operations)
+            except Exception as e:
+                if attempt == self.max_attempts:
+                    raise
+                delay = random.uniform(0, 2 ** attempt)
+                print(f"배치 커밋 실패 ({e}), {delay:.1f}초 후 재시도 ({attempt}/{self.max_attempts})")
+                time.sleep(delay)
+
+    def commit_all(self, operations):
+        """쓰기 목록을 배치로 나눠 동시에 커밋합니다."""
+        batches = list(chunked(operations, self.batch_size))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return sum(executor.map(self.commit_with_retry, batches))
+
+    def existing_ids(self):
+        """컬렉션의 문서 ID 를 필드 없이 조회합니다."""
+        return {snapshot.id for snapshot in self.collection.select([]).stream()}
+
+    def write_courts(self, courts, prune=False):
+        """코트 목록을 기록하고, prune 이면 목록에 없는 문서를 삭제합니다."""
+        updated_at = datetime.now().isoformat()
+        documents = {}
+        for court in courts:
+            documents[document_id(court)] = {**court, 'court_key': court_key(court), 'updated_at': updated_at}
+
+        operations = list(documents.items())
+        if prune:
+            stale = self.existing_ids() - documents.keys()
+            operations.extend((doc_id, None) for doc_id in stale)
+            print(f"삭제할 문서: {len(stale)}개")
+
+        started = time.perf_counter()
+        written = self.commit_all(operations)
+        elapsed = time.perf_counter() - started
+        print(f"Firestore 기록 완료: {written}건, {-(-written // self.batch_size)}개 배치, {elapsed:.2f}초")
+        return written
+
+def verify_against_emulator(courts):
+    """에뮬레이터에 두 번 기록해 문서 수가 그대로인지(멱등성) 확인합니다."""
+    if not os.environ.get('FIRESTORE_EMULATOR_HOST'):
+        raise RuntimeError("FIRESTORE_EMULATOR_HOST 를 설정하고 에뮬레이터를 실행하세요 (firebase emulators:start --only firestore)")
+
+    writer = FirestoreCourtWriter(collection=f"{COLLECTION}_verify")
+    expected = {document_id(court) for court in courts}
+
+    writer.write_courts(courts, prune=True)
+    first = writer.existing_ids()
+    writer.write_courts(courts, prune=True)
+    second = writer.existing_ids()
+
+    ok = first == expected and second == expected
+    print(f"검증 {'성공' if ok else '실패'}: 기대 {len(expected)}개, 1회차 {len(first)}개, 2회차 {len(second)}개")
+
+    sample = courts[0] if courts else None
+    if sample:
+        stored = writer.collection.document(document_id(sample)).get().to_dict()
+        print(f"샘플 문서: {stored.get('court_key')} ({stored.get('region')})")
+
+    writer.commit_all([(doc_id, None) for doc_id in second])
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description='코트 데이터 Firestore 일괄 기록')
+    parser.add_argument('--input', default=os.path.join(SCRAPER_DIR, 'seoul_tennis_courts_manual.json'))
+    parser.add_argument('--collection', default=COLLECTION)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--prune', action='store_true', help='입력에 없는 문서 삭제')
+    parser.add_argument('--verify', action='store_true', help='로컬 에뮬레이터로 멱등 기록 검증')
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        courts = json.load(f)
+    print(f"로드된 테니스장 데이터: {len(courts)}개")
+
+    if args.verify:
+        if not verify_against_emulator(courts):
+            raise SystemExit(1)
+        return
+
+    writer = FirestoreCourtWriter(collection=args.collection, max_workers=args.workers)
+    writer.write_courts(courts, prune=args.prune)
+
+if __name__ == "__main__":
+    main()
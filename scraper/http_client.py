@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""스크래퍼와 업로더가 함께 쓰는 HTTP 연결 풀입니다.
+
+keep-alive 연결을 재사용하도록 HTTPAdapter 풀 크기를 조정하고,
+새로 맺은 연결 수를 세어 재사용률을 확인할 수 있게 합니다.
+httpx 와 h2 가 설치되어 있으면 같은 지표를 집계하는 HTTP/2 클라이언트도 만들 수 있습니다.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx 의 HTTP/2 지원에 필요)
+except ImportError:
+    httpx = None
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 20
+
+class ConnectionMetrics:
+    """요청 수와 새 연결 수를 집계합니다."""
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self.lock = threading.Lock()
+
+    def record_request(self):
+        with self.lock:
+            self.requests += 1
+
+    def record_new_connection(self):
+        with self.lock:
+            self.new_connections += 1
+
+    @property
+    def reused_connections(self):
+        return max(0, self.requests - self.new_connections)
+
+    @property
+    def reuse_ratio(self):
+        return self.reused_connections / self.requests if self.requests else 0.0
+
+    def summary(self):
+        return {
+            'requests': self.requests,
+            'new_connections': self.new_connections,
+            'reused_connections': self.reused_connections,
+            'reuse_ratio': round(self.reuse_ratio, 3),
+        }
+
+class MeteredHTTPAdapter(HTTPAdapter):
+    """새 연결 생성을 집계하는 HTTPAdapter 입니다."""
+
+    def __init__(self, metrics, **kwargs):
+        self.metrics = metrics
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        metrics = self.metrics
+
+        class MeteredHTTPConnectionPool(HTTPConnectionPool):
+            def _new_conn(self):
+                metrics.record_new_connection()
+                return super()._new_conn()
+
+        class MeteredHTTPSConnectionPool(HTTPSConnectionPool):
+            def _new_conn(self):
+                metrics.record_new_connection()
+                return super()._new_conn()
+
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': MeteredHTTPConnectionPool,
+            'https': MeteredHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        self.metrics.record_request()
+        return super().send(request, **kwargs)
+
+def create_session(pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                   http2=False):
+    """연결 풀 크기를 조정한 세션을 만듭니다.
+
+    http2=True 이고 httpx/h2 가 설치되어 있으면 HTTP/2 httpx.Client 를 반환합니다.
+    """
+    if http2:
+        if httpx is not None:
+            return create_http2_client(pool_maxsize)
+        print("httpx/h2 가 설치되어 있지 않아 HTTP/1.1 세션을 사용합니다: pip install 'httpx[http2]'")
+
+    session = requests.Session()
+    session.headers.update({'Connection': 'keep-alive'})
+    session.metrics = ConnectionMetrics()
+    adapter = MeteredHTTPAdapter(
+        session.metrics,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=True,
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def create_http2_client(pool_maxsize=DEFAULT_POOL_MAXSIZE):
+    """연결 재사용 지표를 집계하는 HTTP/2 httpx.Client 를 만듭니다.
+
+    새 연결은 httpcore trace 확장의 TCP 연결 완료 이벤트로 셉니다.
+    """
+    metrics = ConnectionMetrics()
+
+    def trace(event_name, info):
+        if event_name == 'connection.connect_tcp.complete':
+            metrics.record_new_connection()
+
+    def on_request(request):
+        metrics.record_request()
+        request.extensions['trace'] = trace
+
+    client = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=pool_maxsize,
+            max_keepalive_connections=pool_maxsize,
+            keepalive_expiry=60,
+        ),
+        # requests.Session 과 같이 리다이렉트를 따라감 (httpx 기본값은 따라가지 않음)
+        follow_redirects=True,
+        event_hooks={'request': [on_request]},
+    )
+    client.metrics = metrics
+    return client
+
+_shared_session = None
+_shared_lock = threading.Lock()
+
+def get_shared_session(http2=False):
+    """프로세스 전체에서 공유하는 세션을 반환합니다. http2 는 처음 만들 때만 적용됩니다."""
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = create_session(http2=http2)
+        return _shared_session
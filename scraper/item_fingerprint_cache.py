@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+
+class ItemFingerprintCache:
+    """목록 아이템 HTML 조각의 해시 → 파싱 결과를 저장하는 캐시입니다.
+
+    내용이 바뀌지 않은 아이템은 정규식 추출을 다시 하지 않고 캐시된 결과를 사용합니다.
+    """
+
+    def __init__(self, cache_file='seoul_tennis_fingerprints.json', max_entries=20000):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.entries = self.load()
+        self.seen = set()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self):
+        """저장된 캐시를 읽어옵니다."""
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"지문 캐시 로드 실패, 새로 만듭니다: {e}")
+            return {}
+
+    def fingerprint(self, fragment, *context):
+        """HTML 조각의 지문을 계산합니다.
+
+        context 에는 파서 버전·base_url 처럼 같은 조각이라도 파싱 결과를 바꾸는 값을 넘깁니다.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in context:
+            digest.update(f"{part}\0".encode('utf-8'))
+        digest.update(fragment.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, fingerprint):
+        """캐시된 파싱 결과의 사본을 반환합니다. 없으면 None 을 반환합니다."""
+        self.seen.add(fingerprint)
+        record = self.entries.get(fingerprint)
+        if record is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return dict(record)
+
+    def put(self, fingerprint, record):
+        """파싱 결과를 캐시에 저장합니다."""
+        self.seen.add(fingerprint)
+        self.entries[fingerprint] = dict(record)
+
+    def save(self):
+        """캐시를 저장합니다. 크기 제한을 넘으면 이번 실행에서 보지 못한 항목부터 버립니다."""
+        if len(self.entries) > self.max_entries:
+            self.entries = {fp: record for fp, record in self.entries.items() if fp in self.seen}
+
+        temp_file = f"{self.cache_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(temp_file, self.cache_file)
+        print(f"지문 캐시: 적중 {self.hits}건, 새로 파싱 {self.misses}건")
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""yeyak.seoul.go.kr 를 흉내 내는 로컬 대역 서버입니다.
+
+수동 테니스장 데이터로 목록(HTML/JSON)·상세 페이지를 만들어 제공하며,
+지연·429·5xx·다운 상태를 주입해 스크래퍼의 세션 계층을 점검할 수 있습니다.
+
+    with LocalStandInServer(error_rate=0.3) as server:
+        scraper = SeoulTennisScraper(base_url=server.url)
+        scraper.scrape_tennis_courts()
+"""
+
+import html
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from seoul_tennis_manual_data import create_manual_tennis_data
+
+LIST_PATH = '/web/search/selectPageListDetailSearchImg.do'
+DETAIL_PATH = '/web/reservation/selectReservView.do'
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """목록/상세 페이지 요청을 처리하고 설정된 장애를 주입합니다."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def read_params(self):
+        params = parse_qs(urlparse(self.path).query)
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            params.update(parse_qs(self.rfile.read(length).decode('utf-8')))
+        return {key: values[0] for key, values in params.items()}
+
+    def inject_fault(self):
+        """설정에 따라 지연을 넣거나 오류 응답을 보내고, 오류를 보냈으면 True 를 반환합니다."""
+        server = self.server
+        with server.lock:
+            server.request_count += 1
+        if server.latency:
+            time.sleep(server.latency)
+        if server.down:
+            self.send_error(503, 'Service Unavailable')
+            return True
+        if random.random() < server.throttle_rate:
+            self.send_response(429)
+            self.send_header('Retry-After', '1')
+            self.end_headers()
+            return True
+        if random.random() < server.error_rate:
+            self.send_error(random.choice([500, 502, 503]))
+            return True
+        return False
+
+    def send_body(self, body, content_type='text/html; charset=utf-8'):
+        data = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.inject_fault():
+            return
+        path = urlparse(self.path).path
+        params = self.read_params()
+        with self.server.lock:
+            self.server.requests.append((path, params))
+        if path == LIST_PATH:
+            page_index = int(params.get('pageIndex', 1))
+            page_size = min(int(params.get('pageSize', self.server.page_size)), self.server.page_size)
+            wants_json = self.headers.get('X-Requested-With') == 'XMLHttpRequest'
+            if wants_json and self.server.api_mode != 'html':
+                body = json.dumps(self.server.render_list_json(page_index, page_size), ensure_ascii=False)
+                self.send_body(body, 'application/json; charset=utf-8')
+            else:
+                self.send_body(self.server.render_list(page_index))
+        elif path == DETAIL_PATH:
+            self.send_body(self.server.render_detail(params.get('rsv_svc_id', '')))
+        else:
+            self.send_error(404)
+
+    do_POST = do_GET
+
+class LocalStandInServer(ThreadingHTTPServer):
+    """테스트용 yeyak 대역 서버입니다."""
+
+    daemon_threads = True
+
+    def __init__(self, courts=None, page_size=10, latency=0.0, error_rate=0.0,
+                 throttle_rate=0.0, down=False, api_mode='json', port=0):
+        super().__init__(('127.0.0.1', port), StandInHandler)
+        self.courts = courts if courts is not None else create_manual_tennis_data()
+        self.page_size = page_size
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.down = down
+        self.api_mode = api_mode  # 'json': XHR 에 JSON 응답, 'html': 항상 HTML, 'changed': 알 수 없는 JSON 형식
+        self.request_count = 0
+        self.requests = []  # 장애 주입을 통과한 (경로, 파라미터) 기록
+        self.lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def service_id(self, index):
+        return f"S{index + 1:09d}"
+
+    def page_count(self):
+        return max(1, -(-len(self.courts) // self.page_size))
+
+    def court_title(self, court):
+        return f"{court['facility_name']} {court['court_number']} {court['time_period']}({court['region']})"
+
+    def render_list(self, page_index):
+        """목록 페이지 HTML 을 만듭니다."""
+        start = (page_index - 1) * self.page_size
+        items = []
+        for index, court in enumerate(self.courts[start:start + self.page_size], start=start):
+            items.append(
+                f'<div class="item"><a href="javascript:fnDetailPage(\'{self.service_id(index)}\')">'
+                f'<h3>{html.escape(self.court_title(court))}</h3></a>'
+                f'<p>이용대상: {html.escape(court["target"])}</p>'
+                f'<p>접수기간: 2025.10.01 09:00 ~ 2025.10.31 18:00</p>'
+                f'<p>이용기간: 2025.11.01 ~ 2025.11.30</p>'
+                f'<p>{html.escape(court["reservation_method"])} {html.escape(court["fee_info"])}</p></div>'
+            )
+        pages = "".join(f'<a href="#">{page}</a>' for page in range(1, self.page_count() + 1))
+        return f'<html><body>{"".join(items)}<div class="pagination">{pages}</div></body></html>'
+
+    def render_list_json(self, page_index, page_size):
+        """목록 XHR 응답(JSON)을 만듭니다."""
+        start = (page_index - 1) * page_size
+        rows = []
+        for index, court in enumerate(self.courts[start:start + page_size], start=start):
+            rows.append({
+                'SVCID': self.service_id(index),
+                'SVCNM': self.court_title(court),
+                'AREANM': court['region'],
+                'PLACENM': court['facility_name'],
+                'USETGTINFO': court['target'],
+                'RCPTBGNDT': '2025-10-01 09:00:00.0',
+                'RCPTENDDT': '2025-10-31 18:00:00.0',
+                'SVCOPNBGNDT': '2025-11-01 00:00:00.0',
+                'SVCOPNENDDT': '2025-11-30 00:00:00.0',
+                'PAYATNM': court['fee_info'],
+                'TELNO': court['phone'],
+            })
+        if self.api_mode == 'changed':
+            return {'payload': {'items': [{'title': row['SVCNM']} for row in rows]}}
+        return {'totalCount': len(self.courts), 'pageIndex': page_index, 'resultList': rows}
+
+    def render_detail(self, svc_id):
+        """상세 페이지 HTML 을 만듭니다."""
+        index = int(svc_id[1:] or 0) - 1
+        if not 0 <= index < len(self.courts):
+            return '<html><body></body></html>'
+        court = self.courts[index]
+        rows = [
+            ('장소', court['address']),
+            ('문의전화', court['phone']),
+            ('접수기간', '2025.10.01 09:00 ~ 2025.10.31 18:00'),
+            ('이용기간', '2025.11.01 ~ 2025.11.30'),
+        ]
+        cells = "".join(f'<tr><th>{label}</th><td>{html.escape(value)}</td></tr>' for label, value in rows)
+        return f'<html><body><table>{cells}</table></body></html>'
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+def main():
+    server = LocalStandInServer(port=8765)
+    print(f"로컬 대역 서버 실행 중: {server.url}")
+    print(json.dumps({'pages': server.page_count(), 'courts': len(server.courts)}, ensure_ascii=False))
+    server.serve_forever()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""접수기간/이용기간 문자열을 날짜 구간으로 파싱하고 구간 인덱스를 만듭니다.
+
+인덱스는 시작 시각으로 정렬한 배열 위의 암묵적 이진 트리이며, 각 노드가 하위 트리의
+최대 종료 시각을 가지고 있어 특정 시점/구간과 겹치는 코트를 O(log n + k) 에 찾습니다.
+시각은 서울 현지 시각(벽시계)을 1970-01-01 기준 분 단위 정수로 저장합니다.
+
+    python scraper/period_index.py --input scraper/seoul_tennis_courts.json
+"""
+
+import argparse
+import json
+import os
+import re
+from datetime import datetime, timedelta, timezone
+
+from court_keys import court_key
+
+SCRAPER_DIR = os.path.dirname(os.path.abspath(__file__))
+EPOCH = datetime(1970, 1, 1)
+KST = timezone(timedelta(hours=9))
+
+DATE_PATTERN = re.compile(
+    r'(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})\s*일?\.?'
+    r'(?:\s*\([^)]*\))?'
+    r'(?:\s*(\d{1,2}):(\d{2}))?'
+)
+
+def parse_period(text):
+    """'2025.10.01 09:00 ~ 2025.10.31 18:00' 형식의 기간을 (시작, 끝) datetime 으로 파싱합니다.
+
+    시각이 없는 시작일은 00:00, 종료일은 23:59 로 봅니다. 파싱할 수 없으면 (None, None).
+    """
+    matches = list(DATE_PATTERN.finditer(text or ''))
+    if not matches:
+        return None, None
+
+    def to_datetime(match, end_of_day):
+        year, month, day, hour, minute = match.groups()
+        try:
+            value = datetime(int(year), int(month), int(day))
+        except ValueError:
+            return None
+        if hour is not None:
+            return value.replace(hour=int(hour), minute=int(minute))
+        return value + timedelta(hours=23, minutes=59) if end_of_day else value
+
+    start = to_datetime(matches[0], end_of_day=False)
+    end = to_datetime(matches[-1], end_of_day=True)
+    if start is None or end is None or end < start:
+        return None, None
+    return start, end
+
+def add_period_fields(court):
+    """reservation_period/use_period 를 파싱해 *_start/*_end (ISO 문자열) 필드를 추가합니다."""
+    for field, prefix in (('reservation_period', 'reservation'), ('use_period', 'use')):
+        start, end = parse_period(court.get(field, ''))
+        court[f'{prefix}_start'] = start.isoformat(timespec='minutes') if start else ''
+        court[f'{prefix}_end'] = end.isoformat(timespec='minutes') if end else ''
+    return court
+
+def to_minutes(value):
+    """datetime 또는 ISO 문자열을 분 단위 정수로 변환합니다."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return int((value - EPOCH).total_seconds() // 60)
+
+class IntervalIndex:
+    """정렬 배열 기반 구간 트리입니다."""
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.max_ends = []
+        self.ids = []
+
+    def build(self, intervals):
+        """(시작 분, 끝 분, id) 목록으로 인덱스를 만듭니다."""
+        intervals = sorted(intervals)
+        self.starts = [start for start, _, _ in intervals]
+        self.ends = [end for _, end, _ in intervals]
+        self.ids = [item_id for _, _, item_id in intervals]
+        self.max_ends = list(self.ends)
+        self._fill_max_ends(0, len(self.starts))
+        return self
+
+    def _fill_max_ends(self, lo, hi):
+        if lo >= hi:
+            return -1
+        mid = (lo + hi) // 2
+        self.max_ends[mid] = max(
+            self.ends[mid],
+            self._fill_max_ends(lo, mid),
+            self._fill_max_ends(mid + 1, hi),
+        )
+        return self.max_ends[mid]
+
+    def _collect(self, lo, hi, query_start, query_end, found):
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        # 하위 트리의 모든 구간이 질의 시작 전에 끝나면 건너뜀
+        if self.max_ends[mid] < query_start:
+            return
+        self._collect(lo, mid, query_start, query_end, found)
+        if self.starts[mid] > query_end:
+            # 오른쪽은 시작이 더 늦으므로 볼 필요 없음
+            return
+        if self.ends[mid] >= query_start:
+            found.append(self.ids[mid])
+        self._collect(mid + 1, hi, query_start, query_end, found)
+
+    def overlapping(self, start, end):
+        """[start, end] 와 겹치는 구간의 id 목록을 반환합니다."""
+        found = []
+        self._collect(0, len(self.starts), to_minutes(start), to_minutes(end), found)
+        return found
+
+    def at(self, moment):
+        """특정 시점을 포함하는 구간의 id 목록을 반환합니다."""
+        return self.overlapping(moment, moment)
+
+    def to_dict(self):
+        return {'starts': self.starts, 'ends': self.ends, 'max_ends': self.max_ends, 'ids': self.ids}
+
+    @classmethod
+    def from_dict(cls, data):
+        index = cls()
+        index.starts = data['starts']
+        index.ends = data['ends']
+        index.max_ends = data['max_ends']
+        index.ids = data['ids']
+        return index
+
+def build_period_indexes(courts):
+    """접수기간/이용기간 인덱스를 만듭니다. 입력 코트는 바꾸지 않습니다."""
+    indexes = {}
+    for prefix in ('reservation', 'use'):
+        intervals = []
+        for court in courts:
+            if not court.get(f'{prefix}_start'):
+                court = add_period_fields(dict(court))
+            if court.get(f'{prefix}_start') and court.get(f'{prefix}_end'):
+                intervals.append((
+                    to_minutes(court[f'{prefix}_start']),
+                    to_minutes(court[f'{prefix}_end']),
+                    court_key(court),
+                ))
+        indexes[prefix] = IntervalIndex().build(intervals)
+    return indexes
+
+def period_indexes_to_dict(indexes):
+    """웹 앱(src/lib/periodIndex.ts)이 읽는 형식으로 변환합니다."""
+    return {
+        'unit': 'minutes',
+        'timezone': 'Asia/Seoul',
+        **{name: index.to_dict() for name, index in indexes.items()},
+    }
+
+def save_period_indexes(indexes, filename):
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(period_indexes_to_dict(indexes), f, ensure_ascii=False, separators=(',', ':'))
+    print(f"기간 인덱스 저장 완료: {filename}")
+
+def load_period_indexes(filename):
+    with open(filename, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {name: IntervalIndex.from_dict(data[name]) for name in ('reservation', 'use')}
+
+def main():
+    parser = argparse.ArgumentParser(description='접수/이용 기간 인덱스 생성')
+    parser.add_argument('--input', default=os.path.join(SCRAPER_DIR, 'seoul_tennis_courts.json'))
+    parser.add_argument('--output', default=os.path.join(SCRAPER_DIR, '..', 'public', 'data', 'courts', 'period_index.json'))
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        courts = json.load(f)
+
+    indexes = build_period_indexes(courts)
+    save_period_indexes(indexes, args.output)
+
+    open_now = indexes['reservation'].at(datetime.now(KST).replace(tzinfo=None))
+    print(f"현재 접수 중인 코트: {len(open_now)}개")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""스크래핑과 구글 시트 업로드를 주기적으로 실행하는 상주 프로세스입니다.
+
+모든 실행이 하나의 연결 풀을 공유하므로 매 실행마다 TCP/TLS 연결을 새로 맺지 않습니다.
+스크래퍼의 브라우저 헤더는 ResilientSession 에만 적용되어 업로더 요청에는 섞이지 않습니다.
+
+    python scraper/pipeline_daemon.py --interval 3600
+    python scraper/pipeline_daemon.py --http2     # httpx[http2] 설치 시
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from http_client import get_shared_session
+from scraper_session import ResilientSession
+from seoul_tennis_scraper import SeoulTennisScraper
+from court_detail_enricher import CourtDetailEnricher
+
+SCRAPER_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRAPER_DIR, '..', 'scripts'))
+
+from upload_to_google_sheets import upload_to_google_sheets  # noqa: E402
+
+def run_once(session, output_file):
+    """스크래핑 → 정리 → 보완 → 저장 → 업로드를 한 번 실행합니다."""
+    scraper = SeoulTennisScraper(session=ResilientSession(session))
+    scraper.scrape_tennis_courts()
+    scraper.clean_and_organize_data()
+    CourtDetailEnricher(scraper.session).enrich(scraper.tennis_courts)
+    scraper.save_to_json(output_file)
+
+    if scraper.tennis_courts:
+        upload_to_google_sheets(output_file, session=session)
+    else:
+        print("수집된 데이터가 없어 업로드를 건너뜁니다.")
+
+def main():
+    parser = argparse.ArgumentParser(description='테니스장 데이터 수집/업로드 데몬')
+    parser.add_argument('--interval', type=int, default=3600, help='실행 간격(초)')
+    parser.add_argument('--runs', type=int, default=None, help='실행 횟수 (기본: 무한)')
+    parser.add_argument('--output', default=os.path.join(SCRAPER_DIR, 'seoul_tennis_courts.json'))
+    parser.add_argument('--http2', action='store_true', help='httpx/h2 가 있으면 HTTP/2 클라이언트 사용')
+    args = parser.parse_args()
+
+    session = get_shared_session(http2=args.http2)
+    completed = 0
+
+    while args.runs is None or completed < args.runs:
+        started = time.time()
+        print(f"\n=== 실행 {completed + 1} 시작 ===")
+        try:
+            run_once(session, args.output)
+        except Exception as e:
+            print(f"실행 중 오류 발생: {e}")
+        completed += 1
+
+        print(f"연결 재사용 지표: {session.metrics.summary()}")
+        if args.runs is None or completed < args.runs:
+            time.sleep(max(0, args.interval - (time.time() - started)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""수집/수동 데이터/업로드 파이프라인을 단계 DAG 로 실행하고 결과를 메모이즈합니다.
+
+각 단계는 입력 단계와 출력(결과 값, 생성 파일)을 선언합니다. 단계 결과는
+(입력 결과 해시 + 단계 코드의 소스 해시) 키로 .pipeline_cache/ 에 저장되어,
+다시 실행하면 입력이나 코드가 바뀐 단계만 재계산합니다. 외부 사이트를 읽는 수집 단계는
+매번 실행하지만(volatile), 결과가 이전과 같으면 이후의 정리·저장·업로드 단계는 건너뜁니다.
+
+    python scraper/pipeline_dag.py manual --upload
+    python scraper/pipeline_dag.py scraper --upload
+    python scraper/pipeline_dag.py scraper --force scraper_clean
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import sys
+
+SCRAPER_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(SCRAPER_DIR, '.pipeline_cache')
+
+def stable_hash(value):
+    """JSON 직렬화 가능한 값의 해시를 계산합니다."""
+    data = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def code_version(objects):
+    """함수/클래스/모듈의 소스 코드 해시를 계산합니다.
+
+    소스를 읽을 수 없는 함수(대화형 세션 등)는 바이트코드로 대신합니다.
+    """
+    digest = hashlib.sha256()
+    for obj in objects:
+        try:
+            digest.update(inspect.getsource(obj).encode('utf-8'))
+        except (OSError, TypeError):
+            code = obj.__code__
+            digest.update(code.co_code + repr(code.co_consts).encode('utf-8'))
+    return digest.hexdigest()
+
+class Stage:
+    """파이프라인 단계 하나입니다.
+
+    func 는 입력 단계 결과를 순서대로 인자로 받아 JSON 직렬화 가능한 결과를 반환합니다.
+    code 에는 결과에 영향을 주는 함수/클래스/모듈을 나열합니다(func 자신은 항상 포함).
+    files 는 단계가 만드는 파일 경로로, 캐시 적중이어도 파일이 없거나 바뀌었으면 다시 실행합니다.
+    """
+
+    def __init__(self, name, func, inputs=(), code=(), files=(), volatile=False):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.code = [func, *code]
+        self.files = list(files)
+        self.volatile = volatile
+
+class PipelineDAG:
+    """단계를 위상 순서로 실행하며 결과를 캐시합니다."""
+
+    def __init__(self, cache_dir=CACHE_DIR, keep=5):
+        self.cache_dir = cache_dir
+        self.keep = keep
+        self.stages = {}
+
+    def stage(self, name, func, **options):
+        if name in self.stages:
+            raise ValueError(f"중복된 단계 이름: {name}")
+        self.stages[name] = Stage(name, func, **options)
+        return self.stages[name]
+
+    def order(self, targets=None):
+        """targets 에 필요한 단계를 위상 순서로 반환합니다."""
+        ordered, visiting, done = [], set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"순환 의존성: {name}")
+            if name not in self.stages:
+                raise KeyError(f"알 수 없는 단계: {name}")
+            visiting.add(name)
+            for dependency in self.stages[name].inputs:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+            ordered.append(self.stages[name])
+
+        for name in targets or self.stages:
+            visit(name)
+        return ordered
+
+    def cache_path(self, stage, key):
+        return os.path.join(self.cache_dir, stage.name, f"{key}.json")
+
+    def load_cached(self, stage, key):
+        """캐시 항목이 있고 생성 파일이 그대로이면 (결과,) 를 반환합니다."""
+        path = self.cache_path(stage, key)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        for file_path, expected in entry.get('files', {}).items():
+            if not os.path.exists(file_path) or file_hash(file_path) != expected:
+                return None
+        return (entry['value'],)
+
+    def store(self, stage, key, value):
+        directory = os.path.join(self.cache_dir, stage.name)
+        os.makedirs(directory, exist_ok=True)
+        entry = {
+            'stage': stage.name,
+            'value': value,
+            'files': {path: file_hash(path) for path in stage.files if os.path.exists(path)},
+        }
+        path = self.cache_path(stage, key)
+        with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(f"{path}.tmp", path)
+        self.prune(directory)
+
+    def prune(self, directory):
+        """단계별로 최근 keep 개의 캐시 항목만 남깁니다."""
+        entries = sorted(
+            (os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.json')),
+            key=os.path.getmtime,
+            reverse=True,
+        )
+        for path in entries[self.keep:]:
+            os.remove(path)
+
+    def run(self, targets=None, force=()):
+        """단계를 실행하고 {단계 이름: 결과} 를 반환합니다."""
+        results, hashes = {}, {}
+        for stage in self.order(targets):
+            key = stable_hash({
+                'stage': stage.name,
+                'code': code_version(stage.code),
+                'inputs': [hashes[name] for name in stage.inputs],
+            })
+
+            cached = None
+            if not stage.volatile and stage.name not in force:
+                cached = self.load_cached(stage, key)
+
+            if cached:
+                value = cached[0]
+                print(f"[{stage.name}] 캐시 사용")
+            else:
+                print(f"[{stage.name}] 실행")
+                value = stage.func(*(results[name] for name in stage.inputs))
+                self.store(stage, key, value)
+
+            results[stage.name] = value
+            hashes[stage.name] = stable_hash(value)
+        return results
+
+def load_uploader():
+    sys.path.insert(0, os.path.join(SCRAPER_DIR, '..', 'scripts'))
+    import upload_to_google_sheets
+    return upload_to_google_sheets
+
+def upload_stage(json_file):
+    """저장된 JSON 을 구글 시트에 업로드합니다. 결과는 업로드한 파일 해시입니다."""
+    def upload(exported):
+        module = load_uploader()
+        if not exported['count']:
+            print("데이터가 없어 업로드를 건너뜁니다.")
+            return {'uploaded': False}
+        if not module.upload_to_google_sheets(json_file):
+            raise RuntimeError("구글 시트 업로드 실패")
+        return {'uploaded': True, 'sha256': exported['sha256']}
+    return upload
+
+def build_manual_pipeline(dag, upload=False):
+    """수동 데이터 → 저장(JSON/CSV/시트 CSV) → 업로드 파이프라인을 구성합니다."""
+    import court_exporter
+    import seoul_tennis_manual_data
+
+    prefix = os.path.join(SCRAPER_DIR, 'seoul_tennis_courts_manual')
+    sheets_file = os.path.join(SCRAPER_DIR, 'seoul_tennis_courts_google_sheets.csv')
+
+    def manual_data():
+        return seoul_tennis_manual_data.create_manual_tennis_data()
+
+    def export(courts):
+        seoul_tennis_manual_data.generate_summary(courts)
+        count = court_exporter.CourtExporter([
+            court_exporter.JsonArraySink(f"{prefix}.json"),
+            court_exporter.CsvSink(f"{prefix}.csv"),
+            court_exporter.GoogleSheetsCsvSink(sheets_file),
+        ]).export(courts)
+        # 업로드 단계가 내용 변경을 알 수 있도록 저장한 JSON 해시를 결과에 포함
+        return {'count': count, 'sha256': file_hash(f"{prefix}.json")}
+
+    dag.stage('manual_data', manual_data, code=[seoul_tennis_manual_data.create_manual_tennis_data])
+    dag.stage('manual_export', export, inputs=['manual_data'], code=[court_exporter],
+              files=[f"{prefix}.json", f"{prefix}.csv", sheets_file])
+    if upload:
+        dag.stage('manual_upload', upload_stage(f"{prefix}.json"), inputs=['manual_export'],
+                  code=[load_uploader().upload_to_google_sheets])
+    return dag
+
+def build_scraper_pipeline(dag, upload=False, v2=False):
+    """수집 → 정리 → (상세 보완) → 저장 → 업로드 파이프라인을 구성합니다."""
+    import court_exporter
+    import facility_resolver
+    import period_index
+
+    if v2:
+        import seoul_tennis_scraper_v2 as module
+        scraper_class, prefix_name, name = module.SeoulTennisScraperV2, 'seoul_tennis_courts_v2', 'scraper_v2'
+    else:
+        import seoul_tennis_scraper as module
+        scraper_class, prefix_name, name = module.SeoulTennisScraper, 'seoul_tennis_courts', 'scraper'
+    prefix = os.path.join(SCRAPER_DIR, prefix_name)
+
+    def scrape():
+        scraper = scraper_class()
+        scraper.scrape_tennis_courts()
+        return scraper.tennis_courts
+
+    def clean(raw_courts):
+        scraper = scraper_class()
+        scraper.tennis_courts = [dict(court) for court in raw_courts]
+        scraper.clean_and_organize_data()
+        return scraper.tennis_courts
+
+    def enrich(courts):
+        import court_detail_enricher
+        import scraper_session
+        courts = [dict(court) for court in courts]
+        court_detail_enricher.CourtDetailEnricher(scraper_session.ResilientSession()).enrich(courts)
+        return courts
+
+    def export(courts):
+        scraper = scraper_class()
+        scraper.tennis_courts = courts
+        scraper.generate_summary()
+        count = court_exporter.export_courts(courts, prefix)
+        return {'count': count, 'sha256': file_hash(f"{prefix}.json")}
+
+    files = [f"{prefix}.json", f"{prefix}.csv"]
+
+    dag.stage(f'{name}_scrape', scrape, volatile=True)
+    dag.stage(f'{name}_clean', clean, inputs=[f'{name}_scrape'],
+              code=[module, facility_resolver])
+    last = f'{name}_clean'
+    if not v2:
+        import court_detail_enricher
+        dag.stage(f'{name}_enrich', enrich, inputs=[last],
+                  code=[court_detail_enricher.CourtDetailEnricher, period_index.add_period_fields])
+        last = f'{name}_enrich'
+    dag.stage(f'{name}_export', export, inputs=[last], code=[court_exporter], files=files)
+    if upload:
+        dag.stage(f'{name}_upload', upload_stage(f"{prefix}.json"), inputs=[f'{name}_export'],
+                  code=[load_uploader().upload_to_google_sheets])
+    return dag
+
+PIPELINES = {
+    'manual': lambda dag, upload: build_manual_pipeline(dag, upload),
+    'scraper': lambda dag, upload: build_scraper_pipeline(dag, upload),
+    'scraper_v2': lambda dag, upload: build_scraper_pipeline(dag, upload, v2=True),
+}
+
+def main():
+    parser = argparse.ArgumentParser(description='메모이즈 단계 DAG 파이프라인 실행')
+    parser.add_argument('pipelines', nargs='+', choices=sorted(PIPELINES))
+    parser.add_argument('--upload', action='store_true', help='구글 시트 업로드 단계 포함')
+    parser.add_argument('--force', nargs='*', default=[], help='캐시를 무시하고 다시 실행할 단계')
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    args = parser.parse_args()
+
+    dag = PipelineDAG(args.cache_dir)
+    for name in args.pipelines:
+        PIPELINES[name](dag, args.upload)
+    dag.run(force=set(args.force))
+
+if __name__ == "__main__":
+    main()
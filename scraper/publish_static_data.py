@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""웹 앱용 테니스장 데이터를 지역(구)별 샤드로 발행합니다.
+
+각 샤드는 내용 해시가 들어간 파일명의 최소화 JSON 입니다. 전송 압축은 Amplify CDN 이
+요청의 Accept-Encoding 에 맞춰 처리하므로 사전 압축본은 만들지 않습니다.
+클라이언트는 manifest.json 만 짧게 캐시하고, 샤드는 immutable 로 캐시할 수 있습니다.
+같은 디렉터리에 접수/이용 기간 인덱스(period_index.json)도 함께 발행합니다.
+
+    python scraper/publish_static_data.py --input scraper/seoul_tennis_courts_manual.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from period_index import build_period_indexes, period_indexes_to_dict
+
+SCRAPER_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INPUT = os.path.join(SCRAPER_DIR, 'seoul_tennis_courts_manual.json')
+DEFAULT_OUTPUT_DIR = os.path.join(SCRAPER_DIR, '..', 'public', 'data', 'courts')
+
+# 파일명에 쓸 구 이름 로마자 표기
+REGION_SLUGS = {
+    '강남구': 'gangnam', '강동구': 'gangdong', '강북구': 'gangbuk', '강서구': 'gangseo',
+    '관악구': 'gwanak', '광진구': 'gwangjin', '구로구': 'guro', '금천구': 'geumcheon',
+    '노원구': 'nowon', '도봉구': 'dobong', '동대문구': 'dongdaemun', '동작구': 'dongjak',
+    '마포구': 'mapo', '서대문구': 'seodaemun', '서초구': 'seocho', '성동구': 'seongdong',
+    '성북구': 'seongbuk', '송파구': 'songpa', '양천구': 'yangcheon', '영등포구': 'yeongdeungpo',
+    '용산구': 'yongsan', '은평구': 'eunpyeong', '종로구': 'jongno', '중구': 'jung',
+    '중랑구': 'jungnang',
+}
+
+def region_slug(region):
+    """구 이름을 파일명용 슬러그로 바꿉니다."""
+    if region in REGION_SLUGS:
+        return REGION_SLUGS[region]
+    return 'region-' + hashlib.sha1(region.encode('utf-8')).hexdigest()[:8] if region else 'unknown'
+
+def write_atomic(path, data):
+    """임시 파일에 쓴 뒤 이름을 바꿔 원자적으로 저장합니다."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+def write_shard(output_dir, slug, courts):
+    """샤드 하나를 쓰고 매니페스트 항목을 반환합니다."""
+    data = json.dumps(courts, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    content_hash = hashlib.sha256(data).hexdigest()[:12]
+    filename = f"{slug}.{content_hash}.json"
+    path = os.path.join(output_dir, filename)
+
+    # 같은 해시의 샤드가 이미 있으면 다시 쓰지 않음
+    if not os.path.exists(path):
+        write_atomic(path, data)
+
+    return {'file': filename, 'hash': content_hash, 'count': len(courts), 'bytes': len(data)}
+
+def publish_region_shards(courts, output_dir=DEFAULT_OUTPUT_DIR):
+    """코트 목록을 지역별 샤드와 매니페스트로 발행합니다."""
+    shard_dir = os.path.join(output_dir, 'shards')
+    os.makedirs(shard_dir, exist_ok=True)
+
+    # 지역별로 그룹화 (입력 순서 유지)
+    regions = {}
+    for court in courts:
+        regions.setdefault(court.get('region', ''), []).append(court)
+
+    entries = []
+    for region, region_courts in sorted(regions.items()):
+        entry = write_shard(shard_dir, region_slug(region), region_courts)
+        entry = {'region': region, 'slug': region_slug(region), **entry}
+        entry['file'] = f"shards/{entry['file']}"
+        entries.append(entry)
+        print(f"  {region}: {entry['count']}개, {entry['bytes']}B")
+
+    version = hashlib.sha256("".join(entry['hash'] for entry in entries).encode('utf-8')).hexdigest()[:12]
+    manifest = {
+        'version': version,
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'total_courts': len(courts),
+        'regions': entries,
+    }
+    write_atomic(
+        os.path.join(output_dir, 'manifest.json'),
+        json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'),
+    )
+
+    # 샤드와 같은 코트 목록의 기간 인덱스 (id 는 court_key)
+    period_indexes = build_period_indexes(courts)
+    write_atomic(
+        os.path.join(output_dir, 'period_index.json'),
+        json.dumps(period_indexes_to_dict(period_indexes), ensure_ascii=False, separators=(',', ':')).encode('utf-8'),
+    )
+
+    # 매니페스트에 없는 이전 샤드(예전 사전 압축본 포함) 정리
+    current = {os.path.basename(entry['file']) for entry in entries}
+    for filename in os.listdir(shard_dir):
+        if filename not in current:
+            os.remove(os.path.join(shard_dir, filename))
+
+    print(f"매니페스트 저장 완료: 지역 {len(entries)}개, 버전 {version}")
+    return manifest
+
+def main():
+    parser = argparse.ArgumentParser(description='지역별 테니스장 데이터 샤드 발행')
+    parser.add_argument('--input', default=DEFAULT_INPUT)
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR)
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        courts = json.load(f)
+
+    print(f"테니스장 데이터 {len(courts)}개 발행 중...")
+    publish_region_shards(courts, args.output_dir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import random
+import threading
+import time
+
+import requests
+
+from http_client import create_session, httpx
+
+# 재시도할 전송 계층 오류 (HTTP/2 httpx 클라이언트 사용 시 httpx 오류 포함)
+TRANSIENT_ERRORS = (requests.ConnectionError, requests.Timeout)
+if httpx is not None:
+    TRANSIENT_ERRORS += (httpx.TransportError,)
+
+class CircuitOpenError(Exception):
+    """업스트림 장애로 회로가 열려 요청을 보내지 않을 때 발생합니다."""
+
+class TokenBucket:
+    """관측된 지연과 응답 코드에 따라 속도를 조절하는 토큰 버킷입니다.
+
+    성공 시 가산 증가, 429/5xx 또는 목표 지연 초과 시 곱셈 감소(AIMD)합니다.
+    """
+
+    def __init__(self, rate=1.0, min_rate=0.2, max_rate=10.0, capacity=2.0, target_latency=2.0):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.capacity = capacity
+        self.target_latency = target_latency
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """토큰이 생길 때까지 기다린 뒤 하나를 소비합니다."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self, latency):
+        """정상 응답의 지연을 반영해 속도를 조절합니다."""
+        with self.lock:
+            if latency > self.target_latency:
+                self.rate = max(self.min_rate, self.rate * 0.7)
+            else:
+                self.rate = min(self.max_rate, self.rate + 0.1)
+
+    def on_throttle(self, retry_after=None):
+        """429/5xx 응답을 받으면 속도를 절반으로 줄입니다.
+
+        retry_after 가 있으면 토큰을 그만큼 비워, 이 버킷을 쓰는 모든 요청이 그 시간 동안 기다립니다.
+        """
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate * 0.5)
+            if retry_after:
+                self.tokens = min(self.tokens, 1 - retry_after * self.rate)
+
+class CircuitBreaker:
+    """연속 실패가 임계치를 넘으면 일정 시간 요청을 차단합니다.
+
+    차단 시간이 지나면 시험 요청 하나만 보내고, 그 결과가 나올 때까지 다른 요청은 계속 차단합니다.
+    시험 요청이 reset_timeout 안에 결과를 기록하지 못하면 다음 요청을 새 시험 요청으로 허용합니다.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started = 0.0
+        self.lock = threading.Lock()
+
+    def allow(self):
+        """요청을 보내도 되는지 확인합니다."""
+        with self.lock:
+            if self.state == self.CLOSED:
+                return
+            now = time.monotonic()
+            if self.state == self.OPEN and now - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError(f"회로 차단 중 (연속 실패 {self.failures}회)")
+            if self.state == self.HALF_OPEN and now - self.probe_started < self.reset_timeout:
+                raise CircuitOpenError("회로 차단 중 (시험 요청 진행 중)")
+            # 시험 요청 하나를 허용
+            self.state = self.HALF_OPEN
+            self.probe_started = now
+
+    def record_success(self):
+        with self.lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_throttle(self):
+        """429 응답을 기록합니다. 서버는 응답하고 있으므로 시험 요청이었다면 회로를 닫습니다.
+
+        속도 조절은 토큰 버킷이 Retry-After 에 맞춰 처리합니다.
+        """
+        with self.lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.CLOSED
+                self.failures = 0
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+class ResilientSession:
+    """속도 제한·재시도·회로 차단을 적용한 requests.Session 래퍼입니다.
+
+    headers 는 이 래퍼에만 속하며 요청마다 합쳐 보내므로, 공유 연결 풀 세션의 기본 헤더를 바꾸지 않습니다.
+    """
+
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+    def __init__(self, session=None, rate_limiter=None, circuit_breaker=None,
+                 max_retries=3, backoff_base=0.5, backoff_max=30.0, timeout=30):
+        self.session = session or create_session()
+        self.rate_limiter = rate_limiter or TokenBucket()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.headers = {}
+
+    @property
+    def metrics(self):
+        return getattr(self.session, 'metrics', None)
+
+    def backoff(self, attempt):
+        """지수 백오프에 full jitter 를 적용한 대기 시간을 계산합니다."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def retry_after(self, response):
+        """Retry-After 헤더(초 단위)를 읽습니다."""
+        value = response.headers.get('Retry-After', '')
+        return float(value) if value.isdigit() else None
+
+    def request(self, method, url, **kwargs):
+        """재시도와 회로 차단을 적용해 요청을 보냅니다."""
+        kwargs.setdefault('timeout', self.timeout)
+        kwargs['headers'] = {**self.headers, **(kwargs.get('headers') or {})}
+
+        for attempt in range(self.max_retries + 1):
+            self.circuit_breaker.allow()
+            self.rate_limiter.acquire()
+
+            started = time.monotonic()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except TRANSIENT_ERRORS as e:
+                self.circuit_breaker.record_failure()
+                self.rate_limiter.on_throttle()
+                if attempt == self.max_retries:
+                    raise
+                print(f"요청 실패, 재시도 {attempt + 1}/{self.max_retries}: {e}")
+                time.sleep(self.backoff(attempt))
+                continue
+
+            if response.status_code in self.RETRY_STATUS_CODES:
+                retry_after = self.retry_after(response)
+                if retry_after:
+                    retry_after = min(self.backoff_max, retry_after)
+                self.rate_limiter.on_throttle(retry_after)
+                if response.status_code >= 500:
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.record_throttle()
+                if attempt == self.max_retries:
+                    return response
+                print(f"HTTP {response.status_code}, 재시도 {attempt + 1}/{self.max_retries}: {url}")
+                # Retry-After 대기는 토큰 버킷이 다음 acquire 에서 적용하므로 여기서는 백오프만
+                if not retry_after:
+                    time.sleep(self.backoff(attempt))
+                continue
+
+            self.circuit_breaker.record_success()
+            self.rate_limiter.on_success(time.monotonic() - started)
+            return response
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
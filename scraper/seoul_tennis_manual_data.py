@@ -1,8 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
-import pandas as pd
+from court_exporter import CourtExporter, CsvSink, GoogleSheetsCsvSink, JsonArraySink, SHEETS_COLUMNS, pick
 
 def create_manual_tennis_data():
     """서울특별시 공공서비스예약 테니스장 데이터를 수동으로 정리합니다."""
@@ -420,72 +419,26 @@ def main():
     # 요약 정보 출력
     generate_summary(tennis_courts)
     
-    # JSON 파일로 저장
-    with open('seoul_tennis_courts_manual.json', 'w', encoding='utf-8') as f:
-        json.dump(tennis_courts, f, ensure_ascii=False, indent=2)
-    print(f"\nJSON 파일 저장 완료: seoul_tennis_courts_manual.json")
-    
-    # CSV 파일로 저장
-    df = pd.DataFrame(tennis_courts)
-    df.to_csv('seoul_tennis_courts_manual.csv', index=False, encoding='utf-8-sig')
-    print(f"CSV 파일 저장 완료: seoul_tennis_courts_manual.csv")
-    
-    # 구글 시트용 데이터 생성
-    create_google_sheets_data(tennis_courts)
+    # JSON, CSV, 구글 시트용 CSV 를 한 번의 순회로 저장
+    CourtExporter([
+        JsonArraySink('seoul_tennis_courts_manual.json'),
+        CsvSink('seoul_tennis_courts_manual.csv'),
+        GoogleSheetsCsvSink('seoul_tennis_courts_google_sheets.csv'),
+    ]).export(tennis_courts)
+    print_google_sheets_sample(tennis_courts)
     
     print("\n데이터 생성 완료!")
 
 def create_google_sheets_data(courts):
     """구글 시트용 데이터를 생성합니다."""
-    
-    # 시설별로 그룹화
-    facilities = {}
-    for court in courts:
-        facility_name = court['facility_name']
-        if facility_name not in facilities:
-            facilities[facility_name] = {
-                'facility_name': facility_name,
-                'region': court['region'],
-                'address': court['address'],
-                'phone': court['phone'],
-                'courts': []
-            }
-        
-        facilities[facility_name]['courts'].append({
-            'court_number': court['court_number'],
-            'time_period': court['time_period'],
-            'target': court['target'],
-            'reservation_method': court['reservation_method'],
-            'fee_info': court['fee_info'],
-            'description': court['description']
-        })
-    
-    # 구글 시트용 데이터 생성
-    google_sheets_data = []
-    
-    for facility_name, facility_data in facilities.items():
-        for court in facility_data['courts']:
-            google_sheets_data.append({
-                '시설명': facility_data['facility_name'],
-                '지역': facility_data['region'],
-                '주소': facility_data['address'],
-                '전화번호': facility_data['phone'],
-                '코트번호': court['court_number'],
-                '시간대': court['time_period'],
-                '이용대상': court['target'],
-                '예약방법': court['reservation_method'],
-                '요금정보': court['fee_info'],
-                '설명': court['description']
-            })
-    
-    # 구글 시트용 CSV 저장
-    df_sheets = pd.DataFrame(google_sheets_data)
-    df_sheets.to_csv('seoul_tennis_courts_google_sheets.csv', index=False, encoding='utf-8-sig')
-    print(f"구글 시트용 CSV 파일 저장 완료: seoul_tennis_courts_google_sheets.csv")
-    
-    # 샘플 데이터 출력
+    CourtExporter([GoogleSheetsCsvSink('seoul_tennis_courts_google_sheets.csv')]).export(courts)
+    print_google_sheets_sample(courts)
+
+def print_google_sheets_sample(courts):
+    """구글 시트용 샘플 데이터를 출력합니다."""
     print("\n구글 시트용 샘플 데이터 (처음 5개):")
-    for i, row in enumerate(google_sheets_data[:5]):
+    for i, court in enumerate(courts[:5]):
+        row = {column: pick(court, fields) for column, fields in SHEETS_COLUMNS}
         print(f"  {i+1}. {row['시설명']} - {row['코트번호']} ({row['시간대']})")
 
 if __name__ == "__main__":
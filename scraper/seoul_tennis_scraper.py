@@ -1,29 +1,66 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import requests
 from bs4 import BeautifulSoup
-import json
-import time
 import re
 from urllib.parse import urljoin, urlparse
-import pandas as pd
+
+from court_detail_enricher import CourtDetailEnricher
+from court_exporter import CourtExporter, CsvSink, JsonArraySink, export_courts
+from facility_resolver import FacilityResolver
+from item_fingerprint_cache import ItemFingerprintCache
+from period_index import add_period_fields
+from scraper_session import CircuitOpenError, ResilientSession
+from snapshot_log import SnapshotLog
+from yeyak_api_client import YeyakListApiClient
+
+# parse_court_item 의 결과 형식이 바뀌면 올려서 지문 캐시의 이전 파싱 결과를 무효화
+PARSER_VERSION = 2
 
 class SeoulTennisScraper:
-    def __init__(self):
-        self.base_url = "https://yeyak.seoul.go.kr"
-        self.session = requests.Session()
+    def __init__(self, base_url="https://yeyak.seoul.go.kr", session=None, mode='auto'):
+        self.base_url = base_url
+        self.mode = mode  # 'auto': JSON 우선 후 HTML 폴백, 'api': JSON 만, 'html': HTML 만
+        self.session = session or ResilientSession()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         self.tennis_courts = []
+        self.fingerprint_cache = ItemFingerprintCache()
         
     def scrape_tennis_courts(self):
         """테니스장 목록을 스크래핑합니다."""
         print("서울특별시 공공서비스예약 테니스장 데이터 수집 시작...")
         
+        # JSON 엔드포인트 우선 사용
+        if self.mode in ('auto', 'api'):
+            courts = self.scrape_from_api()
+            if courts is not None:
+                self.tennis_courts.extend(courts)
+                print(f"JSON 엔드포인트에서 {len(courts)}개 수집")
+                return
+            if self.mode == 'api':
+                return
+            print("HTML 파싱으로 전환합니다.")
+        
+        try:
+            soup = BeautifulSoup(self.fetch_first_page(), 'html.parser')
+            
+            # 테니스장 목록 추출
+            self.extract_tennis_courts(soup)
+            
+            # 페이지네이션 처리
+            self.handle_pagination(soup)
+            
+        except Exception as e:
+            print(f"스크래핑 중 오류 발생: {e}")
+            
+        self.fingerprint_cache.save()
+            
+    def fetch_first_page(self):
+        """검색 첫 페이지 HTML 을 가져옵니다."""
         # 테니스장 검색 페이지 URL
-        search_url = "https://yeyak.seoul.go.kr/web/search/selectPageListDetailSearchImg.do"
+        search_url = f"{self.base_url}/web/search/selectPageListDetailSearchImg.do"
         
         # 검색 파라미터 설정
         params = {
@@ -35,36 +72,47 @@ class SeoulTennisScraper:
             'pageSize': 1000  # 한 번에 많은 데이터 가져오기
         }
         
-        try:
-            response = self.session.get(search_url, params=params)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 테니스장 목록 추출
-            self.extract_tennis_courts(soup)
-            
-            # 페이지네이션 처리
-            self.handle_pagination(soup)
+        response = self.session.get(search_url, params=params)
+        response.raise_for_status()
+        return response.content
             
+    def scrape_from_api(self):
+        """목록 JSON 엔드포인트에서 테니스장 목록을 가져옵니다. 실패하면 None 을 반환합니다."""
+        try:
+            return YeyakListApiClient(self.session, self.base_url).fetch_all()
         except Exception as e:
-            print(f"스크래핑 중 오류 발생: {e}")
+            print(f"JSON 엔드포인트 오류: {e}")
+            return None
             
     def extract_tennis_courts(self, soup):
         """HTML에서 테니스장 정보를 추출합니다."""
+        self.tennis_courts.extend(self.parse_items(soup))
+        
+    def parse_items(self, soup):
+        """목록 페이지의 테니스장 아이템들을 파싱해 반환합니다."""
+        courts = []
+        
         # 테니스장 목록 컨테이너 찾기
         court_items = soup.find_all('div', class_='item')
         
         for item in court_items:
             try:
-                court_info = self.parse_court_item(item)
+                # 내용이 바뀌지 않은 아이템은 캐시된 파싱 결과 사용
+                fingerprint = self.fingerprint_cache.fingerprint(str(item), PARSER_VERSION, self.base_url)
+                court_info = self.fingerprint_cache.get(fingerprint)
+                if court_info is None:
+                    court_info = self.parse_court_item(item)
+                    if court_info:
+                        self.fingerprint_cache.put(fingerprint, court_info)
                 if court_info:
-                    self.tennis_courts.append(court_info)
+                    courts.append(court_info)
                     print(f"추출된 테니스장: {court_info['name']}")
             except Exception as e:
                 print(f"아이템 파싱 오류: {e}")
                 continue
                 
+        return courts
+                
     def parse_court_item(self, item):
         """개별 테니스장 아이템을 파싱합니다."""
         try:
@@ -122,6 +170,16 @@ class SeoulTennisScraper:
             if '무료' in detail_text:
                 fee_info = "무료"
                 
+            # 상세 페이지 링크 추출
+            link = item.find('a', href=True)
+            detail_url = ""
+            if link:
+                svc_id_match = re.search(r"(S\d{6,})", link['href'])
+                if link['href'].startswith('javascript') and svc_id_match:
+                    detail_url = f"{self.base_url}/web/reservation/selectReservView.do?rsv_svc_id={svc_id_match.group(1)}"
+                elif not link['href'].startswith('javascript'):
+                    detail_url = urljoin(self.base_url, link['href'])
+                
             court_info = {
                 'name': name,
                 'region': region,
@@ -132,10 +190,12 @@ class SeoulTennisScraper:
                 'use_period': use_period,
                 'reservation_method': reservation_method,
                 'fee_info': fee_info,
+                'detail_url': detail_url,
                 'detail_text': detail_text
             }
             
-            return court_info
+            # 접수/이용 기간을 날짜 구간으로 파싱
+            return add_period_fields(court_info)
             
         except Exception as e:
             print(f"파싱 오류: {e}")
@@ -143,6 +203,13 @@ class SeoulTennisScraper:
             
     def handle_pagination(self, soup):
         """페이지네이션을 처리합니다."""
+        for page_num in self.page_numbers(soup):
+            self.scrape_page(page_num)
+            
+    def page_numbers(self, soup):
+        """페이지네이션 링크에서 나머지 페이지 번호를 순서대로 반환합니다."""
+        page_nums = []
+        
         # 페이지 번호 찾기
         pagination = soup.find('div', class_='pagination') or soup.find('nav', class_='pagination')
         if pagination:
@@ -151,27 +218,33 @@ class SeoulTennisScraper:
                 if link.get_text(strip=True).isdigit():
                     page_num = int(link.get_text(strip=True))
                     if page_num > 1:  # 첫 페이지는 이미 처리됨
-                        self.scrape_page(page_num)
+                        page_nums.append(page_num)
+                        
+        return page_nums
+                        
+    def fetch_page(self, page_num):
+        """특정 목록 페이지 HTML 을 가져옵니다."""
+        search_url = f"{self.base_url}/web/search/selectPageListDetailSearchImg.do"
+        params = {
+            'code': 'T100',
+            'dCode': 'T108',
+            'pageIndex': page_num,
+            'pageSize': 1000
+        }
+        
+        response = self.session.get(search_url, params=params)
+        response.raise_for_status()
+        return response.content
                         
     def scrape_page(self, page_num):
         """특정 페이지를 스크래핑합니다."""
         try:
-            search_url = "https://yeyak.seoul.go.kr/web/search/selectPageListDetailSearchImg.do"
-            params = {
-                'code': 'T100',
-                'dCode': 'T108',
-                'pageIndex': page_num,
-                'pageSize': 1000
-            }
-            
-            response = self.session.get(search_url, params=params)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(self.fetch_page(page_num), 'html.parser')
             self.extract_tennis_courts(soup)
             
-            time.sleep(1)  # 요청 간격 조절
-            
+        except CircuitOpenError:
+            # 업스트림 장애 시 남은 페이지를 건너뛰고 수집 중단
+            raise
         except Exception as e:
             print(f"페이지 {page_num} 스크래핑 오류: {e}")
             
@@ -183,34 +256,45 @@ class SeoulTennisScraper:
         unique_courts = {}
         
         for court in self.tennis_courts:
-            # 기본 키 생성 (이름 + 지역)
-            key = f"{court['name']}_{court['region']}"
-            
-            if key not in unique_courts:
-                unique_courts[key] = court
-            else:
-                # 기존 데이터와 병합 (코트 번호가 다른 경우)
-                existing = unique_courts[key]
-                if court['court_number'] and court['court_number'] != existing['court_number']:
-                    # 여러 코트가 있는 경우
-                    if 'courts' not in existing:
-                        existing['courts'] = [existing['court_number']]
-                    if court['court_number'] not in existing['courts']:
-                        existing['courts'].append(court['court_number'])
+            self.merge_court(unique_courts, court)
                         
+        self.finalize_courts(unique_courts)
+        
+    def merge_court(self, unique_courts, court):
+        """코트 하나를 중복 제거 사전에 병합합니다. 입력 순서대로 호출해야 합니다."""
+        # 기본 키 생성 (이름 + 지역)
+        key = f"{court['name']}_{court['region']}"
+        
+        if key not in unique_courts:
+            unique_courts[key] = court
+        else:
+            # 기존 데이터와 병합 (코트 번호가 다른 경우)
+            existing = unique_courts[key]
+            if court['court_number'] and court['court_number'] != existing['court_number']:
+                # 여러 코트가 있는 경우
+                if 'courts' not in existing:
+                    existing['courts'] = [existing['court_number']]
+                if court['court_number'] not in existing['courts']:
+                    existing['courts'].append(court['court_number'])
+                    
+    def finalize_courts(self, unique_courts):
+        """중복 제거 결과를 목록으로 만들고 시설 ID 를 부여합니다."""
         self.tennis_courts = list(unique_courts.values())
         
+        # 표기가 다른 같은 시설을 하나의 시설 ID로 묶기
+        FacilityResolver().resolve(self.tennis_courts)
+        
     def save_to_json(self, filename='seoul_tennis_courts.json'):
         """JSON 파일로 저장합니다."""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.tennis_courts, f, ensure_ascii=False, indent=2)
-        print(f"JSON 파일 저장 완료: {filename}")
+        CourtExporter([JsonArraySink(filename)]).export(self.tennis_courts)
         
     def save_to_csv(self, filename='seoul_tennis_courts.csv'):
         """CSV 파일로 저장합니다."""
-        df = pd.DataFrame(self.tennis_courts)
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
-        print(f"CSV 파일 저장 완료: {filename}")
+        CourtExporter([CsvSink(filename)]).export(self.tennis_courts)
+        
+    def export(self, prefix='seoul_tennis_courts', github_api=False):
+        """JSON/CSV 파일(github_api 이면 GitHub API용 JSON 도)을 한 번의 순회로 저장합니다."""
+        export_courts(self.tennis_courts, prefix, github_api=github_api)
         
     def generate_summary(self):
         """데이터 요약 정보를 생성합니다."""
@@ -246,12 +330,18 @@ def main():
     # 데이터 정리
     scraper.clean_and_organize_data()
     
+    # 상세 페이지 정보 보완 (시설별 캐시)
+    CourtDetailEnricher(scraper.session).enrich(scraper.tennis_courts)
+    
     # 요약 정보 출력
     scraper.generate_summary()
     
     # 파일 저장
-    scraper.save_to_json()
-    scraper.save_to_csv()
+    scraper.export()
+    
+    # 실행 이력 보존 (추가 전용 스냅샷 로그)
+    with SnapshotLog() as snapshots:
+        snapshots.append_run(scraper.tennis_courts)
     
     print("\n스크래핑 완료!")
 
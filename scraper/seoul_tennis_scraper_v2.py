@@ -1,18 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import requests
-from bs4 import BeautifulSoup
-import json
-import time
+from bs4 import BeautifulSoup, Comment, NavigableString
 import re
 from urllib.parse import urljoin, urlparse
-import pandas as pd
+
+from court_exporter import CourtExporter, CsvSink, JsonArraySink, export_courts
+from facility_resolver import FacilityResolver
+from scraper_session import ResilientSession
 
 class SeoulTennisScraperV2:
-    def __init__(self):
-        self.base_url = "https://yeyak.seoul.go.kr"
-        self.session = requests.Session()
+    def __init__(self, base_url="https://yeyak.seoul.go.kr", session=None):
+        self.base_url = base_url
+        self.session = session or ResilientSession()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -28,7 +28,7 @@ class SeoulTennisScraperV2:
         print("서울특별시 공공서비스예약 테니스장 데이터 수집 시작...")
         
         # 직접 테니스장 검색 페이지 접근
-        search_url = "https://yeyak.seoul.go.kr/web/search/selectPageListDetailSearchImg.do"
+        search_url = f"{self.base_url}/web/search/selectPageListDetailSearchImg.do"
         
         # POST 요청으로 검색
         data = {
@@ -126,42 +126,56 @@ class SeoulTennisScraperV2:
         # 텍스트 기반으로 직접 검색
         self.extract_from_text(soup)
         
+    # 시설명 패턴 (한강공원/공원 테니스장을 먼저 시도하는 단일 정규식)
+    FACILITY_PATTERN = re.compile(
+        r'[가-힣]+(?:한강공원|공원)[^가-힣]*테니스장[^가-힣]*'
+        r'|[가-힣]+테니스장[^가-힣]*'
+    )
+    
+    def iter_facility_mentions(self, soup):
+        """텍스트 노드를 하나씩 훑으며 (시설명, 원본 노드) 쌍을 생성합니다."""
+        for node in soup.descendants:
+            if not isinstance(node, NavigableString) or isinstance(node, Comment):
+                continue
+            if node.parent is not None and node.parent.name in ('script', 'style'):
+                continue
+            if '테니스장' not in node:
+                continue
+            for match in self.FACILITY_PATTERN.finditer(node):
+                yield match.group(0).strip(), node
+                
     def extract_from_text(self, soup):
         """텍스트에서 직접 테니스장 정보를 추출합니다."""
         print("\n=== 텍스트 기반 추출 ===")
         
-        # 모든 텍스트 가져오기
-        full_text = soup.get_text()
+        # 같은 시설명은 한 번만 추가
+        seen = set()
         
-        # 테니스장 패턴 찾기
-        tennis_patterns = [
-            r'([가-힣]+테니스장[^가-힣]*)',
-            r'([가-힣]+한강공원[^가-힣]*테니스장[^가-힣]*)',
-            r'([가-힣]+공원[^가-힣]*테니스장[^가-힣]*)'
-        ]
-        
-        for pattern in tennis_patterns:
-            matches = re.findall(pattern, full_text)
-            print(f"패턴 '{pattern}' 매치 수: {len(matches)}")
+        for name, node in self.iter_facility_mentions(soup):
+            if not name or name in seen:
+                continue
+            seen.add(name)
             
-            for match in matches[:10]:  # 처음 10개만 출력
-                print(f"  - {match}")
-                
-                # 간단한 정보 추출
-                court_info = {
-                    'name': match.strip(),
-                    'region': self.extract_region(match),
-                    'court_number': self.extract_court_number(match),
-                    'time_period': self.extract_time_period(match),
-                    'target': '제한없음',
-                    'reservation_period': '',
-                    'use_period': '',
-                    'reservation_method': '온라인',
-                    'fee_info': '유료',
-                    'detail_text': match
-                }
+            if len(seen) <= 10:  # 처음 10개만 출력
+                print(f"  - {name}")
                 
-                self.tennis_courts.append(court_info)
+            # 간단한 정보 추출 (원본 노드 텍스트를 문맥으로 보관)
+            court_info = {
+                'name': name,
+                'region': self.extract_region(name),
+                'court_number': self.extract_court_number(name),
+                'time_period': self.extract_time_period(name),
+                'target': '제한없음',
+                'reservation_period': '',
+                'use_period': '',
+                'reservation_method': '온라인',
+                'fee_info': '유료',
+                'detail_text': node.strip()
+            }
+            
+            self.tennis_courts.append(court_info)
+            
+        print(f"텍스트 기반 시설 수: {len(seen)}")
                 
     def extract_region(self, text):
         """지역 정보를 추출합니다."""
@@ -224,11 +238,14 @@ class SeoulTennisScraperV2:
         """데이터를 정리하고 조직화합니다."""
         print("데이터 정리 중...")
         
-        # 중복 제거
+        # 표기가 다른 같은 시설(텍스트 추출 조각 포함)을 하나의 시설 ID로 묶기
+        FacilityResolver().resolve(self.tennis_courts)
+        
+        # 중복 제거 (시설 + 코트 번호 + 시간대 기준)
         unique_courts = {}
         
         for court in self.tennis_courts:
-            key = f"{court['name']}_{court['region']}"
+            key = f"{court['facility_id']}_{court['court_number']}_{court['time_period']}"
             if key not in unique_courts:
                 unique_courts[key] = court
                 
@@ -236,15 +253,15 @@ class SeoulTennisScraperV2:
         
     def save_to_json(self, filename='seoul_tennis_courts_v2.json'):
         """JSON 파일로 저장합니다."""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.tennis_courts, f, ensure_ascii=False, indent=2)
-        print(f"JSON 파일 저장 완료: {filename}")
+        CourtExporter([JsonArraySink(filename)]).export(self.tennis_courts)
         
     def save_to_csv(self, filename='seoul_tennis_courts_v2.csv'):
         """CSV 파일로 저장합니다."""
-        df = pd.DataFrame(self.tennis_courts)
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
-        print(f"CSV 파일 저장 완료: {filename}")
+        CourtExporter([CsvSink(filename)]).export(self.tennis_courts)
+        
+    def export(self, prefix='seoul_tennis_courts_v2'):
+        """JSON/CSV 파일을 한 번의 순회로 저장합니다."""
+        export_courts(self.tennis_courts, prefix)
         
     def generate_summary(self):
         """데이터 요약 정보를 생성합니다."""
@@ -290,8 +307,7 @@ def main():
     scraper.generate_summary()
     
     # 파일 저장
-    scraper.save_to_json()
-    scraper.save_to_csv()
+    scraper.export()
     
     print("\n스크래핑 완료!")
 
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""크롤링 결과를 덮어쓰지 않고 추가 전용 로그에 쌓아 과거 시점의 코트 정보를 조회합니다.
+
+로그(.log)는 [길이 u32][CRC32 u32][JSON] 형식의 레코드를 이어 붙인 파일이고,
+인덱스(.idx)는 (코트 키 해시, 실행 시각) 순으로 정렬된 고정 길이 항목 배열입니다.
+조회는 두 파일을 mmap 으로 열어 인덱스를 이진 탐색한 뒤 해당 레코드 하나만 읽으므로
+기록이 아무리 쌓여도 전체를 읽지 않습니다.
+
+어떤 실행 시점의 코트 값은 "그 시각 이하의 가장 최근 항목"입니다. 그래서 직전과 같은
+레코드를 지우는 압축(compact)을 해도 조회 결과는 바뀌지 않으며, 사라진 코트는 삭제 표시
+(길이 0 항목)로 기록합니다. 쓰기 프로세스는 하나라고 가정합니다.
+실행은 compact_every 회마다 자동으로 압축합니다.
+
+    python scraper/snapshot_log.py append --input scraper/seoul_tennis_courts.json
+    python scraper/snapshot_log.py get "한남테니스장 3번코트 주간_용산구" --at 2025-10-02T00:00
+    python scraper/snapshot_log.py compact
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zlib
+from datetime import datetime, timezone
+
+from court_keys import court_key
+from period_index import KST
+
+SCRAPER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+RECORD_HEADER = struct.Struct('<II')         # 길이, CRC32
+INDEX_HEADER = struct.Struct('<4sIQQ')       # 매직, 버전, 항목 수, 확정된 로그 크기
+INDEX_ENTRY = struct.Struct('<QqQII')        # 키 해시, 실행 시각(초), 오프셋, 길이(0=삭제), CRC32
+INDEX_MAGIC = b'SNPI'
+INDEX_VERSION = 1
+DEFAULT_COMPACT_EVERY = 10  # 실행 N 회마다 압축
+
+def key_hash(key):
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def to_timestamp(value):
+    """datetime/ISO 문자열/정수를 UTC 초로 변환합니다. 시간대가 없으면 서울 시각으로 봅니다."""
+    if value is None:
+        return int(datetime.now(timezone.utc).timestamp())
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=KST)
+    return int(value.timestamp())
+
+def format_timestamp(timestamp):
+    return datetime.fromtimestamp(timestamp, KST).isoformat(timespec='seconds')
+
+class IndexView:
+    """mmap 한 인덱스 항목을 (키 해시, 실행 시각) 시퀀스처럼 보이게 해 bisect 에 씁니다."""
+
+    def __init__(self, buffer, count):
+        self.buffer = buffer
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, position):
+        return self.entry(position)[:2]
+
+    def entry(self, position):
+        return INDEX_ENTRY.unpack_from(self.buffer, INDEX_HEADER.size + position * INDEX_ENTRY.size)
+
+    def __iter__(self):
+        for position in range(self.count):
+            yield self.entry(position)
+
+class SnapshotLog:
+    """추가 전용 스냅샷 로그와 오프셋 인덱스입니다."""
+
+    def __init__(self, path=os.path.join(SCRAPER_DIR, 'seoul_tennis_snapshots.log')):
+        self.path = path
+        self.index_path = f"{path}.idx"
+        self.runs_path = f"{path}.runs"
+        self.log_map = None
+        self.index_map = None
+        self.index = IndexView(b'', 0)
+        self.committed_size = 0
+        self.open()
+
+    # --- 열기/닫기 ---
+
+    def open(self):
+        """인덱스와 로그를 mmap 으로 엽니다. 인덱스에 반영되지 않은 로그 꼬리는 무시합니다."""
+        self.close()
+        if os.path.exists(self.index_path) and os.path.getsize(self.index_path) >= INDEX_HEADER.size:
+            with open(self.index_path, 'rb') as f:
+                self.index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, count, self.committed_size = INDEX_HEADER.unpack_from(self.index_map, 0)
+            if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                raise ValueError(f"스냅샷 인덱스 형식이 올바르지 않습니다: {self.index_path}")
+            self.index = IndexView(self.index_map, count)
+        if self.committed_size:
+            with open(self.path, 'rb') as f:
+                self.log_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        for buffer in (self.log_map, self.index_map):
+            if buffer is not None:
+                buffer.close()
+        self.log_map = None
+        self.index_map = None
+        self.index = IndexView(b'', 0)
+        self.committed_size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # --- 읽기 ---
+
+    def runs(self):
+        """기록된 실행 시각(UTC 초) 목록을 반환합니다."""
+        if not os.path.exists(self.runs_path):
+            return []
+        with open(self.runs_path, 'rb') as f:
+            data = f.read()
+        return [value for (value,) in struct.iter_unpack('<q', data)]
+
+    def read_record(self, offset, length, crc):
+        """로그에서 레코드 하나를 읽어 CRC 를 확인하고 {'key', 'court'} 를 반환합니다."""
+        stored_length, stored_crc = RECORD_HEADER.unpack_from(self.log_map, offset)
+        start = offset + RECORD_HEADER.size
+        payload = self.log_map[start:start + stored_length]
+        if stored_length != length or stored_crc != crc or zlib.crc32(payload) != crc:
+            raise ValueError(f"스냅샷 레코드가 손상되었습니다 (offset={offset})")
+        return json.loads(payload)
+
+    def lookup(self, key, run_at=None):
+        """run_at 시점(기본: 최신)의 인덱스 항목을 반환합니다. 없거나 삭제됐으면 None."""
+        target = key_hash(key)
+        timestamp = to_timestamp(run_at) if run_at is not None else 2 ** 62
+        position = bisect.bisect_right(self.index, (target, timestamp)) - 1
+        if position < 0:
+            return None
+        entry = self.index.entry(position)
+        if entry[0] != target or entry[3] == 0:
+            return None
+        return entry
+
+    def get(self, key, run_at=None):
+        """코트 키의 run_at 시점 레코드를 반환합니다."""
+        entry = self.lookup(key, run_at)
+        if entry is None:
+            return None
+        record = self.read_record(entry[2], entry[3], entry[4])
+        return record['court'] if record['key'] == key else None
+
+    def history(self, key):
+        """코트 키의 변경 이력 [(실행 시각, 레코드 또는 None)] 을 반환합니다."""
+        target = key_hash(key)
+        position = bisect.bisect_left(self.index, (target, -2 ** 62))
+        versions = []
+        while position < len(self.index):
+            entry = self.index.entry(position)
+            if entry[0] != target:
+                break
+            court = self.read_record(entry[2], entry[3], entry[4])['court'] if entry[3] else None
+            versions.append((entry[1], court))
+            position += 1
+        return versions
+
+    # --- 쓰기 ---
+
+    def latest_entries(self):
+        """키별 마지막 인덱스 항목을 {키 해시: 항목} 으로 반환합니다."""
+        latest = {}
+        for entry in self.index:
+            latest[entry[0]] = entry
+        return latest
+
+    def append_run(self, courts, run_at=None, compact_every=DEFAULT_COMPACT_EVERY):
+        """크롤링 결과 하나를 로그에 추가하고 인덱스를 갱신합니다. 실행 시각을 반환합니다.
+
+        실행 시각이 이전 실행보다 늦지 않으면(같은 초에 두 번 실행 등) 이전 실행 + 1초로 기록하며,
+        compact_every 회 실행마다 압축합니다(0 이면 압축하지 않음).
+        """
+        timestamp = to_timestamp(run_at)
+        runs = self.runs()
+        if runs and timestamp <= runs[-1]:
+            print(f"실행 시각 {format_timestamp(timestamp)} 이 이전 실행 이후가 아니어서 1초 뒤로 기록합니다.")
+            timestamp = runs[-1] + 1
+
+        new_entries = {}
+        with open(self.path, 'ab') as log:
+            # 인덱스에 반영되지 않은 꼬리(중단된 기록)는 잘라냄
+            log.truncate(self.committed_size)
+            log.seek(self.committed_size)
+            offset = self.committed_size
+            for court in courts:
+                key = court_key(court)
+                payload = json.dumps({'key': key, 'court': court}, ensure_ascii=False,
+                                     sort_keys=True, separators=(',', ':')).encode('utf-8')
+                crc = zlib.crc32(payload)
+                log.write(RECORD_HEADER.pack(len(payload), crc))
+                log.write(payload)
+                new_entries[key_hash(key)] = (key_hash(key), timestamp, offset, len(payload), crc)
+                offset += RECORD_HEADER.size + len(payload)
+            log.flush()
+            os.fsync(log.fileno())
+
+        # 이번 실행에 없는 코트는 삭제 표시
+        for hashed, entry in self.latest_entries().items():
+            if hashed not in new_entries and entry[3] != 0:
+                new_entries[hashed] = (hashed, timestamp, 0, 0, 0)
+
+        self.write_index(self.merged_entries(sorted(new_entries.values())), offset)
+        with open(self.runs_path, 'ab') as f:
+            f.write(struct.pack('<q', timestamp))
+        self.open()
+        print(f"스냅샷 추가: {format_timestamp(timestamp)}, 레코드 {len(courts)}개")
+
+        if compact_every and (len(runs) + 1) % compact_every == 0:
+            self.compact()
+        return timestamp
+
+    def merged_entries(self, new_entries):
+        """기존 인덱스(정렬됨)와 새 항목(정렬됨)을 병합하며 순서대로 내보냅니다."""
+        existing = iter(self.index)
+        current = next(existing, None)
+        for entry in new_entries:
+            while current is not None and current[:2] < entry[:2]:
+                yield current
+                current = next(existing, None)
+            yield entry
+        while current is not None:
+            yield current
+            current = next(existing, None)
+
+    def write_index(self, entries, log_size, replace=True):
+        """정렬된 항목으로 인덱스 임시 파일을 쓰고, replace 이면 원자적으로 교체합니다."""
+        temp_path = f"{self.index_path}.tmp"
+        count = 0
+        with open(temp_path, 'wb') as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, 0, log_size))
+            for entry in entries:
+                f.write(INDEX_ENTRY.pack(*entry))
+                count += 1
+            f.seek(0)
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, count, log_size))
+            f.flush()
+            os.fsync(f.fileno())
+        if replace:
+            os.replace(temp_path, self.index_path)
+        return temp_path
+
+    def compact(self):
+        """직전 항목과 내용이 같은 레코드와 연속된 삭제 표시를 제거해 로그를 다시 씁니다."""
+        kept = []
+        previous = None
+        for entry in self.index:
+            if previous is None or previous[0] != entry[0]:
+                # 키의 첫 항목: 삭제 표시로 시작할 이유가 없음
+                if entry[3]:
+                    kept.append(entry)
+                    previous = entry
+                else:
+                    previous = None
+                continue
+            if entry[3] == 0:
+                if previous[3] != 0:
+                    kept.append(entry)
+                    previous = entry
+                continue
+            if previous[3] == 0 or not self.same_payload(previous, entry):
+                kept.append(entry)
+                previous = entry
+
+        # 로그에는 원래 기록 순서대로 복사
+        records = sorted((entry for entry in kept if entry[3]), key=lambda entry: entry[2])
+        temp_path = f"{self.path}.tmp"
+        new_offsets = {}
+        offset = 0
+        with open(temp_path, 'wb') as log:
+            for entry in records:
+                size = RECORD_HEADER.size + entry[3]
+                log.write(self.log_map[entry[2]:entry[2] + size])
+                new_offsets[entry[2]] = offset
+                offset += size
+            log.flush()
+            os.fsync(log.fileno())
+
+        before_entries, before_size = len(self.index), self.committed_size
+        compacted = [
+            (entry[0], entry[1], new_offsets[entry[2]] if entry[3] else 0, entry[3], entry[4])
+            for entry in kept
+        ]
+        index_temp_path = self.write_index(compacted, offset, replace=False)
+        self.close()
+        # 새 로그와 인덱스를 모두 쓴 뒤 연달아 교체 (그 사이 중단되면 CRC 검사로 드러남)
+        os.replace(temp_path, self.path)
+        os.replace(index_temp_path, self.index_path)
+        self.open()
+        print(f"압축 완료: 항목 {before_entries}개 → {len(compacted)}개, 로그 {before_size:,}B → {offset:,}B")
+
+    def same_payload(self, first, second):
+        if first[3] != second[3] or first[4] != second[4]:
+            return False
+        size = RECORD_HEADER.size + first[3]
+        return self.log_map[first[2]:first[2] + size] == self.log_map[second[2]:second[2] + size]
+
+def main():
+    parser = argparse.ArgumentParser(description='테니스장 스냅샷 로그')
+    parser.add_argument('--log', default=os.path.join(SCRAPER_DIR, 'seoul_tennis_snapshots.log'))
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    append_parser = subparsers.add_parser('append', help='크롤링 결과 추가')
+    append_parser.add_argument('--input', default=os.path.join(SCRAPER_DIR, 'seoul_tennis_courts.json'))
+    append_parser.add_argument('--at', help='실행 시각 (ISO, 기본: 현재)')
+    append_parser.add_argument('--compact-every', type=int, default=DEFAULT_COMPACT_EVERY,
+                               help='N 회 실행마다 압축 (0: 압축 안 함)')
+
+    get_parser = subparsers.add_parser('get', help='과거 시점 코트 조회')
+    get_parser.add_argument('key', help='코트 키 (이름_지역)')
+    get_parser.add_argument('--at', help='조회 시각 (ISO, 기본: 최신)')
+
+    history_parser = subparsers.add_parser('history', help='코트 변경 이력')
+    history_parser.add_argument('key')
+
+    subparsers.add_parser('compact', help='변경 없는 레코드 제거')
+    subparsers.add_parser('runs', help='실행 목록')
+    args = parser.parse_args()
+
+    with SnapshotLog(args.log) as log:
+        if args.command == 'append':
+            with open(args.input, 'r', encoding='utf-8') as f:
+                courts = json.load(f)
+            log.append_run(courts, args.at, args.compact_every)
+        elif args.command == 'get':
+            court = log.get(args.key, args.at)
+            print(json.dumps(court, ensure_ascii=False, indent=2) if court else "해당 시점의 기록이 없습니다.")
+        elif args.command == 'history':
+            for timestamp, court in log.history(args.key):
+                print(f"{format_timestamp(timestamp)}: {'삭제됨' if court is None else json.dumps(court, ensure_ascii=False)}")
+        elif args.command == 'compact':
+            log.compact()
+        elif args.command == 'runs':
+            for timestamp in log.runs():
+                print(format_timestamp(timestamp))
+
+if __name__ == "__main__":
+    main()
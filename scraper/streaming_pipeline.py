@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""목록 페이지 수집 → 파싱 → 중복 제거를 크기 제한 큐로 연결해 겹쳐 실행합니다.
+
+가져오기 스레드들이 페이지를 받는 동안 파싱 스레드가 앞서 받은 페이지를 파싱하고,
+중복 제거 단계는 페이지 순번대로 다시 정렬해 순차 실행과 같은 순서로 병합합니다.
+아직 병합되지 않은 페이지 수는 window 로 제한되어 느린 페이지가 있어도 메모리가 늘지 않습니다.
+
+시설 ID 부여(FacilityResolver)와 파일 저장은 전체 목록이 있어야 하므로 중복 제거가 끝난 뒤 실행되며,
+결과 파일은 순차 실행과 바이트 단위로 같습니다. JSON 엔드포인트는 보통 한 번의 요청으로 끝나므로
+auto 모드에서 JSON 이 성공하면 기존 경로를 그대로 사용하고, HTML 페이지 수집만 파이프라인으로 실행합니다.
+
+    python scraper/streaming_pipeline.py
+    python scraper/streaming_pipeline.py --benchmark --latency 0.2
+"""
+
+import argparse
+import filecmp
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+
+from bs4 import BeautifulSoup
+
+from court_detail_enricher import CourtDetailEnricher
+from court_exporter import CourtExporter, JsonArraySink
+from item_fingerprint_cache import ItemFingerprintCache
+from scraper_session import CircuitOpenError, ResilientSession, TokenBucket
+from seoul_tennis_scraper import SeoulTennisScraper
+
+STOP = object()
+
+class MonitoredQueue(queue.Queue):
+    """넣을 때마다 대기열 길이를 기록하는 크기 제한 큐입니다."""
+
+    def __init__(self, name, maxsize):
+        super().__init__(maxsize)
+        self.name = name
+        self.puts = 0
+        self.depth_total = 0
+        self.max_depth = 0
+        self.blocked_seconds = 0.0
+
+    def put(self, item, block=True, timeout=None):
+        started = time.perf_counter()
+        super().put(item, block, timeout)
+        depth = self.qsize()
+        with self.mutex:
+            self.blocked_seconds += time.perf_counter() - started
+            self.puts += 1
+            self.depth_total += depth
+            self.max_depth = max(self.max_depth, depth)
+
+    def stats(self):
+        return {
+            'capacity': self.maxsize,
+            'items': self.puts,
+            'max_depth': self.max_depth,
+            'avg_depth': round(self.depth_total / self.puts, 2) if self.puts else 0,
+            'producer_blocked_seconds': round(self.blocked_seconds, 3),
+        }
+
+class StreamingScrapePipeline:
+    """SeoulTennisScraper 의 HTML 목록 수집을 단계별 스레드로 겹쳐 실행합니다."""
+
+    def __init__(self, scraper, fetch_workers=4, parse_workers=1, queue_size=8, window=16):
+        self.scraper = scraper
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers
+        self.window = threading.Semaphore(window)
+        self.page_queue = MonitoredQueue('fetch', 0)
+        self.parse_queue = MonitoredQueue('parse', queue_size)
+        self.dedup_queue = MonitoredQueue('dedup', queue_size)
+        self.stopped = threading.Event()
+        self.stage_seconds = {'fetch': 0.0, 'parse': 0.0, 'dedup': 0.0}
+        self.stage_lock = threading.Lock()
+
+    def add_stage_time(self, stage, seconds):
+        with self.stage_lock:
+            self.stage_seconds[stage] += seconds
+
+    def fetch_worker(self):
+        while True:
+            # 작업을 꺼내기 전에 자리를 확보해야, 가장 앞 순번 페이지가 자리를 기다리다 막히지 않음
+            self.window.acquire()
+            task = self.page_queue.get()
+            if task is STOP:
+                self.window.release()
+                return
+            sequence, page_num = task
+            started = time.perf_counter()
+            content, error = None, None
+            if not self.stopped.is_set():
+                try:
+                    content = self.scraper.fetch_page(page_num)
+                except Exception as e:
+                    error = e
+            self.add_stage_time('fetch', time.perf_counter() - started)
+            self.parse_queue.put((sequence, page_num, content, error))
+
+    def parse_worker(self):
+        while True:
+            task = self.parse_queue.get()
+            if task is STOP:
+                return
+            sequence, page_num, content, error = task
+            started = time.perf_counter()
+            courts = []
+            if content is not None and not self.stopped.is_set():
+                try:
+                    courts = self.scraper.parse_items(BeautifulSoup(content, 'html.parser'))
+                except Exception as e:
+                    error = e
+            self.add_stage_time('parse', time.perf_counter() - started)
+            self.dedup_queue.put((sequence, page_num, courts, error))
+
+    def merge_in_order(self, page_count, unique_courts):
+        """파싱된 페이지를 순번대로 모아 병합합니다. 회로 차단 시 그 앞 페이지까지만 병합합니다."""
+        pending = {}
+        next_sequence = 0
+        while next_sequence < page_count:
+            sequence, page_num, courts, error = self.dedup_queue.get()
+            pending[sequence] = (page_num, courts, error)
+            while next_sequence in pending:
+                page_num, courts, error = pending.pop(next_sequence)
+                next_sequence += 1
+                self.window.release()
+                if self.stopped.is_set():
+                    continue
+                if isinstance(error, CircuitOpenError):
+                    # 순차 실행처럼 남은 페이지를 버리고 수집 중단
+                    print(f"스크래핑 중 오류 발생: {error}")
+                    self.stopped.set()
+                    continue
+                if error is not None:
+                    print(f"페이지 {page_num} 스크래핑 오류: {error}")
+                started = time.perf_counter()
+                for court in courts:
+                    self.scraper.merge_court(unique_courts, court)
+                self.add_stage_time('dedup', time.perf_counter() - started)
+
+    def run(self):
+        """목록을 수집·정리해 scraper.tennis_courts 를 채우고 반환합니다."""
+        scraper = self.scraper
+        print("서울특별시 공공서비스예약 테니스장 데이터 수집 시작... (파이프라인 모드)")
+
+        if scraper.mode in ('auto', 'api'):
+            courts = scraper.scrape_from_api()
+            if courts is not None or scraper.mode == 'api':
+                scraper.tennis_courts.extend(courts or [])
+                scraper.clean_and_organize_data()
+                return scraper.tennis_courts
+            print("HTML 파싱으로 전환합니다.")
+
+        unique_courts = {}
+        for court in scraper.tennis_courts:
+            scraper.merge_court(unique_courts, court)
+
+        try:
+            soup = BeautifulSoup(scraper.fetch_first_page(), 'html.parser')
+            for court in scraper.parse_items(soup):
+                scraper.merge_court(unique_courts, court)
+            page_nums = scraper.page_numbers(soup)
+        except Exception as e:
+            print(f"스크래핑 중 오류 발생: {e}")
+            page_nums = []
+
+        for sequence, page_num in enumerate(page_nums):
+            self.page_queue.put((sequence, page_num))
+
+        threads = [threading.Thread(target=self.fetch_worker, daemon=True) for _ in range(self.fetch_workers)]
+        threads += [threading.Thread(target=self.parse_worker, daemon=True) for _ in range(self.parse_workers)]
+        for _ in range(self.fetch_workers):
+            self.page_queue.put(STOP)
+        for thread in threads:
+            thread.start()
+
+        self.merge_in_order(len(page_nums), unique_courts)
+
+        for _ in range(self.parse_workers):
+            self.parse_queue.put(STOP)
+        for thread in threads:
+            thread.join()
+
+        scraper.fingerprint_cache.save()
+        print("데이터 정리 중...")
+        scraper.finalize_courts(unique_courts)
+        return scraper.tennis_courts
+
+    def stats(self):
+        """단계별 큐 길이와 처리 시간 통계를 반환합니다."""
+        return {
+            'queues': {q.name: q.stats() for q in (self.parse_queue, self.dedup_queue)},
+            'stage_seconds': {stage: round(seconds, 3) for stage, seconds in self.stage_seconds.items()},
+        }
+
+    def print_stats(self):
+        stats = self.stats()
+        print("\n=== 파이프라인 단계별 통계 ===")
+        for name, queue_stats in stats['queues'].items():
+            print(f"  {name} 큐: {queue_stats}")
+        print(f"  단계별 누적 처리 시간(초): {stats['stage_seconds']}")
+
+def run_benchmark(latency, copies, page_size, fetch_workers, rate):
+    """로컬 대역 서버로 순차 실행과 파이프라인 실행을 비교하고 결과 파일이 같은지 확인합니다.
+
+    기본 속도 제한(초당 1건에서 시작)은 실제 사이트 보호용이므로, 두 실행 모두 rate 로 고정한
+    토큰 버킷을 써서 단계 겹침 효과만 비교합니다.
+    """
+    from local_standin_server import LocalStandInServer
+    from seoul_tennis_manual_data import create_manual_tennis_data
+
+    courts = []
+    for copy in range(copies):
+        for court in create_manual_tennis_data():
+            courts.append({**court, 'facility_name': f"{court['facility_name']}{copy}"})
+
+    work_dir = tempfile.mkdtemp(prefix='streaming_benchmark_')
+    outputs = {}
+    try:
+        with LocalStandInServer(courts=courts, page_size=page_size, latency=latency, api_mode='html') as server:
+            print(f"대역 서버: 코트 {len(courts)}개, 페이지 {server.page_count()}개, 요청 지연 {latency}초")
+
+            for label in ('sequential', 'pipelined'):
+                session = ResilientSession(rate_limiter=TokenBucket(rate=rate, max_rate=rate, capacity=fetch_workers))
+                scraper = SeoulTennisScraper(base_url=server.url, session=session, mode='html')
+                scraper.fingerprint_cache = ItemFingerprintCache(os.path.join(work_dir, f"{label}_fingerprints.json"))
+                started = time.perf_counter()
+                if label == 'sequential':
+                    scraper.scrape_tennis_courts()
+                    scraper.clean_and_organize_data()
+                else:
+                    pipeline = StreamingScrapePipeline(scraper, fetch_workers=fetch_workers)
+                    pipeline.run()
+                elapsed = time.perf_counter() - started
+
+                outputs[label] = os.path.join(work_dir, f"{label}.json")
+                CourtExporter([JsonArraySink(outputs[label])]).export(scraper.tennis_courts)
+                print(f"{label}: {elapsed:.2f}초, 코트 {len(scraper.tennis_courts)}개")
+
+        pipeline.print_stats()
+        same = filecmp.cmp(outputs['sequential'], outputs['pipelined'], shallow=False)
+        print(f"\n결과 파일 동일 여부: {'동일' if same else '다름'}")
+        return same
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+def main():
+    parser = argparse.ArgumentParser(description='파이프라인 모드 테니스장 수집')
+    parser.add_argument('--base-url', default="https://yeyak.seoul.go.kr")
+    parser.add_argument('--mode', default='auto', choices=['auto', 'api', 'html'])
+    parser.add_argument('--fetch-workers', type=int, default=4)
+    parser.add_argument('--queue-size', type=int, default=8)
+    parser.add_argument('--benchmark', action='store_true', help='로컬 대역 서버로 순차 실행과 비교')
+    parser.add_argument('--latency', type=float, default=0.2, help='벤치마크 요청 지연(초)')
+    parser.add_argument('--copies', type=int, default=10, help='벤치마크 데이터 배수')
+    parser.add_argument('--page-size', type=int, default=10, help='벤치마크 페이지 크기')
+    parser.add_argument('--rate', type=float, default=20.0, help='벤치마크 초당 요청 수 제한')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        if not run_benchmark(args.latency, args.copies, args.page_size, args.fetch_workers, args.rate):
+            raise SystemExit(1)
+        return
+
+    scraper = SeoulTennisScraper(base_url=args.base_url, mode=args.mode)
+    pipeline = StreamingScrapePipeline(scraper, fetch_workers=args.fetch_workers, queue_size=args.queue_size)
+    pipeline.run()
+    pipeline.print_stats()
+
+    CourtDetailEnricher(scraper.session).enrich(scraper.tennis_courts)
+    scraper.generate_summary()
+    scraper.export()
+
+    print("\n스크래핑 완료!")
+
+if __name__ == "__main__":
+    main()
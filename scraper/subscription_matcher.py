@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""테니스장 변경 알림 구독을 색인해 바뀐 코트와 관련된 구독자만 찾습니다.
+
+구독은 regions / facilities / time_periods 조건(각각 값 목록, 비우면 전체)을 가집니다.
+시설 조건은 facility_resolver 의 정규화 시설명으로 비교하므로, facility_name 이 없는 수집 레코드
+('한남테니스장 3번코트 주간(용산구)')도 '한남테니스장' 구독에 매칭됩니다.
+조건 차원별 역색인에서 바뀐 코트의 값에 해당하는 구독만 꺼내 만족한 조건 수를 세므로
+비용이 (구독자 수 × 변경 수) 가 아니라 실제로 관련된 구독 수에 비례합니다.
+
+    python scraper/subscription_matcher.py --old old.json --new new.json --subscriptions subs.json
+    python scraper/subscription_matcher.py --benchmark 100000
+"""
+
+import argparse
+import json
+import random
+import time
+from collections import defaultdict
+
+from court_keys import court_key
+from facility_resolver import display_facility_name, normalize_facility_name
+
+# 선택도가 높은 차원부터. 구독은 처음으로 조건이 있는 차원 하나에만 색인됩니다.
+DIMENSIONS = {
+    'facilities': 'facility_name',
+    'regions': 'region',
+    'time_periods': 'time_period',
+}
+
+def court_facility(court):
+    """표시용 시설명. 수집 레코드처럼 facility_name 이 없으면 목록 제목에서 코트 번호·시간대를 뺍니다."""
+    return court.get('facility_name') or display_facility_name(court.get('name', ''))
+
+def court_values(court):
+    """구독 조건과 비교할 코트 필드 값을 모읍니다. 시설은 정규화 시설명입니다."""
+    values = {field: court.get(field, '') for field in DIMENSIONS.values()}
+    values['facility_name'] = normalize_facility_name(court_facility(court))
+    return values
+
+def subscription_values(subscription, dimension):
+    """구독 조건 값 집합. 시설 조건은 코트와 같은 방식으로 정규화합니다."""
+    values = subscription.get(dimension) or ()
+    if dimension == 'facilities':
+        return {normalize_facility_name(value) for value in values}
+    return set(values)
+
+def diff_courts(old_courts, new_courts):
+    """두 수집 결과를 비교해 (변경 유형, 코트) 목록을 반환합니다."""
+    old_by_key = {court_key(court): court for court in old_courts}
+    new_by_key = {court_key(court): court for court in new_courts}
+
+    changes = []
+    for key, court in new_by_key.items():
+        if key not in old_by_key:
+            changes.append(('added', court))
+        elif old_by_key[key] != court:
+            changes.append(('updated', court))
+    for key, court in old_by_key.items():
+        if key not in new_by_key:
+            changes.append(('removed', court))
+    return changes
+
+class SubscriptionIndex:
+    """구독을 가장 선택도가 높은 조건 하나로 색인하고 나머지 조건은 후보에서 확인합니다.
+
+    시설 조건이 있는 구독은 시설 색인에, 없으면 지역, 그다음 시간대 색인에 들어가고
+    조건이 하나도 없는 구독은 모든 변경에 매칭됩니다. 구독은 내부적으로 추가 순서 번호로 다룹니다.
+    """
+
+    def __init__(self, subscriptions=()):
+        self.subscriptions = []
+        self.predicates = []
+        self.postings = {dimension: defaultdict(list) for dimension in DIMENSIONS}
+        self.match_all = []
+        for subscription in subscriptions:
+            self.add(subscription)
+
+    def add(self, subscription):
+        """구독 하나를 색인에 추가합니다. {'id', 'user_id', 'regions', 'facilities', 'time_periods'}"""
+        number = len(self.subscriptions)
+        self.subscriptions.append(subscription)
+
+        # (코트 필드, 허용값 집합) 목록. 색인에 쓴 첫 조건은 확인할 필요가 없으므로 제외
+        predicates = []
+        indexed = False
+        for dimension, field in DIMENSIONS.items():
+            values = subscription_values(subscription, dimension)
+            if not values:
+                continue
+            if indexed:
+                predicates.append((field, values))
+                continue
+            for value in values:
+                self.postings[dimension][value].append(number)
+            indexed = True
+        self.predicates.append(predicates)
+        if not indexed:
+            self.match_all.append(number)
+
+    def match(self, court):
+        """코트와 관련된 구독 번호 목록을 반환합니다."""
+        values = court_values(court)
+
+        predicates = self.predicates
+        matched = []
+        for dimension, field in DIMENSIONS.items():
+            for number in self.postings[dimension].get(values[field], ()):
+                if all(values[other] in allowed for other, allowed in predicates[number]):
+                    matched.append(number)
+        return matched + self.match_all
+
+class SubscriptionMatcher:
+    """수집 결과의 변경분을 구독자별 알림 묶음으로 만듭니다."""
+
+    def __init__(self, subscriptions, max_courts_per_notification=20):
+        self.index = SubscriptionIndex(subscriptions)
+        self.max_courts_per_notification = max_courts_per_notification
+
+    def match_changes(self, changes):
+        """(변경 유형, 코트) 목록을 사용자별 알림 페이로드 목록으로 묶습니다."""
+        subscriptions = self.index.subscriptions
+        items = []
+        # 사용자 → {변경 번호: 구독 ID}. 같은 코트가 여러 구독에 걸리면 한 번만 알림
+        per_user = defaultdict(dict)
+        for change_type, court in changes:
+            change_number = len(items)
+            items.append({
+                'change': change_type,
+                'court_key': court_key(court),
+                'facility_name': court_facility(court),
+                'region': court.get('region', ''),
+                'time_period': court.get('time_period', ''),
+            })
+            for number in self.index.match(court):
+                subscription = subscriptions[number]
+                per_user[subscription['user_id']].setdefault(change_number, subscription['id'])
+
+        payloads = []
+        size = self.max_courts_per_notification
+        for user_id, matched in per_user.items():
+            change_numbers = list(matched)
+            for start in range(0, len(change_numbers), size):
+                batch = change_numbers[start:start + size]
+                payloads.append({
+                    'userId': user_id,
+                    'title': '관심 테니스장 정보 변경',
+                    'body': self.summarize([items[number] for number in batch]),
+                    'tag': 'court-change',
+                    'data': {
+                        'changes': [items[number] for number in batch],
+                        'subscriptionIds': [matched[number] for number in batch],
+                    },
+                })
+        return payloads
+
+    def summarize(self, batch):
+        first = batch[0]
+        if len(batch) == 1:
+            return f"{first['facility_name']} ({first['region']}) 정보가 변경되었습니다."
+        return f"{first['facility_name']} 외 {len(batch) - 1}곳의 정보가 변경되었습니다."
+
+def synthetic_subscriptions(count, regions, facilities, time_periods, seed=0):
+    """벤치마크용 구독 목록을 만듭니다."""
+    rng = random.Random(seed)
+    subscriptions = []
+    for index in range(count):
+        subscription = {'id': f"sub{index}", 'user_id': f"user{index % (count // 2 or 1)}"}
+        # 대부분 동네 1~2곳을 지정하고, 일부는 특정 시설/시간대까지 좁힘
+        if rng.random() < 0.98:
+            subscription['regions'] = rng.sample(regions, rng.randint(1, 2))
+        if rng.random() < 0.4:
+            subscription['facilities'] = rng.sample(facilities, rng.randint(1, 3))
+        if rng.random() < 0.6:
+            subscription['time_periods'] = rng.sample(time_periods, 1)
+        subscriptions.append(subscription)
+    return subscriptions
+
+def benchmark(subscriber_count, change_count=1000, seed=0):
+    """합성 구독자/변경 집합으로 색인 매칭과 전수 비교를 비교합니다."""
+    rng = random.Random(seed)
+    regions = [f"{name}구" for name in '강남 강동 강북 강서 관악 광진 구로 금천 노원 도봉 동대문 동작 마포 서대문 '
+               '서초 성동 성북 송파 양천 영등포 용산 은평 종로 중 중랑'.split()]
+    facilities = [f"테니스장{index}" for index in range(500)]
+    time_periods = ['주간', '야간', '주말/공휴일', '평일']
+
+    subscriptions = synthetic_subscriptions(subscriber_count, regions, facilities, time_periods, seed)
+    changes = [('updated', {
+        'facility_name': rng.choice(facilities),
+        'region': rng.choice(regions),
+        'court_number': f"{rng.randint(1, 9)}번 코트",
+        'time_period': rng.choice(time_periods),
+    }) for _ in range(change_count)]
+
+    started = time.perf_counter()
+    matcher = SubscriptionMatcher(subscriptions)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    payloads = matcher.match_changes(changes)
+    match_seconds = time.perf_counter() - started
+
+    # 전수 비교 (표본 100건으로 추정)
+    def naive_match(subscription, court):
+        values = court_values(court)
+        return all(
+            not subscription.get(dimension) or values[field] in subscription_values(subscription, dimension)
+            for dimension, field in DIMENSIONS.items()
+        )
+    sample = changes[:100]
+    started = time.perf_counter()
+    naive_matches = [
+        [number for number, subscription in enumerate(subscriptions) if naive_match(subscription, court)]
+        for _, court in sample
+    ]
+    naive_seconds = (time.perf_counter() - started) * len(changes) / len(sample)
+    indexed_matches = [sorted(matcher.index.match(court)) for _, court in sample]
+    if naive_matches != indexed_matches:
+        raise AssertionError("색인 매칭 결과가 전수 비교와 다릅니다")
+
+    print(f"구독 {subscriber_count:,}건, 변경 {change_count:,}건")
+    print(f"  색인 생성: {build_seconds:.3f}초")
+    print(f"  색인 매칭: {match_seconds:.3f}초 ({change_count / match_seconds:,.0f} 변경/초), 알림 {len(payloads):,}건")
+    print(f"  전수 비교(추정): {naive_seconds:.3f}초")
+
+def main():
+    parser = argparse.ArgumentParser(description='테니스장 변경 알림 구독 매칭')
+    parser.add_argument('--old', help='이전 수집 JSON')
+    parser.add_argument('--new', help='이번 수집 JSON')
+    parser.add_argument('--subscriptions', help='구독 목록 JSON')
+    parser.add_argument('--output', default='notifications.json')
+    parser.add_argument('--benchmark', type=int, help='합성 구독자 수')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if not (args.old and args.new and args.subscriptions):
+        parser.error('--benchmark 또는 --old/--new/--subscriptions 가 모두 필요합니다.')
+
+    def load(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    changes = diff_courts(load(args.old), load(args.new))
+    payloads = SubscriptionMatcher(load(args.subscriptions)).match_changes(changes)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(payloads, f, ensure_ascii=False, indent=2)
+    print(f"변경 {len(changes)}건 → 알림 {len(payloads)}건 저장: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+
+"""scraper/ 의 모듈들은 서로를 직접 import 하므로 scraper/ 를 모듈 경로에 추가합니다."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+"""슬롯 비트맵 저장소의 질의 마스크·용량 증가·저장/로드와 시간표 파싱을 검증합니다."""
+
+from datetime import date, timedelta
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from court_slot_scraper import SeoulTennisSlotScraper, SlotAvailabilityStore
+
+MONDAY = date(2025, 10, 6)
+SATURDAY = MONDAY + timedelta(days=5)
+
+def build_store():
+    # 용량 1 에서 시작해 코트 3개를 넣으면 두 번 늘어남
+    store = SlotAvailabilityStore(MONDAY, days=7, capacity=1)
+    store.set_free_hours('한남_용산구', '용산구', MONDAY, [6, 19])
+    store.set_free_hours('망원_마포구', '마포구', SATURDAY, [19])
+    store.set_free_hours('이촌_용산구', '용산구', SATURDAY, [10])
+    # 기간 밖 날짜는 무시
+    store.set_free_hours('한남_용산구', '용산구', MONDAY + timedelta(days=7), [19])
+    return store
+
+def test_query_free_masks():
+    store = build_store()
+    assert len(store.bitmaps) == 4
+    assert store.court_keys == ['한남_용산구', '망원_마포구', '이촌_용산구']
+
+    assert store.query_free(hours=[19]) == [('한남_용산구', MONDAY), ('망원_마포구', SATURDAY)]
+    assert store.query_free(region='용산구') == [('한남_용산구', MONDAY), ('이촌_용산구', SATURDAY)]
+    assert store.query_free(region='용산구', weekdays=[5]) == [('이촌_용산구', SATURDAY)]
+    assert store.query_free(region='용산구', weekdays=[5], hours=range(18, 22)) == []
+    assert store.query_free(region='강남구') == []
+    # 슬롯 범위(06~24시) 밖의 시각은 마스크에 들어가지 않음
+    assert store.hours_mask([5, 24]) == 0
+
+def test_save_load_round_trip(tmp_path):
+    store = build_store()
+    filename = str(tmp_path / 'slots.npz')
+    store.save(filename)
+
+    loaded = SlotAvailabilityStore.load(filename)
+    assert loaded.start_date == MONDAY
+    assert loaded.court_keys == store.court_keys
+    assert loaded.regions == store.regions
+    assert np.array_equal(loaded.bitmaps, store.bitmaps[:3])
+    assert loaded.query_free(region='용산구', weekdays=[0]) == [('한남_용산구', MONDAY)]
+
+    # 불러온 저장소도 꽉 찬 상태에서 계속 늘어남
+    loaded.set_free_hours('목동_양천구', '양천구', MONDAY, [7])
+    assert loaded.query_free(region='양천구') == [('목동_양천구', MONDAY)]
+
+def test_parse_free_hours_uses_leaf_cells():
+    content = """
+    <div class="time-table">
+      <ul>
+        <li class="time"><a href="#">09:00</a></li>
+        <li class="time disabled">10:00</li>
+        <li class="time">11:00 예약완료</li>
+        <li class="time-slot"><span>19:00</span></li>
+      </ul>
+    </div>
+    """
+    # 컨테이너(time-table)의 텍스트에 든 마감 슬롯 시각은 세지 않음
+    assert SeoulTennisSlotScraper().parse_free_hours(content) == [9, 19]
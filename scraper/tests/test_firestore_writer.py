@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+"""FirestoreCourtWriter 를 로컬 Firestore 에뮬레이터에 대해 검증합니다.
+
+    firebase emulators:start --only firestore
+    FIRESTORE_EMULATOR_HOST=localhost:8080 python -m pytest scraper/tests/test_firestore_writer.py
+"""
+
+import os
+import uuid
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get('FIRESTORE_EMULATOR_HOST'),
+    reason='FIRESTORE_EMULATOR_HOST 가 설정되지 않음',
+)
+
+pytest.importorskip('google.cloud.firestore')
+
+from firestore_writer import COLLECTION, FirestoreCourtWriter, document_id
+
+def make_courts(count):
+    return [
+        {
+            'name': f"테스트테니스장 {index}번 코트 주간",
+            'facility_name': '테스트테니스장',
+            'court_number': str(index),
+            'time_period': '주간',
+            'region': '송파구',
+        }
+        for index in range(count)
+    ]
+
+class CountingBatch:
+    """배치에 담긴 쓰기 수를 커밋할 때 기록하는 WriteBatch 래퍼입니다."""
+
+    def __init__(self, batch, commits):
+        self.batch = batch
+        self.commits = commits
+        self.operations = 0
+
+    def set(self, reference, data):
+        self.operations += 1
+        self.batch.set(reference, data)
+
+    def delete(self, reference):
+        self.operations += 1
+        self.batch.delete(reference)
+
+    def commit(self):
+        self.commits.append(self.operations)
+        return self.batch.commit()
+
+class CountingClient:
+    """배치 커밋 수를 세는 Firestore 클라이언트 래퍼입니다."""
+
+    def __init__(self, client):
+        self.client = client
+        self.commits = []
+
+    def collection(self, name):
+        return self.client.collection(name)
+
+    def batch(self):
+        return CountingBatch(self.client.batch(), self.commits)
+
+@pytest.fixture
+def writer():
+    from google.cloud import firestore
+    client = CountingClient(firestore.Client(project='happy-tennis-test'))
+    writer = FirestoreCourtWriter(client, collection=f"{COLLECTION}_test_{uuid.uuid4().hex[:8]}", batch_size=4)
+    yield writer
+    writer.commit_all([(doc_id, None) for doc_id in writer.existing_ids()])
+
+def test_upsert_is_idempotent(writer):
+    courts = make_courts(10)
+    expected = {document_id(court) for court in courts}
+
+    writer.write_courts(courts)
+    first = writer.existing_ids()
+    writer.write_courts(courts)
+    second = writer.existing_ids()
+
+    assert first == expected
+    assert second == expected
+    stored = writer.collection.document(document_id(courts[3])).get().to_dict()
+    assert stored['court_number'] == '3'
+    assert stored['court_key'] == courts[3]['name'] + '_송파구'
+
+def test_duplicate_courts_write_one_document(writer):
+    courts = make_courts(3)
+    writer.write_courts(courts + courts)
+    assert writer.existing_ids() == {document_id(court) for court in courts}
+
+def test_prune_deletes_in_batches(writer):
+    courts = make_courts(10)
+    writer.write_courts(courts)
+
+    writer.client.commits.clear()
+    writer.write_courts(courts[:1], prune=True)
+
+    assert writer.existing_ids() == {document_id(courts[0])}
+    # 기록 1건 + 삭제 9건 = 10건을 batch_size 4 로 나눈 3개 배치
+    assert sorted(writer.client.commits) == [2, 4, 4]
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""ResilientSession 의 속도 제한·재시도·회로 차단을 로컬 대역 서버의 장애 주입으로 검증합니다."""
+
+import random
+import time
+
+import pytest
+
+from local_standin_server import LIST_PATH, LocalStandInServer
+from scraper_session import CircuitBreaker, CircuitOpenError, ResilientSession, TokenBucket
+
+def make_session(**options):
+    limiter = TokenBucket(rate=20.0, min_rate=10.0, max_rate=20.0, capacity=1.0)
+    breaker = CircuitBreaker(
+        failure_threshold=options.pop('failure_threshold', 3),
+        reset_timeout=options.pop('reset_timeout', 0.3),
+    )
+    options.setdefault('backoff_base', 0.01)
+    return ResilientSession(rate_limiter=limiter, circuit_breaker=breaker, timeout=5, **options)
+
+def test_down_opens_circuit_then_recovers():
+    with LocalStandInServer(down=True) as server:
+        session = make_session(max_retries=5)
+        with pytest.raises(CircuitOpenError):
+            session.get(server.url + LIST_PATH)
+        # 임계치(3회)만큼만 요청하고 이후 시도는 보내지 않음
+        assert server.request_count == 3
+        assert session.circuit_breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            session.get(server.url + LIST_PATH)
+        assert server.request_count == 3
+
+        server.down = False
+        time.sleep(0.35)
+        response = session.get(server.url + LIST_PATH)
+        assert response.status_code == 200
+        assert session.circuit_breaker.state == CircuitBreaker.CLOSED
+
+def test_half_open_failure_reopens():
+    with LocalStandInServer(down=True) as server:
+        session = make_session(max_retries=0, failure_threshold=1)
+        session.get(server.url + LIST_PATH)
+        assert session.circuit_breaker.state == CircuitBreaker.OPEN
+
+        time.sleep(0.35)
+        session.get(server.url + LIST_PATH)
+        assert session.circuit_breaker.state == CircuitBreaker.OPEN
+        assert server.request_count == 2
+
+def test_half_open_allows_single_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    breaker.record_failure()
+    time.sleep(0.15)
+
+    breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    breaker.record_success()
+    breaker.allow()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_stuck_probe_is_replaced_after_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    breaker.record_failure()
+    time.sleep(0.15)
+    breaker.allow()
+    time.sleep(0.15)
+    breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+def test_throttle_while_half_open_closes_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+    breaker.record_failure()
+    time.sleep(0.15)
+    breaker.allow()
+    breaker.record_throttle()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_error_rate_is_retried_and_slows_down():
+    random.seed(7)
+    with LocalStandInServer(error_rate=0.3) as server:
+        session = make_session(max_retries=6, failure_threshold=10)
+        statuses = [session.get(server.url + LIST_PATH).status_code for _ in range(10)]
+
+        assert statuses == [200] * 10
+        assert server.request_count > 10
+        # 5xx 마다 속도를 절반으로 줄였다가 성공 시 가산 증가
+        assert session.rate_limiter.rate < 20.0
+        assert session.circuit_breaker.state == CircuitBreaker.CLOSED
+
+def test_retry_after_is_waited_once():
+    with LocalStandInServer(throttle_rate=1.0) as server:
+        session = make_session(max_retries=1)
+        started = time.monotonic()
+        response = session.get(server.url + LIST_PATH)
+        elapsed = time.monotonic() - started
+
+    assert response.status_code == 429
+    assert server.request_count == 2
+    # Retry-After: 1 을 토큰 버킷과 백오프에서 두 번 기다리면 2초 이상 걸림
+    assert 0.9 <= elapsed < 1.8
+
+def test_retry_after_delays_other_requests_on_shared_bucket():
+    limiter = TokenBucket(rate=20.0, max_rate=20.0, capacity=1.0)
+    limiter.on_throttle(retry_after=0.5)
+    started = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - started >= 0.45
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+"""실제 수집 결과(facility_name 없는 목록 레코드)로 시설 구독 매칭을 검증합니다."""
+
+from item_fingerprint_cache import ItemFingerprintCache
+from local_standin_server import LocalStandInServer
+from scraper_session import ResilientSession, TokenBucket
+from seoul_tennis_scraper import SeoulTennisScraper
+from subscription_matcher import SubscriptionMatcher, diff_courts
+
+def scrape_clean(server, tmp_path):
+    session = ResilientSession(rate_limiter=TokenBucket(rate=50.0, max_rate=50.0))
+    scraper = SeoulTennisScraper(base_url=server.url, session=session, mode='html')
+    scraper.fingerprint_cache = ItemFingerprintCache(str(tmp_path / 'fingerprints.json'))
+    scraper.scrape_tennis_courts()
+    scraper.clean_and_organize_data()
+    return scraper.tennis_courts
+
+def test_facility_subscription_matches_scraped_titles(tmp_path):
+    with LocalStandInServer(api_mode='html') as server:
+        courts = scrape_clean(server, tmp_path)
+
+    hannam = [court for court in courts if court['name'].startswith('한남테니스장')]
+    assert hannam and all('facility_name' not in court for court in hannam)
+
+    old_courts = [court for court in courts if court not in hannam]
+    changes = diff_courts(old_courts, courts)
+    assert len(changes) == len(hannam)
+
+    matcher = SubscriptionMatcher([
+        {'id': 's1', 'user_id': 'u1', 'facilities': ['한남테니스장']},
+        {'id': 's2', 'user_id': 'u2', 'facilities': ['한남 테니스장'], 'regions': ['용산구']},
+        {'id': 's3', 'user_id': 'u3', 'facilities': ['목동테니스장']},
+    ])
+    payloads = {payload['userId']: payload for payload in matcher.match_changes(changes)}
+
+    assert set(payloads) == {'u1', 'u2'}
+    changed = payloads['u1']['data']['changes']
+    assert len(changed) == len(hannam)
+    assert {item['facility_name'] for item in changed} == {'한남테니스장'}
+    assert payloads['u1']['body'].startswith('한남테니스장 외')
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""JSON 목록 모드와 HTML 폴백을 로컬 대역 서버의 응답 모드별로 검증합니다."""
+
+from item_fingerprint_cache import ItemFingerprintCache
+from local_standin_server import LIST_PATH, LocalStandInServer
+from scraper_session import ResilientSession, TokenBucket
+from seoul_tennis_scraper import SeoulTennisScraper
+
+# HTML 파서와 JSON 매핑이 같은 값을 내야 하는 필드
+SHARED_FIELDS = [
+    'name', 'region', 'court_number', 'time_period', 'target', 'reservation_period',
+    'reservation_method', 'fee_info', 'detail_url',
+    'reservation_start', 'reservation_end', 'use_start', 'use_end',
+]
+
+def scrape(server, mode, tmp_path):
+    session = ResilientSession(rate_limiter=TokenBucket(rate=50.0, max_rate=50.0))
+    scraper = SeoulTennisScraper(base_url=server.url, session=session, mode=mode)
+    scraper.fingerprint_cache = ItemFingerprintCache(str(tmp_path / f"{mode}_fingerprints.json"))
+    scraper.scrape_tennis_courts()
+    return scraper.tennis_courts
+
+def list_page_sizes(server):
+    return [int(params.get('pageSize', 0)) for path, params in server.requests if path == LIST_PATH]
+
+def test_json_mode_matches_html_record_shape(tmp_path):
+    with LocalStandInServer(api_mode='json') as server:
+        html_courts = scrape(server, 'html', tmp_path)
+        server.requests.clear()
+        api_courts = scrape(server, 'api', tmp_path)
+
+        # 작은 확인 요청 뒤 큰 페이지로 수집
+        assert list_page_sizes(server)[0] == 1
+        assert len(list_page_sizes(server)) == 1 + server.page_count()
+
+    assert len(api_courts) == len(html_courts) == len(server.courts)
+    for api_court, html_court in zip(api_courts, html_courts):
+        assert set(api_court) == set(html_court)
+        for field in SHARED_FIELDS:
+            assert api_court[field] == html_court[field], field
+
+def test_auto_mode_falls_back_to_html(tmp_path):
+    with LocalStandInServer(api_mode='html') as server:
+        expected = scrape(server, 'html', tmp_path)
+        server.requests.clear()
+        courts = scrape(server, 'auto', tmp_path)
+
+        # JSON 이 아닌 응답에는 확인 요청 하나만 쓰고 HTML 수집으로 전환
+        sizes = list_page_sizes(server)
+        assert sizes[0] == 1
+        assert len(sizes) == 1 + server.page_count()
+
+    assert courts == expected
+
+def test_changed_json_falls_back_to_html(tmp_path):
+    with LocalStandInServer(api_mode='changed') as server:
+        expected = scrape(server, 'html', tmp_path)
+        courts = scrape(server, 'auto', tmp_path)
+    assert courts == expected
+
+def test_api_mode_does_not_fall_back(tmp_path):
+    with LocalStandInServer(api_mode='changed') as server:
+        server.requests.clear()
+        assert scrape(server, 'api', tmp_path) == []
+        assert len(server.requests) == 1
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""yeyak 목록 데이터를 HTML 대신 JSON(XHR) 응답으로 받아오는 클라이언트입니다.
+
+응답 형태가 예상과 다르면 None 을 반환하며, 스크래퍼는 HTML 파싱으로 되돌아갑니다.
+JSON 을 주지 않는 사이트에 큰 목록 요청을 버리지 않도록 먼저 작은 페이지로 형식을 확인합니다.
+"""
+
+import re
+
+from period_index import add_period_fields
+
+LIST_PATH = '/web/search/selectPageListDetailSearchImg.do'
+DETAIL_PATH = '/web/reservation/selectReservView.do'
+
+class YeyakListApiClient:
+    """목록 XHR 엔드포인트를 호출해 코트 레코드로 변환합니다."""
+
+    # 코트 필드 → 응답에서 찾아볼 키 (yeyak XHR / 서울 열린데이터 공공서비스예약 형식)
+    FIELD_KEYS = {
+        'svc_id': ['SVCID', 'svcId', 'rsv_svc_id'],
+        'name': ['SVCNM', 'svcNm', 'svc_nm'],
+        'region': ['AREANM', 'areaNm', 'area_nm'],
+        'place': ['PLACENM', 'placeNm', 'place_nm'],
+        'target': ['USETGTINFO', 'useTgtInfo', 'use_tgt_info'],
+        'reservation_start': ['RCPTBGNDT', 'rcptBgnDt'],
+        'reservation_end': ['RCPTENDDT', 'rcptEndDt'],
+        'use_start': ['SVCOPNBGNDT', 'svcOpnBgnDt'],
+        'use_end': ['SVCOPNENDDT', 'svcOpnEndDt'],
+        'fee': ['PAYATNM', 'payAtNm'],
+        'detail_url': ['SVCURL', 'svcUrl'],
+        'phone': ['TELNO', 'telNo'],
+    }
+
+    # 결과 목록이 들어 있을 수 있는 키
+    LIST_KEYS = ['resultList', 'list', 'rows', 'row', 'data']
+
+    REQUIRED_FIELDS = ('name',)
+
+    def __init__(self, session, base_url, page_size=1000, probe_size=1):
+        self.session = session
+        self.base_url = base_url
+        self.page_size = page_size
+        self.probe_size = probe_size
+
+    def find_rows(self, payload):
+        """응답 JSON 에서 결과 목록을 찾습니다. 찾지 못하면 None 을 반환합니다."""
+        if isinstance(payload, list):
+            return payload if all(isinstance(row, dict) for row in payload) else None
+        if not isinstance(payload, dict):
+            return None
+        for key in self.LIST_KEYS:
+            if isinstance(payload.get(key), list):
+                return payload[key]
+        # {"ListPublicReservationSport": {"row": [...]}} 처럼 한 단계 감싼 형태
+        for value in payload.values():
+            if isinstance(value, dict):
+                rows = self.find_rows(value)
+                if rows is not None:
+                    return rows
+        return None
+
+    def pick(self, row, field):
+        for key in self.FIELD_KEYS[field]:
+            value = row.get(key)
+            if value not in (None, ''):
+                return str(value).strip()
+        return ""
+
+    def format_date(self, value):
+        """'2025-10-01 09:00:00.0' 같은 값을 목록 페이지 표기(2025.10.01 09:00)로 맞춥니다."""
+        match = re.match(r'(\d{4})-?(\d{2})-?(\d{2})(?:[ T](\d{2}):(\d{2}))?', value)
+        if not match:
+            return value
+        year, month, day, hour, minute = match.groups()
+        formatted = f"{year}.{month}.{day}"
+        if hour and (hour, minute) != ('00', '00'):
+            formatted += f" {hour}:{minute}"
+        return formatted
+
+    def format_period(self, row, start_field, end_field):
+        start = self.pick(row, start_field)
+        end = self.pick(row, end_field)
+        if not start and not end:
+            return ""
+        return f"{self.format_date(start)} ~ {self.format_date(end)}"
+
+    def map_row(self, row):
+        """응답 행 하나를 코트 레코드로 변환합니다. 필수 필드가 없으면 None 을 반환합니다."""
+        if any(not self.pick(row, field) for field in self.REQUIRED_FIELDS):
+            return None
+
+        name = self.pick(row, 'name')
+        region = self.pick(row, 'region')
+        if not region:
+            region_match = re.search(r'\(([^)]+)\)', name)
+            region = region_match.group(1) if region_match else ""
+
+        court_number_match = re.search(r'(\d+)번', name)
+
+        time_period = ""
+        if '주간' in name:
+            time_period = "주간"
+        elif '야간' in name:
+            time_period = "야간"
+        elif '주말' in name or '공휴일' in name:
+            time_period = "주말/공휴일"
+        elif '평일' in name:
+            time_period = "평일"
+
+        detail_url = self.pick(row, 'detail_url')
+        svc_id = self.pick(row, 'svc_id')
+        if not detail_url and svc_id:
+            detail_url = f"{self.base_url}{DETAIL_PATH}?rsv_svc_id={svc_id}"
+
+        return add_period_fields({
+            'name': name,
+            'region': region,
+            'court_number': court_number_match.group(1) if court_number_match else "",
+            'time_period': time_period,
+            'target': self.pick(row, 'target') or "제한없음",
+            'reservation_period': self.format_period(row, 'reservation_start', 'reservation_end'),
+            'use_period': self.format_period(row, 'use_start', 'use_end'),
+            'reservation_method': "온라인",
+            'fee_info': "무료" if '무료' in self.pick(row, 'fee') else "유료",
+            'detail_url': detail_url,
+            'detail_text': " ".join(filter(None, [self.pick(row, 'place'), self.pick(row, 'phone')]))
+        })
+
+    def fetch_page(self, page_index, page_size=None):
+        """한 페이지를 JSON 으로 요청합니다. JSON 이 아니면 None 을 반환합니다."""
+        response = self.session.get(
+            f"{self.base_url}{LIST_PATH}",
+            params={
+                'code': 'T100',
+                'dCode': 'T108',
+                'pageIndex': page_index,
+                'pageSize': page_size or self.page_size,
+            },
+            headers={
+                'Accept': 'application/json, text/javascript, */*; q=0.01',
+                'X-Requested-With': 'XMLHttpRequest',
+            },
+        )
+        response.raise_for_status()
+        if 'json' not in response.headers.get('Content-Type', ''):
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    def probe(self):
+        """작은 페이지 하나로 JSON 목록을 주는지 확인합니다."""
+        payload = self.fetch_page(1, self.probe_size)
+        rows = self.find_rows(payload) if payload is not None else None
+        if rows is None:
+            print("JSON 응답 형식을 인식할 수 없습니다.")
+            return False
+        if rows and not any(self.map_row(row) for row in rows):
+            print("JSON 응답 필드가 예상과 다릅니다.")
+            return False
+        return True
+
+    def fetch_all(self):
+        """모든 페이지를 가져와 코트 레코드 목록을 반환합니다.
+
+        응답 형태가 바뀌어 매핑할 수 없으면 None 을 반환합니다.
+        """
+        if not self.probe():
+            return None
+
+        courts = []
+        fetched = 0
+        page_index = 1
+
+        while True:
+            payload = self.fetch_page(page_index)
+            rows = self.find_rows(payload) if payload is not None else None
+            if rows is None:
+                print("JSON 응답 형식을 인식할 수 없습니다.")
+                return None
+
+            mapped = [self.map_row(row) for row in rows]
+            if rows and not any(mapped):
+                print("JSON 응답 필드가 예상과 다릅니다.")
+                return None
+            courts.extend(court for court in mapped if court)
+            fetched += len(rows)
+
+            # 전체 건수가 있으면 그것을 기준으로, 없으면 덜 찬 페이지를 마지막으로 판단
+            total = payload.get('totalCount') if isinstance(payload, dict) else None
+            if not rows:
+                break
+            if total is not None and fetched >= int(total):
+                break
+            if total is None and len(rows) < self.page_size:
+                break
+            page_index += 1
+
+        return courts
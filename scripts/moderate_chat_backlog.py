@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""채팅 메시지 백로그를 금지어 목록으로 다시 검사합니다.
+
+src/lib/moderation.ts 의 ModerationService.filterMessage 와 같은 결과(violations 순서,
+마스킹된 filteredContent, isClean)를 내되, 금지어 목록을 Aho-Corasick 자동자로 한 번 컴파일해
+메시지마다 금지어 수와 무관하게 한 번만 훑습니다. pyahocorasick 이 설치되어 있으면 그것을 씁니다.
+입력 JSONL 을 묶음 단위로 프로세스 풀에 흘려보내고 결과를 입력 순서대로 JSONL 로 씁니다.
+
+    python scripts/moderate_chat_backlog.py --input chat_export.jsonl --output violations.jsonl
+    python scripts/moderate_chat_backlog.py --benchmark 2000000
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from array import array
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+MODERATION_TS = os.path.join(ROOT_DIR, 'src', 'lib', 'moderation.ts')
+
+DEFAULT_BANNED_WORDS = ['욕설', '비방', '스팸', '광고', '불법', '음란', '폭력', '혐오']
+
+# JS 정규식과 같은 의미가 되도록 문자 집합을 직접 지정
+# /(.)\1{4,}/ : JS 의 . 은 줄 끝 문자(\n \r \u2028 \u2029)를 제외한 UTF-16 코드 단위 하나
+SPAM_PATTERN = re.compile('([^\n\r\u2028\u2029])\\1{4,}')
+# /https?:\/\/[^\s]+/ : JS 의 \s 목록
+URL_PATTERN = re.compile('https?://[^\t\n\v\f\r \u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff]')
+
+REGEX_SPECIAL = set('\\^$.|?*+()[]{}/')
+
+def load_banned_words(path=MODERATION_TS):
+    """moderation.ts 의 bannedWords 배열을 읽어옵니다. 찾지 못하면 기본 목록을 씁니다."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+    except OSError:
+        return list(DEFAULT_BANNED_WORDS)
+    match = re.search(r'bannedWords\s*:\s*string\[\]\s*=\s*\[([^\]]*)\]', source)
+    if not match:
+        return list(DEFAULT_BANNED_WORDS)
+    return [single or double for single, double in re.findall(r"'([^']*)'|\"([^\"]*)\"", match.group(1))]
+
+def utf16_length(text):
+    return len(text.encode('utf-16-le', 'surrogatepass')) // 2
+
+def utf16_units(text):
+    """JS 문자열처럼 UTF-16 코드 단위 하나가 한 글자인 문자열로 바꿉니다."""
+    return ''.join(map(chr, array('H', text.encode('utf-16-le', 'surrogatepass'))))
+
+def pattern_violations(content):
+    """스팸 반복/URL 패턴 위반을 반환합니다."""
+    violations = []
+    text = utf16_units(content) if any(ord(ch) > 0xFFFF for ch in content) else content
+    if SPAM_PATTERN.search(text):
+        violations.append('spam_pattern')
+    if URL_PATTERN.search(content):
+        violations.append('url_detected')
+    return violations
+
+def reference_filter(content, banned_words):
+    """filterMessage 를 그대로 옮긴 기준 구현입니다 (금지어마다 검사·치환)."""
+    violations = []
+    filtered = content
+    lowered = content.lower()
+    for word in banned_words:
+        if word.lower() in lowered:
+            violations.append(word)
+            if word:
+                filtered = re.sub(word, '*' * utf16_length(word), filtered, flags=re.IGNORECASE)
+    violations.extend(pattern_violations(content))
+    return {'isClean': not violations, 'filteredContent': filtered, 'violations': violations}
+
+class AhoCorasick:
+    """순수 파이썬 Aho-Corasick 자동자입니다. iter(text) 는 (끝 위치, 단어 번호) 를 냅니다."""
+
+    def __init__(self, words):
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [[]]
+        for index, word in enumerate(words):
+            if not word:
+                continue
+            state = 0
+            for ch in word:
+                next_state = self.goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][ch] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.outputs.append([])
+                state = next_state
+            self.outputs[state].append(index)
+
+        # 너비 우선으로 실패 링크를 채우고 출력을 합침
+        pending = deque(self.goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for ch, next_state in self.goto[state].items():
+                pending.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+
+        # 루트 상태에서는 금지어 첫 글자가 나올 때까지 정규식(C 구현)으로 건너뜀
+        first_chars = ''.join(sorted(self.goto[0]))
+        self.root_skip = re.compile('[' + re.escape(first_chars) + ']') if first_chars else None
+
+    def iter(self, text):
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        root = goto[0]
+        root_skip = self.root_skip
+        if root_skip is None:
+            return
+        state = 0
+        position = 0
+        length = len(text)
+        while position < length:
+            if not state:
+                match = root_skip.search(text, position)
+                if match is None:
+                    return
+                position = match.start()
+            ch = text[position]
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0) if state else root.get(ch, 0)
+            if outputs[state]:
+                for index in outputs[state]:
+                    yield position, index
+            position += 1
+
+class ChatModerator:
+    """컴파일된 금지어 자동자로 filterMessage 와 같은 결과를 계산합니다."""
+
+    def __init__(self, banned_words):
+        self.banned_words = list(banned_words)
+        self.lowered = [word.lower() for word in self.banned_words]
+        self.stars = ['*' * utf16_length(word) for word in self.banned_words]
+        # 정규식 특수문자나 '*' 가 든 금지어는 치환 결과가 단순 문자열 비교와 달라질 수 있어 기준 구현 사용
+        self.needs_reference = any(REGEX_SPECIAL & set(word) for word in self.banned_words)
+        self.empty_words = [index for index, word in enumerate(self.banned_words) if not word]
+
+        # 소문자 기준으로 같은 금지어는 자동자에 한 번만 넣고, 해당하는 목록 번호들을 따로 보관
+        unique_words = []
+        self.word_indices = []
+        positions = {}
+        for index, word in enumerate(self.lowered):
+            if not word:
+                continue
+            if word not in positions:
+                positions[word] = len(unique_words)
+                unique_words.append(word)
+                self.word_indices.append([])
+            self.word_indices[positions[word]].append(index)
+        self.unique_lengths = [len(word) for word in unique_words]
+
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for word_id, word in enumerate(unique_words):
+                self.automaton.add_word(word, word_id)
+            self.automaton.make_automaton()
+            self.scan = self.automaton.iter
+        else:
+            self.scan = AhoCorasick(unique_words).iter
+
+    def filter_message(self, content):
+        lowered = content.lower()
+        if self.needs_reference or len(lowered) != len(content):
+            return reference_filter(content, self.banned_words)
+
+        # 목록 번호별 출현 시작 위치 (왼쪽부터)
+        occurrences = {}
+        for end, word_id in self.scan(lowered):
+            starts = occurrences.get(word_id)
+            if starts is None:
+                starts = occurrences[word_id] = []
+            starts.append(end - self.unique_lengths[word_id] + 1)
+        occurrences = {index: starts for word_id, starts in occurrences.items() for index in self.word_indices[word_id]}
+
+        violations = []
+        masked = None
+        spans = []
+        for index in sorted(set(occurrences) | set(self.empty_words)):
+            violations.append(self.banned_words[index])
+            if index not in occurrences:
+                continue
+            # 앞 금지어가 가린 글자와 겹치지 않는 출현만, 겹치지 않게 왼쪽부터 치환 (정규식 g 플래그)
+            length = len(self.lowered[index])
+            last_end = 0
+            for start in occurrences[index]:
+                if start < last_end:
+                    continue
+                if masked is not None and any(masked[start:start + length]):
+                    continue
+                if masked is None:
+                    masked = bytearray(len(content))
+                masked[start:start + length] = b'\x01' * length
+                spans.append((start, start + length, index))
+                last_end = start + length
+
+        filtered = content
+        if spans:
+            pieces = []
+            cursor = 0
+            for start, end, index in sorted(spans):
+                pieces.append(content[cursor:start])
+                pieces.append(self.stars[index])
+                cursor = end
+            pieces.append(content[cursor:])
+            filtered = ''.join(pieces)
+
+        violations.extend(pattern_violations(content))
+        return {'isClean': not violations, 'filteredContent': filtered, 'violations': violations}
+
+# --- 프로세스 풀 ---
+
+_moderator = None
+
+def init_worker(banned_words):
+    global _moderator
+    _moderator = ChatModerator(banned_words)
+
+def moderate_lines(lines):
+    """JSONL 줄 묶음을 검사해 (결과 목록, 위반 수) 를 반환합니다."""
+    results = []
+    for line in lines:
+        if not line.strip():
+            continue
+        message = json.loads(line)
+        result = _moderator.filter_message(message.get('content') or '')
+        results.append({
+            'id': message.get('id'),
+            'roomId': message.get('roomId'),
+            'senderId': message.get('senderId'),
+            **result,
+        })
+    return results
+
+def chunked_lines(file, size):
+    while True:
+        chunk = list(islice(file, size))
+        if not chunk:
+            return
+        yield chunk
+
+def moderate_file(input_path, output_path, banned_words, workers=None, chunk_size=2000, include_clean=False):
+    """JSONL 내보내기 파일을 검사해 결과를 입력 순서대로 씁니다."""
+    counts = {'messages': 0, 'violations': 0}
+    started = time.perf_counter()
+    with open(input_path, 'r', encoding='utf-8') as source, \
+            open(output_path, 'w', encoding='utf-8') as target, \
+            Pool(workers, initializer=init_worker, initargs=(banned_words,)) as pool:
+        for results in pool.imap(moderate_lines, chunked_lines(source, chunk_size)):
+            for result in results:
+                counts['messages'] += 1
+                if not result['isClean']:
+                    counts['violations'] += 1
+                if include_clean or not result['isClean']:
+                    target.write(json.dumps(result, ensure_ascii=False) + '\n')
+    elapsed = time.perf_counter() - started
+    print(f"메시지 {counts['messages']:,}개 검사, 위반 {counts['violations']:,}개, "
+          f"{elapsed:.2f}초 ({counts['messages'] / max(elapsed, 1e-9):,.0f} 메시지/초)")
+    return counts
+
+# --- 벤치마크 ---
+
+SYLLABLES = '가나다라마바사아자차카타파하테니스코트예약오늘내일저녁주말시간같이칠분있나요좋아요감사합니다'
+
+def synthetic_messages(count, banned_words, seed=0):
+    """합성 한국어 채팅 메시지를 만듭니다 (일부에 금지어/반복/URL 포함)."""
+    rng = random.Random(seed)
+    for index in range(count):
+        words = [''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(2, 10))]
+        roll = rng.random()
+        if roll < 0.05:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(banned_words))
+        elif roll < 0.06:
+            words.append('ㅋ' * rng.randint(5, 9))
+        elif roll < 0.07:
+            words.append('https://example.com/' + str(index))
+        yield json.dumps({'id': f"m{index}", 'roomId': f"room{index % 500}", 'senderId': f"u{index % 5000}",
+                          'content': ' '.join(words)}, ensure_ascii=False)
+
+def benchmark(count, extra_words, workers):
+    banned_words = load_banned_words()
+    rng = random.Random(1)
+    banned_words += [''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(3, 5))) for _ in range(extra_words)]
+    print(f"금지어 {len(banned_words)}개, 자동자: {'pyahocorasick' if ahocorasick else '순수 파이썬'}")
+
+    # 단일 프로세스 비교 (표본) 및 결과 일치 확인
+    sample = [json.loads(line)['content'] for line in synthetic_messages(min(count, 50000), banned_words)]
+    moderator = ChatModerator(banned_words)
+    started = time.perf_counter()
+    compiled = [moderator.filter_message(content) for content in sample]
+    compiled_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    reference = [reference_filter(content, banned_words) for content in sample]
+    reference_seconds = time.perf_counter() - started
+    mismatches = sum(1 for a, b in zip(compiled, reference) if a != b)
+    print(f"단일 프로세스 {len(sample):,}개: 자동자 {len(sample) / compiled_seconds:,.0f} 메시지/초, "
+          f"기준 구현 {len(sample) / reference_seconds:,.0f} 메시지/초, 불일치 {mismatches}건")
+
+    import tempfile
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_path = os.path.join(work_dir, 'messages.jsonl')
+        with open(input_path, 'w', encoding='utf-8') as f:
+            for line in synthetic_messages(count, banned_words):
+                f.write(line + '\n')
+        moderate_file(input_path, os.path.join(work_dir, 'violations.jsonl'), banned_words, workers)
+    return mismatches == 0
+
+def main():
+    parser = argparse.ArgumentParser(description='채팅 백로그 금지어 일괄 검사')
+    parser.add_argument('--input', help='채팅 메시지 JSONL (content 필드)')
+    parser.add_argument('--output', default='moderation_results.jsonl')
+    parser.add_argument('--words', help='금지어 파일 (한 줄에 하나, 기본: moderation.ts 목록)')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=2000)
+    parser.add_argument('--all', action='store_true', help='위반 없는 메시지 결과도 기록')
+    parser.add_argument('--benchmark', type=int, help='합성 메시지 수')
+    parser.add_argument('--extra-words', type=int, default=0, help='벤치마크용 추가 금지어 수')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        if not benchmark(args.benchmark, args.extra_words, args.workers):
+            sys.exit(1)
+        return
+
+    if args.words:
+        with open(args.words, 'r', encoding='utf-8') as f:
+            banned_words = [line.rstrip('\n') for line in f if line.strip()]
+    else:
+        banned_words = load_banned_words()
+
+    moderate_file(args.input, args.output, banned_words, args.workers, args.chunk_size, args.all)
+
+if __name__ == "__main__":
+    main()
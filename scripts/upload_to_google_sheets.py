@@ -6,11 +6,13 @@ import requests
 import sys
 import os
 
-def upload_to_google_sheets():
-    """로컬 JSON 데이터를 구글 시트에 업로드합니다."""
+def upload_to_google_sheets(json_file_path='scraper/seoul_tennis_courts_manual.json', session=None):
+    """로컬 JSON 데이터를 구글 시트에 업로드합니다.
     
-    # JSON 파일 경로
-    json_file_path = 'scraper/seoul_tennis_courts_manual.json'
+    session 을 넘기면 해당 세션의 연결 풀(keep-alive)을 재사용합니다.
+    """
+    
+    http = session or requests
     
     if not os.path.exists(json_file_path):
         print(f"JSON 파일을 찾을 수 없습니다: {json_file_path}")
@@ -27,7 +29,7 @@ def upload_to_google_sheets():
     
     try:
         # API로 데이터 업로드
-        response = requests.post(
+        response = http.post(
             api_url,
             json={"courts": courts_data},
             headers={"Content-Type": "application/json"},
@@ -2,6 +2,7 @@
 
 import React, { useState, useEffect } from 'react';
 import { tennisCourtsService, TennisCourt } from '@/lib/tennisCourts';
+import { courtKey, periodIndexService } from '@/lib/periodIndex';
 import Button from '@/components/ui/Button';
 import { 
   ArrowPathIcon, 
@@ -19,6 +20,7 @@ export default function TennisCourtsAdmin({ isOpen, onClose }: TennisCourtsAdmin
   const [courts, setCourts] = useState<TennisCourt[]>([]);
   const [loading, setLoading] = useState(false);
   const [syncStatus, setSyncStatus] = useState<string>('');
+  const [openForBooking, setOpenForBooking] = useState<Set<string>>(new Set());
   const [showAddForm, setShowAddForm] = useState(false);
   // const [editingCourt] = useState<TennisCourt | null>(null);
   const [newCourt, setNewCourt] = useState<Partial<TennisCourt>>({
@@ -43,8 +45,12 @@ export default function TennisCourtsAdmin({ isOpen, onClose }: TennisCourtsAdmin
   const loadCourts = async () => {
     setLoading(true);
     try {
-      const courtsData = tennisCourtsService.getAllCourts();
+      const [courtsData, openKeys] = await Promise.all([
+        tennisCourtsService.loadAllCourts(),
+        periodIndexService.getCourtsOpenForBooking(),
+      ]);
       setCourts(courtsData);
+      setOpenForBooking(new Set(openKeys));
       setSyncStatus('데이터 로드 완료');
     } catch (error) {
       console.error('테니스장 데이터 로드 실패:', error);
@@ -321,7 +327,9 @@ export default function TennisCourtsAdmin({ isOpen, onClose }: TennisCourtsAdmin
 
         {/* 테니스장 목록 */}
         <div className="space-y-4">
-          <h3 className="text-lg font-medium text-white">테니스장 목록 ({courts.length}개)</h3>
+          <h3 className="text-lg font-medium text-white">
+            테니스장 목록 ({courts.length}개, 접수 중 {openForBooking.size}개)
+          </h3>
           
           {loading ? (
             <div className="text-center py-8 text-white/60">
@@ -338,6 +346,11 @@ export default function TennisCourtsAdmin({ isOpen, onClose }: TennisCourtsAdmin
                     <div className="flex-1">
                       <div className="font-medium text-white">
                         {court.facility_name} - {court.court_number}
+                        {openForBooking.has(courtKey(court)) && (
+                          <span className="ml-2 px-2 py-0.5 text-xs rounded-full bg-green-500/20 text-green-300">
+                            접수 중
+                          </span>
+                        )}
                       </div>
                       <div className="text-sm text-white/70">
                         {court.region} | {court.time_period} | {court.fee_info}
@@ -38,23 +38,39 @@ const CreateRoomModal: React.FC<CreateRoomModalProps> = ({
   
   // 테니스장 관련 상태
   const [tennisCourts, setTennisCourts] = useState<TennisCourt[]>([]);
+  const [regions, setRegions] = useState<string[]>([]);
   const [selectedRegion, setSelectedRegion] = useState<string>('');
   const [searchQuery, setSearchQuery] = useState<string>('');
   const [showCourtSelector, setShowCourtSelector] = useState<boolean>(false);
 
-  // 테니스장 데이터 로드
+  // 지역 목록 로드 (매니페스트만 요청)
+  useEffect(() => {
+    if (showCourtSelector && regions.length === 0) {
+      tennisCourtsService.loadRegions().then(setRegions);
+    }
+  }, [showCourtSelector, regions.length]);
+
+  // 테니스장 데이터 로드 (선택한 지역의 샤드만 요청, 지역 없이 검색할 때만 전체 로드)
+  const searchAllRegions = !selectedRegion && searchQuery !== '';
   useEffect(() => {
     const loadTennisCourts = async () => {
       try {
-        const courts = tennisCourtsService.getAllCourts();
-        setTennisCourts(courts);
+        if (selectedRegion) {
+          setTennisCourts(await tennisCourtsService.loadRegionCourts(selectedRegion));
+        } else if (searchAllRegions) {
+          setTennisCourts(await tennisCourtsService.loadAllCourts());
+        } else {
+          setTennisCourts([]);
+        }
       } catch (error) {
         console.error('테니스장 데이터 로드 실패:', error);
       }
     };
 
-    loadTennisCourts();
-  }, []);
+    if (showCourtSelector) {
+      loadTennisCourts();
+    }
+  }, [selectedRegion, searchAllRegions, showCourtSelector]);
 
   // 필터링된 테니스장 목록
   const filteredCourts = tennisCourts.filter(court => {
@@ -221,7 +237,7 @@ const CreateRoomModal: React.FC<CreateRoomModalProps> = ({
                         className="w-full px-3 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent"
                       >
                         <option value="">전체 지역</option>
-                        {tennisCourtsService.getRegions().map(region => (
+                        {regions.map(region => (
                           <option key={region} value={region}>{region}</option>
                         ))}
                       </select>
@@ -230,7 +246,11 @@ const CreateRoomModal: React.FC<CreateRoomModalProps> = ({
                   
                   {/* 테니스장 목록 */}
                   <div className="max-h-60 overflow-y-auto">
-                    {filteredCourts.length === 0 ? (
+                    {!selectedRegion && !searchQuery ? (
+                      <div className="p-4 text-center text-gray-500">
+                        지역을 선택하거나 테니스장을 검색해주세요.
+                      </div>
+                    ) : filteredCourts.length === 0 ? (
                       <div className="p-4 text-center text-gray-500">
                         검색 결과가 없습니다.
                       </div>
@@ -0,0 +1,98 @@
+// 접수기간/이용기간 구간 인덱스 (scraper/publish_static_data.py 가 샤드와 함께 발행)
+// 시작 시각으로 정렬된 배열 위의 암묵적 이진 트리이며, 시각은 서울 현지 시각 기준 분 단위입니다.
+
+export interface IntervalIndexData {
+  starts: number[];
+  ends: number[];
+  max_ends: number[];
+  ids: string[];
+}
+
+export interface PeriodIndexData {
+  unit: 'minutes';
+  timezone: 'Asia/Seoul';
+  reservation: IntervalIndexData;
+  use: IntervalIndexData;
+}
+
+const KST_OFFSET_MINUTES = 9 * 60;
+
+// 인덱스 id 와 같은 코트 키 '{이름}_{지역}' (scraper/court_keys.py 와 동일한 규칙)
+export function courtKey(court: {
+  name?: string;
+  facility_name?: string;
+  court_number?: string;
+  time_period?: string;
+  region?: string;
+}): string {
+  const name = court.name || [court.facility_name, court.court_number, court.time_period].filter(Boolean).join(' ');
+  return `${name}_${court.region || ''}`;
+}
+
+// Date 를 서울 현지 시각 기준 분 단위 값으로 변환
+export function toSeoulMinutes(date: Date): number {
+  return Math.floor(date.getTime() / 60000) + KST_OFFSET_MINUTES;
+}
+
+// [start, end] 와 겹치는 구간의 id 목록
+export function findOverlapping(index: IntervalIndexData, start: number, end: number): string[] {
+  const found: string[] = [];
+
+  const collect = (lo: number, hi: number) => {
+    if (lo >= hi) return;
+    const mid = (lo + hi) >> 1;
+    if (index.max_ends[mid] < start) return;
+    collect(lo, mid);
+    if (index.starts[mid] > end) return;
+    if (index.ends[mid] >= start) {
+      found.push(index.ids[mid]);
+    }
+    collect(mid + 1, hi);
+  };
+
+  collect(0, index.starts.length);
+  return found;
+}
+
+class PeriodIndexService {
+  private static instance: PeriodIndexService;
+  private data: PeriodIndexData | null = null;
+
+  public static getInstance(): PeriodIndexService {
+    if (!PeriodIndexService.instance) {
+      PeriodIndexService.instance = new PeriodIndexService();
+    }
+    return PeriodIndexService.instance;
+  }
+
+  private async load(): Promise<PeriodIndexData | null> {
+    if (!this.data) {
+      try {
+        const response = await fetch('/data/courts/period_index.json', { cache: 'no-cache' });
+        if (response.ok) {
+          this.data = await response.json();
+        }
+      } catch (error) {
+        console.error('기간 인덱스 로드 실패:', error);
+      }
+    }
+    return this.data;
+  }
+
+  // 지금 예약 접수 중인 코트 id 목록
+  public async getCourtsOpenForBooking(at: Date = new Date()): Promise<string[]> {
+    const data = await this.load();
+    if (!data) return [];
+    const minutes = toSeoulMinutes(at);
+    return findOverlapping(data.reservation, minutes, minutes);
+  }
+
+  // 기간 안에 이용 가능한 코트 id 목록
+  public async getCourtsUsableBetween(start: Date, end: Date): Promise<string[]> {
+    const data = await this.load();
+    if (!data) return [];
+    return findOverlapping(data.use, toSeoulMinutes(start), toSeoulMinutes(end));
+  }
+}
+
+export const periodIndexService = PeriodIndexService.getInstance();
@@ -21,15 +21,37 @@ export interface TennisFacility {
   courts: TennisCourt[];
 }
 
+// 지역별 샤드 매니페스트 (scraper/publish_static_data.py 가 생성)
+export interface CourtsManifestRegion {
+  region: string;
+  slug: string;
+  file: string;
+  hash: string;
+  count: number;
+  bytes: number;
+}
+
+export interface CourtsManifest {
+  version: string;
+  generated_at: string;
+  total_courts: number;
+  regions: CourtsManifestRegion[];
+}
+
+const COURTS_DATA_BASE = '/data/courts';
+
 class TennisCourtsService {
   private static instance: TennisCourtsService;
   private courts: TennisCourt[] = [];
   private facilities: TennisFacility[] = [];
+  private manifest: CourtsManifest | null = null;
+  private regionCourts = new Map<string, TennisCourt[]>();
+  private ready: Promise<void>;
   private lastSyncTime: Date | null = null;
   private syncInterval: number = 5 * 60 * 1000; // 5분마다 동기화
 
   private constructor() {
-    this.loadCourtsData();
+    this.ready = this.loadCourtsData();
     this.startPeriodicSync();
   }
 
@@ -42,6 +64,19 @@ class TennisCourtsService {
 
   private async loadCourtsData(): Promise<void> {
     try {
+      // 매니페스트가 있으면 지역 샤드는 필요할 때만 로드
+      const manifest = await this.fetchManifest();
+      if (manifest) {
+        const loadedRegions = [...this.regionCourts.keys()];
+        if (this.manifest?.version !== manifest.version) {
+          this.regionCourts.clear();
+        }
+        this.manifest = manifest;
+        // 이미 보던 지역은 새 버전으로 다시 로드
+        await Promise.all(loadedRegions.map(region => this.loadRegionCourts(region)));
+        return;
+      }
+
       // 클라이언트 사이드에서는 로컬 JSON 파일 사용
       const response = await fetch('/data/seoul_tennis_courts.json');
       if (response.ok) {
@@ -61,6 +96,57 @@ class TennisCourtsService {
     }
   }
 
+  private async fetchManifest(): Promise<CourtsManifest | null> {
+    try {
+      const response = await fetch(`${COURTS_DATA_BASE}/manifest.json`, { cache: 'no-cache' });
+      return response.ok ? await response.json() : null;
+    } catch {
+      return null;
+    }
+  }
+
+  // 특정 지역 샤드만 로드 (내용 해시 파일명이라 브라우저 캐시 재사용)
+  public async loadRegionCourts(region: string): Promise<TennisCourt[]> {
+    await this.ready;
+    if (!this.manifest) {
+      return this.getCourtsByRegion(region);
+    }
+
+    const cached = this.regionCourts.get(region);
+    if (cached) {
+      return cached;
+    }
+
+    const entry = this.manifest.regions.find(item => item.region === region);
+    if (!entry) {
+      return [];
+    }
+
+    try {
+      const response = await fetch(`${COURTS_DATA_BASE}/${entry.file}`);
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+      }
+      const courts: TennisCourt[] = await response.json();
+      this.regionCourts.set(region, courts);
+      this.courts = [...this.regionCourts.values()].flat();
+      this.organizeFacilities();
+      return courts;
+    } catch (error) {
+      console.error(`${region} 테니스장 데이터 로드 실패:`, error);
+      return [];
+    }
+  }
+
+  // 모든 지역 샤드 로드
+  public async loadAllCourts(): Promise<TennisCourt[]> {
+    await this.ready;
+    if (this.manifest) {
+      await Promise.all(this.manifest.regions.map(entry => this.loadRegionCourts(entry.region)));
+    }
+    return this.courts;
+  }
+
   // 주기적 동기화 시작
   private startPeriodicSync(): void {
     // 1시간마다 로컬 데이터 새로고침
@@ -164,10 +250,19 @@ class TennisCourtsService {
 
   // 지역 목록 반환
   public getRegions(): string[] {
+    if (this.manifest) {
+      return this.manifest.regions.map(entry => entry.region).sort();
+    }
     const regions = [...new Set(this.courts.map(court => court.region))];
     return regions.sort();
   }
 
+  // 지역 목록 반환 (매니페스트 로드 완료 후)
+  public async loadRegions(): Promise<string[]> {
+    await this.ready;
+    return this.getRegions();
+  }
+
   // 시설 목록 반환
   public getFacilityNames(): string[] {
     const facilities = [...new Set(this.courts.map(court => court.facility_name))];